@@ -0,0 +1,130 @@
+"""Batch runner for numerical_core: reads a JSON or CSV job file, writes results
+
+python numerical_cli.py jobs.json -o results.csv --workers 4
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numerical_core
+
+TASKS = {
+    "integrate": numerical_core.integrate,
+    "integrate_multiple": numerical_core.integrate_multiple,
+    "integrate_table": numerical_core.integrate_table,
+    "integrate_intervals": numerical_core.integrate_intervals,
+    "interpolate": numerical_core.interpolate,
+    "approximate": numerical_core.approximate,
+    "differentiate": numerical_core.differentiate,
+    "solve": numerical_core.solve,
+}
+
+# CSV cells are strings; these columns are converted before the call
+FLOAT_FIELDS = ("a", "b", "eps", "x", "x0", "h")
+INT_FIELDS = ("initial_n", "gauss_order", "workers")
+BOOL_FIELDS = ("predictive",)
+
+
+def parse_csv_job(row):
+    job = {key: value for key, value in row.items() if value not in (None, "")}
+    for key in FLOAT_FIELDS:
+        if key in job:
+            job[key] = float(job[key])
+    for key in INT_FIELDS:
+        if key in job:
+            job[key] = int(job[key])
+    for key in BOOL_FIELDS:
+        if key in job:
+            job[key] = job[key].strip().lower() in ("1", "true", "yes")
+    # Points are written as "x1 y1; x2 y2; ...", limits as "a1 b1; a2 b2; ..."
+    for key in ("points", "limits"):
+        if key in job:
+            job[key] = [tuple(map(float, pair.split())) for pair in job[key].split(";")]
+    # Expressions of a batch are written as "sin(x); cos(x); ..."
+    if "expressions" in job:
+        job["expressions"] = [item.strip() for item in job["expressions"].split(";")]
+    # Spline end slopes are written as "s_a s_b"
+    if "slopes" in job:
+        job["slopes"] = tuple(map(float, job["slopes"].split()))
+    return job
+
+
+def load_jobs(path):
+    with open(path, encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            return [parse_csv_job(row) for row in csv.DictReader(file)]
+        jobs = json.load(file)
+    return jobs["jobs"] if isinstance(jobs, dict) else jobs
+
+
+def run_task(job):
+    """Run one job; a failing job is reported in its result, not raised"""
+    arguments = dict(job)
+    task = arguments.pop("task", None)
+    result = {"id": arguments.pop("id")} if "id" in arguments else {}
+    result["task"] = task
+    try:
+        if task not in TASKS:
+            raise ValueError(f"Неизвестная задача: {task}")
+        result.update(TASKS[task](**arguments))
+        result["status"] = "ok"
+    except Exception as e:
+        result["status"] = "error"
+        result["message"] = str(e)
+    return result
+
+
+def write_results(results, path):
+    if path is None:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            fieldnames = list(dict.fromkeys(key for row in results for key in row))
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(results)
+        else:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Пакетный расчёт задач численных методов без графического интерфейса"
+    )
+    parser.add_argument("jobs", help="файл задач .json или .csv")
+    parser.add_argument(
+        "-o", "--output", help="файл результатов .json или .csv (по умолчанию stdout)"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="число рабочих процессов",
+    )
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+    if args.workers > 1 and len(jobs) > 1:
+        chunksize = max(1, len(jobs) // (4 * args.workers))
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(run_task, jobs, chunksize=chunksize))
+    else:
+        results = [run_task(job) for job in jobs]
+
+    write_results(results, args.output)
+
+    failed = sum(result["status"] != "ok" for result in results)
+    print(f"Задач: {len(results)}, с ошибкой: {failed}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
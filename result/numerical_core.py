@@ -0,0 +1,2663 @@
+"""Numerical methods without a GUI: integration, interpolation, differentiation
+and nonlinear equations. NumericalMethodsApp is a Tk client on top of NumericalCore."""
+
+import os
+import time
+import ast
+import heapq
+import math
+import multiprocessing
+from collections import deque
+from functools import lru_cache, reduce
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import sympy as sp
+
+EXPRESSION_NAMESPACE = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "log": np.log10,
+    "ln": np.log,
+    "log10": np.log10,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "pi": np.pi,
+    "e": np.e,
+}
+
+ALLOWED_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+# Gauss-Kronrod G7-K15 nodes on [-1, 1] (QUADPACK qk15): the non-negative half,
+# ordered from 1 down to 0; the full set is mirrored below
+_KRONROD_NODES = [
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+]
+_KRONROD_WEIGHTS = [
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+]
+_GAUSS_7_WEIGHTS = [
+    0.0,
+    0.129484966168869693270611432679082,
+    0.0,
+    0.279705391489276667901467771423780,
+    0.0,
+    0.381830050505118944950369775488975,
+    0.0,
+    0.417959183673469387755102040816327,
+]
+GAUSS_KRONROD_NODES = np.concatenate(
+    (-np.array(_KRONROD_NODES[:-1]), _KRONROD_NODES[::-1])
+)
+GAUSS_KRONROD_WEIGHTS = np.concatenate((_KRONROD_WEIGHTS[:-1], _KRONROD_WEIGHTS[::-1]))
+GAUSS_7_WEIGHTS = np.concatenate((_GAUSS_7_WEIGHTS[:-1], _GAUSS_7_WEIGHTS[::-1]))
+
+# Maximum number of per-segment lines printed in a detailed trace
+TRACE_LIMIT = 20
+
+
+@lru_cache(maxsize=64)
+def gauss_legendre_nodes(order):
+    """Gauss-Legendre nodes and weights on [-1, 1] by the Golub-Welsch algorithm"""
+    k = np.arange(1, order)
+    beta = k / np.sqrt(4.0 * k**2 - 1)
+    nodes, vectors = np.linalg.eigh(np.diag(beta, -1) + np.diag(beta, 1))
+    weights = 2 * vectors[0] ** 2
+    nodes.setflags(write=False)
+    weights.setflags(write=False)
+    return nodes, weights
+
+
+@lru_cache(maxsize=64)
+def barycentric_weights(nodes):
+    """Barycentric weights 1/Π(x_j - x_k) of a node tuple, computed once per node set"""
+    x = np.array(nodes, dtype=float)
+    if len(np.unique(x)) != len(x):
+        raise ValueError("Узлы интерполяции должны быть различны")
+    # Differences are scaled by 4/(b - a) so that products of many of them do not
+    # overflow; the common factor cancels in the barycentric formula
+    scale = 4 / (x.max() - x.min()) if len(x) > 1 else 1.0
+    difference = (x[:, np.newaxis] - x) * scale
+    np.fill_diagonal(difference, 1.0)
+    weights = 1 / np.prod(difference, axis=1)
+    weights.setflags(write=False)
+    return weights
+
+
+def chebyshev_coefficients(values):
+    """Coefficients c_j of Σ c_j·T_j(t) through values at t_k = cos(πk/N), k = 0..N,
+    from an FFT of the even extension (a DCT-I) in O(N log N)"""
+    N = len(values) - 1
+    if N == 0:
+        return np.array(values, dtype=float)
+    coefficients = np.fft.rfft(np.concatenate((values, values[-2:0:-1]))).real / N
+    coefficients[0] /= 2
+    coefficients[N] /= 2
+    return coefficients
+
+
+def clenshaw(coefficients, t):
+    """Σ c_j·T_j(t) by the Clenshaw recurrence, vectorized over an array of t"""
+    t = np.asarray(t, dtype=float)
+    b1 = np.zeros_like(t)
+    b2 = np.zeros_like(t)
+    for c in coefficients[:0:-1]:
+        b1, b2 = 2 * t * b1 - b2 + c, b1
+    return (t * b1 - b2 + coefficients[0])[()]
+
+
+def thomas_solve(lower, diagonal, upper, rhs):
+    """Solve a tridiagonal system in O(n); lower[0] and upper[-1] are not used"""
+    lower, diagonal, upper, rhs = (
+        np.asarray(array, dtype=float).tolist()
+        for array in (lower, diagonal, upper, rhs)
+    )
+    n = len(diagonal)
+    factors = [0.0] * n
+    partial = [0.0] * n
+    factors[0] = upper[0] / diagonal[0] if n > 1 else 0.0
+    partial[0] = rhs[0] / diagonal[0]
+    for i in range(1, n):
+        denominator = diagonal[i] - lower[i] * factors[i - 1]
+        factors[i] = upper[i] / denominator if i < n - 1 else 0.0
+        partial[i] = (rhs[i] - lower[i] * partial[i - 1]) / denominator
+
+    solution = [0.0] * n
+    solution[-1] = partial[-1]
+    for i in range(n - 2, -1, -1):
+        solution[i] = partial[i] - factors[i] * solution[i + 1]
+    return np.array(solution)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expression, variables=("x",)):
+    """Validate an expression against the whitelist and compile it once into a function"""
+    source = expression.replace("ln(", "log(")
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError:
+        raise ValueError(f"Синтаксическая ошибка в выражении: {expression}")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_EXPRESSION_NODES):
+            raise ValueError(
+                f"Недопустимая конструкция в выражении: {type(node).__name__}"
+            )
+        if isinstance(node, ast.Name):
+            if node.id not in variables and node.id not in EXPRESSION_NAMESPACE:
+                raise ValueError(f"Неизвестное имя в выражении: {node.id}")
+        elif isinstance(node, ast.Call):
+            if (
+                not isinstance(node.func, ast.Name)
+                or not callable(EXPRESSION_NAMESPACE.get(node.func.id))
+                or node.keywords
+            ):
+                raise ValueError("Допустимы только вызовы стандартных функций")
+        elif isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float)):
+                raise ValueError(f"Недопустимая константа в выражении: {node.value!r}")
+
+    code = compile(
+        f"lambda {', '.join(variables)}: ({source.strip()})", "<expression>", "eval"
+    )
+    return eval(code, {"__builtins__": {}, **EXPRESSION_NAMESPACE})
+
+
+# Richardson ratio r of the rules available in batch mode, see richardson_factor()
+BATCH_RULES = {"trapezoidal": 1, "simpson": 2, "newton_cotes": 3}
+
+
+def integrate_batch(
+    expressions,
+    limits,
+    eps=1e-6,
+    method="simpson",
+    initial_n=4,
+    max_iterations=16,
+    block_size=2**20,
+):
+    """Integrate each expression over each row [a, b] of limits: values, errors, n"""
+    if isinstance(expressions, str):
+        expressions = [expressions]
+    if method not in BATCH_RULES:
+        raise ValueError(f"Неизвестный метод интегрирования: {method}")
+    r = BATCH_RULES[method]
+    p = 2 if r == 1 else 4
+
+    limits = np.atleast_2d(np.asarray(limits, dtype=float))
+    a, b = limits[:, 0], limits[:, 1]
+    n0 = initial_n if initial_n % r == 0 else r * (initial_n // r + 1)
+
+    values = np.empty((len(expressions), len(a)))
+    errors = np.full((len(expressions), len(a)), np.inf)
+    counts = np.full((len(expressions), len(a)), n0)
+
+    def row_sums(f, start, step, count, residue):
+        """Per row, the sum of f(start + k·step) over k < count and its part with
+        k ≡ residue (mod r); the grid is evaluated in blocks of at most block_size
+        samples, split by rows and, for long rows, by columns"""
+        total = np.zeros(len(start))
+        part = np.zeros(len(start))
+        columns = max(1, min(count, block_size))
+        rows = max(1, block_size // columns)
+        for i in range(0, len(start), rows):
+            block = slice(i, i + rows)
+            for low in range(0, count, columns):
+                k = np.arange(low, min(low + columns, count))
+                x = start[block, np.newaxis] + step[block, np.newaxis] * k
+                y = np.broadcast_to(f(x), x.shape)
+                total[block] += np.sum(y, axis=1)
+                part[block] += np.sum(y[:, k % r == residue], axis=1)
+        return total, part
+
+    def combine(T, T_coarse):
+        return T if r == 1 else (r**2 * T - T_coarse) / (r**2 - 1)
+
+    # All intervals and expressions share one normalized grid; converged items
+    # drop out of the active set and each doubling evaluates only midpoints
+    for e, expression in enumerate(expressions):
+        f = compile_expression(expression)
+        ends = np.broadcast_to(f(limits), limits.shape)
+        h = (b - a) / n0
+        # Interior node k + 1 of the n0-grid is a node of the coarse r·h grid
+        # when k ≡ r - 1 (mod r)
+        interior, coarse = row_sums(f, a + h, h, n0 - 1, r - 1)
+        T = h * (0.5 * ends[:, 0] + 0.5 * ends[:, 1] + interior)
+        T_coarse = r * h * (0.5 * ends[:, 0] + 0.5 * ends[:, 1] + coarse)
+        I = combine(T, T_coarse)
+        values[e] = I
+
+        active = np.arange(len(a))
+        n = n0
+        for _ in range(max_iterations):
+            h = (b[active] - a[active]) / (2 * n)
+            # Midpoint k sits at a + (2k + 1)·h; those with k ≡ 1 (mod 3) are
+            # nodes of the coarse 3h grid used by Newton-Cotes
+            midpoints, coarse = row_sums(f, a[active] + h, 2 * h, n, 1)
+
+            if r == 2:
+                T_coarse = T
+            elif r == 3:
+                T_coarse = T_coarse / 2 + 3 * h * coarse
+            T = T / 2 + h * midpoints
+            n *= 2
+
+            I_new = combine(T, T_coarse)
+            error = np.abs(I_new - I) / (2**p - 1)
+            values[e, active] = I_new
+            errors[e, active] = error
+            counts[e, active] = n
+
+            keep = error >= eps
+            active, T, T_coarse, I = active[keep], T[keep], T_coarse[keep], I_new[keep]
+            if active.size == 0:
+                break
+
+    return values, errors, counts
+
+
+def convert_table(path, cache, chunk_rows=2**18):
+    """Write the numeric rows of a CSV table to a .npy file, chunk_rows lines at a time"""
+    with open(path, encoding="utf-8") as file:
+        lines = (line for line in file if line.strip())
+        first = next(lines, None)
+        if first is None:
+            raise ValueError(f"Файл пуст: {path}")
+        delimiter = "," if "," in first else ";" if ";" in first else None
+        try:
+            [float(value) for value in first.split(delimiter)[:2]]
+            header = 0
+        except ValueError:
+            header = 1
+        rows = 1 - header + sum(1 for _ in lines)
+
+    if rows == 0:
+        raise ValueError(f"В файле нет числовых строк: {path}")
+    # Written under a temporary name so that an interrupted run leaves no cache
+    temporary = cache + ".tmp"
+    data = np.lib.format.open_memmap(
+        temporary, mode="w+", dtype=np.float64, shape=(rows, 2)
+    )
+    try:
+        try:
+            with open(path, encoding="utf-8") as file:
+                lines = (line for line in file if line.strip())
+                for _ in range(header):
+                    next(lines)
+                for low in range(0, rows, chunk_rows):
+                    chunk = [next(lines) for _ in range(min(chunk_rows, rows - low))]
+                    try:
+                        data[low : low + len(chunk)] = np.loadtxt(
+                            chunk, delimiter=delimiter, usecols=(0, 1), ndmin=2
+                        )
+                    except ValueError as e:
+                        raise ValueError(f"Не удалось прочитать таблицу {path}: {e}")
+            data.flush()
+        finally:
+            # Closes the memory map
+            del data
+    except BaseException:
+        # A failed or interrupted conversion leaves neither a cache nor a temporary file
+        os.remove(temporary)
+        raise
+    os.replace(temporary, cache)
+
+
+def load_table(path):
+    """Columns x, y of a two-column table, memory-mapped from .npy
+
+    A CSV file is converted once into a .npy cache next to it; the cache is rebuilt
+    when the CSV file is newer."""
+    if not os.path.exists(path):
+        raise ValueError(f"Файл не найден: {path}")
+    if not path.endswith(".npy"):
+        cache = path + ".npy"
+        if not os.path.exists(cache) or os.path.getmtime(cache) < os.path.getmtime(
+            path
+        ):
+            convert_table(path, cache)
+        path = cache
+
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2 or data.shape[1] < 2:
+        raise ValueError("Таблица должна содержать два столбца: x и y")
+    return data[:, 0], data[:, 1]
+
+
+# Variables of multiple integrals, in axis order
+CUBATURE_VARIABLES = ("x", "y", "z")
+# One prime base per axis of the Halton sequence
+HALTON_BASES = (2, 3, 5)
+
+
+def halton_points(start, stop, dimension):
+    """Points start..stop-1 of the Halton sequence in [0, 1)^dimension"""
+    # Index 0 is the origin for every base, so the sequence starts at 1
+    index = np.arange(start + 1, stop + 1)
+    points = np.zeros((len(index), dimension))
+    for axis, base in enumerate(HALTON_BASES[:dimension]):
+        digits = index.copy()
+        fraction = 1.0 / base
+        while digits.any():
+            points[:, axis] += fraction * (digits % base)
+            digits //= base
+            fraction /= base
+    return points
+
+
+class JobCancelled(Exception):
+    """Raised inside a background job once the user has cancelled it"""
+
+
+class IncrementalNewtonInterpolant:
+    """Newton interpolant over nodes that arrive one at a time
+
+    The last row of the divided-difference table, f[x_(n-k), ..., x_n] for
+    k = 0..n, is kept: it is the Newton form over the nodes from newest to oldest.
+    With window set, the oldest node is dropped once there are more than window."""
+
+    def __init__(self, x_star=None, window=None):
+        self.x_star = x_star
+        self.window = window
+        self.nodes = deque()
+        self.diagonal = []
+        # Interpolant at x* and the product Π(x* - x_i) over the current nodes
+        self.value = 0.0
+        self.product = 1.0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def append(self, x, y):
+        """Add a node in O(n); the value at x* is updated in O(1)"""
+        x = float(x)
+        if x in self.nodes:
+            raise ValueError("Узлы интерполяции должны быть различны")
+
+        diagonal = [float(y)]
+        for previous, node in zip(self.diagonal, reversed(self.nodes)):
+            diagonal.append((diagonal[-1] - previous) / (x - node))
+        self.diagonal = diagonal
+        self.nodes.append(x)
+
+        if self.x_star is not None:
+            # The new term is f[x_0, ..., x_n] · Π(x* - x_i) over the previous nodes
+            self.value += diagonal[-1] * self.product
+            self.product *= self.x_star - x
+
+        if self.window is not None and len(self.nodes) > self.window:
+            self.drop_oldest()
+
+    def drop_oldest(self):
+        """Forget the oldest node in O(n)"""
+        if not self.nodes:
+            raise ValueError("Нет узлов интерполяции")
+
+        # The highest term of the newest-first form is the only one involving x_0
+        self.diagonal.pop()
+        self.nodes.popleft()
+        if self.x_star is not None:
+            # Subtracting the dropped term would accumulate cancellation error over
+            # a long stream; the drop is O(n) anyway, so the value is recomputed
+            self.product = math.prod(self.x_star - node for node in self.nodes)
+            self.value = float(self(self.x_star)) if self.nodes else 0.0
+
+    def __call__(self, x):
+        """Interpolant at x (a number or an array) by nested multiplication"""
+        if not self.nodes:
+            raise ValueError("Нет узлов интерполяции")
+        x = np.asarray(x, dtype=float)
+        newest_first = list(reversed(self.nodes))
+        result = np.full(x.shape, self.diagonal[-1])
+        for k in range(len(self.diagonal) - 2, -1, -1):
+            result = result * (x - newest_first[k]) + self.diagonal[k]
+        return result[()]
+
+
+def integrate_in_worker(expression, rule, a, b, eps, initial_n, predictive=False):
+    """Run NumericalCore.integrate for one rule inside a worker process"""
+    # Compiled lambdas do not pickle, so the worker compiles (and caches) its own copy
+    core = NumericalCore(function=expression)
+    start_time = time.time()
+    result = core.integrate(
+        getattr(core, rule), a, b, eps, initial_n, predictive=predictive
+    )
+    return result, time.time() - start_time
+
+
+# Count, means of F and G, and centered sums of F², G² and F·G of Monte Carlo samples
+EMPTY_MOMENTS = (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def sample_moments(F, G):
+    """Moments of paired samples F, G in the layout of EMPTY_MOMENTS"""
+    mean_f, mean_g = np.mean(F), np.mean(G)
+    return (
+        len(F),
+        mean_f,
+        mean_g,
+        np.sum((F - mean_f) ** 2),
+        np.sum((G - mean_g) ** 2),
+        np.sum((F - mean_f) * (G - mean_g)),
+    )
+
+
+def merge_moments(first, second):
+    """Moments of two sample sets combined (Chan's pairwise update)"""
+    n_a, f_a, g_a, ff_a, gg_a, fg_a = first
+    n_b, f_b, g_b, ff_b, gg_b, fg_b = second
+    n = n_a + n_b
+    if n == 0:
+        return EMPTY_MOMENTS
+    delta_f, delta_g = f_b - f_a, g_b - g_a
+    weight = n_a * n_b / n
+    return (
+        n,
+        f_a + delta_f * n_b / n,
+        g_a + delta_g * n_b / n,
+        ff_a + ff_b + delta_f**2 * weight,
+        gg_a + gg_b + delta_g**2 * weight,
+        fg_a + fg_b + delta_f * delta_g * weight,
+    )
+
+
+def cubature_in_worker(expression, part, *args):
+    """Run one slice of a NumericalCore cubature sum inside a worker process"""
+    core = NumericalCore(multiple_function=expression)
+    return getattr(core, part)(*args)
+
+
+class NumericalCore:
+    gauss_order = 5
+    # Grids with more nodes than this are evaluated in chunks of this size
+    chunk_size = 2**16
+    process_pool = None
+    process_pool_size = 0
+    # Cancellation flag and progress text of a job run by the GUI
+    job_cancel = None
+    job_progress = None
+
+    def __init__(self, **expressions):
+        # Expressions in x read by f ("function"), f_diff ("diff_function"),
+        # f_eq ("equation") and f_interp ("interp_function"); f_multi reads
+        # "multiple_function" in x, y, z
+        self.expressions = dict(expressions)
+
+    def get_process_pool(self, workers):
+        """At least workers worker processes for running methods or slices side by side
+
+        Workers are started with spawn: the GUI and the service call this from
+        threads, and forking a multithreaded process may deadlock the child."""
+        workers = max(1, workers)
+        if self.process_pool is None or self.process_pool_size < workers:
+            self.shutdown_process_pool()
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self.process_pool_size = workers
+        return self.process_pool
+
+    def shutdown_process_pool(self, wait=True, terminate=False):
+        """Stop the worker processes, dropping calls that have not started; with
+        terminate, calls already running are killed too and the pool is not reused"""
+        if self.process_pool is not None:
+            # ProcessPoolExecutor cannot stop a running call before Python 3.14,
+            # so its processes are terminated directly
+            processes = list((self.process_pool._processes or {}).values())
+            self.process_pool.shutdown(wait=wait, cancel_futures=True)
+            if terminate:
+                for process in processes:
+                    process.terminate()
+            self.process_pool = None
+            self.process_pool_size = 0
+
+    def check_job(self, progress=None):
+        """Publish job progress and stop the job if it has been cancelled"""
+        if self.job_cancel is None:
+            return
+        if self.job_cancel.is_set():
+            raise JobCancelled()
+        if progress is not None:
+            self.job_progress = progress
+
+    def f(self, x):
+        return compile_expression(self.expressions["function"])(x)
+
+    def f_diff(self, x):
+        """Evaluate the function for differentiation"""
+        return compile_expression(self.expressions["diff_function"])(x)
+
+    def f_eq(self, x):
+        """Evaluate the function for equation solving"""
+        return compile_expression(self.expressions["equation"])(x)
+
+    def f_interp(self, x):
+        """Evaluate the function approximated by a Chebyshev series"""
+        return compile_expression(self.expressions["interp_function"])(x)
+
+    def f_multi(self, *coordinates):
+        """Evaluate the integrand of a double or triple integral"""
+        variables = CUBATURE_VARIABLES[: len(coordinates)]
+        return compile_expression(self.expressions["multiple_function"], variables)(
+            *coordinates
+        )
+
+    def df_eq(self, x):
+        """Calculate the derivative of the equation function using central difference"""
+        h = 1e-6
+        return (self.f_eq(x + h) - self.f_eq(x - h)) / (2 * h)
+
+    def sample_sums(self, start, step, count, modulus=1):
+        """Sums of f(start + i*step), i < count, grouped by i % modulus, chunk by chunk"""
+        chunk = max(modulus, self.chunk_size - self.chunk_size % modulus)
+        partial = [[] for _ in range(modulus)]
+        for low in range(0, count, chunk):
+            y = self.f(start + step * np.arange(low, min(low + chunk, count)))
+            y = np.broadcast_to(y, (min(chunk, count - low),))
+            for residue in range(modulus):
+                partial[residue].append(np.sum(y[residue::modulus]))
+        # Pairwise sums inside a chunk, exactly rounded sum across chunks
+        return [math.fsum(values) for values in partial]
+
+    def grid_sums(self, a, b, n, keep_samples=False):
+        """f(a), f(b) and interior sums of f by node index mod 6 on the uniform n-grid"""
+        if keep_samples:
+            x = np.linspace(a, b, n + 1)
+            y = np.broadcast_to(self.f(x), x.shape)
+            residues = [np.sum(y[(residue or 6) : -1 : 6]) for residue in range(6)]
+            return (y[0], y[-1], residues), x, y
+
+        h = (b - a) / n
+        f_a, f_b = np.broadcast_to(self.f(np.array([a, b])), 2)
+        sums = self.sample_sums(a + h, h, n - 1, 6)
+        # Sample k is node k + 1
+        return (f_a, f_b, [sums[(residue - 1) % 6] for residue in range(6)]), None, None
+
+    def rule_from_sums(self, method, a, b, n, sums):
+        """Value of an equispaced rule from the grid sums returned by grid_sums()"""
+        f_a, f_b, residues = sums
+        h = (b - a) / n
+        odd = residues[1] + residues[3] + residues[5]
+        even = residues[0] + residues[2] + residues[4]
+        if method == self.simpson_rule:
+            return h / 3 * (f_a + f_b + 4 * odd + 2 * even)
+        if method == self.newton_cotes:
+            thirds = residues[0] + residues[3]
+            return 3 * h / 8 * (f_a + f_b + 3 * (odd + even - thirds) + 2 * thirds)
+        return h * (0.5 * f_a + 0.5 * f_b + odd + even)
+
+    def trapezoidal_rule(self, a, b, n):
+        if n + 1 > self.chunk_size:
+            # Streamed: samples are not materialized
+            sums, _, _ = self.grid_sums(a, b, n)
+            return self.rule_from_sums(self.trapezoidal_rule, a, b, n, sums), None, None
+
+        h = (b - a) / n
+        x = np.linspace(a, b, n + 1)
+        y = np.broadcast_to(self.f(x), x.shape)
+        return h * (0.5 * y[0] + 0.5 * y[-1] + np.sum(y[1:-1])), x, y
+
+    def simpson_rule(self, a, b, n):
+        if n % 2 != 0:
+            n += 1
+        if n + 1 > self.chunk_size:
+            sums, _, _ = self.grid_sums(a, b, n)
+            return self.rule_from_sums(self.simpson_rule, a, b, n, sums), None, None
+
+        h = (b - a) / n
+        x = np.linspace(a, b, n + 1)
+        y = np.broadcast_to(self.f(x), x.shape)
+        return (
+            h / 3 * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2])),
+            x,
+            y,
+        )
+
+    def newton_cotes(self, a, b, n):
+        if n % 3 != 0:
+            n = 3 * (n // 3 + 1)
+        if n + 1 > self.chunk_size:
+            sums, _, _ = self.grid_sums(a, b, n)
+            return self.rule_from_sums(self.newton_cotes, a, b, n, sums), None, None
+
+        h = (b - a) / n
+        x = np.linspace(a, b, n + 1)
+        y = np.broadcast_to(self.f(x), x.shape)
+
+        result = (
+            3
+            * h
+            / 8
+            * (
+                y[0]
+                + y[-1]
+                + 3 * np.sum(y[1:-1:3])
+                + 3 * np.sum(y[2:-1:3])
+                + 2 * np.sum(y[3:-1:3])
+            )
+        )
+
+        return result, x, y
+
+    def gauss_legendre_rule(self, a, b, n, order=None):
+        """Composite Gauss-Legendre rule: n equal panels with order nodes each"""
+        nodes, weights = gauss_legendre_nodes(order or self.gauss_order)
+        half = (b - a) / (2 * n)
+        if n * len(nodes) > self.chunk_size:
+            panels = max(1, self.chunk_size // len(nodes))
+            partial = []
+            for low in range(0, n, panels):
+                centers = a + half * np.arange(2 * low + 1, 2 * min(low + panels, n), 2)
+                x = (centers[:, np.newaxis] + half * nodes).ravel()
+                y = np.broadcast_to(self.f(x), x.shape)
+                partial.append(np.sum(y.reshape(len(centers), -1) @ weights))
+            return half * math.fsum(partial), None, None
+
+        centers = a + half * np.arange(1, 2 * n, 2)
+        x = (centers[:, np.newaxis] + half * nodes).ravel()
+        y = np.broadcast_to(self.f(x), x.shape)
+        return half * np.sum(y.reshape(n, -1) @ weights), x, y
+
+    def table_rule(self, method, x, y):
+        """Rule over consecutive intervals of tabulated x, y with any spacing;
+        Simpson takes the intervals in pairs and leaves an odd last one out"""
+        h = np.diff(x)
+        if method == self.trapezoidal_rule:
+            return np.sum(h * (y[:-1] + y[1:])) / 2
+
+        h0, h1 = h[0:-1:2], h[1::2]
+        return np.sum(
+            (h0 + h1)
+            / 6
+            * (
+                (2 - h1 / h0) * y[0:-2:2]
+                + (h0 + h1) ** 2 / (h0 * h1) * y[1:-1:2]
+                + (2 - h0 / h1) * y[2::2]
+            )
+        )
+
+    def simpson_tail(self, x, y):
+        """Last interval [x1, x2] from the parabola through three points x0 < x1 < x2"""
+        h0, h1 = x[1] - x[0], x[2] - x[1]
+        return (
+            (2 * h1**2 + 3 * h0 * h1) / (6 * (h0 + h1)) * y[2]
+            + (h1**2 + 3 * h0 * h1) / (6 * h0) * y[1]
+            - h1**3 / (6 * h0 * (h0 + h1)) * y[0]
+        )
+
+    def integrate_table(self, method, x, y):
+        """Trapezoid or Simpson rule over a table too large for memory
+
+        x, y are read in chunks of chunk_size points. A uniform table goes through
+        rule_from_sums() like an analytic grid; otherwise the rule for uneven
+        spacing is used. The error is Runge's estimate against every second point."""
+        n = len(x) - 1
+        simpson = method == self.simpson_rule
+        if n < (2 if simpson else 1):
+            raise ValueError("Недостаточно точек в таблице")
+        a, b = float(x[0]), float(x[-1])
+        h = (b - a) / n
+
+        # A multiple of 4 keeps the Simpson pairs of both grids aligned across chunks
+        block = max(4, self.chunk_size - self.chunk_size % 4)
+        fine, coarse = [], []
+        residues = np.zeros(6)
+        uniform = True
+        for low in range(0, n, block):
+            self.check_job(f"Табличные данные: {low} из {n + 1} точек")
+            high = min(low + block, n)
+            xs = np.asarray(x[low : high + 1], dtype=float)
+            ys = np.asarray(y[low : high + 1], dtype=float)
+            steps = np.diff(xs)
+            if np.any(steps <= 0):
+                raise ValueError("Значения x в таблице должны строго возрастать")
+            uniform = uniform and bool(np.all(np.abs(steps - h) <= 1e-6 * h))
+
+            # Interior nodes of this chunk, by node index mod 6 as in grid_sums()
+            inner = slice(1 if low == 0 else 0, len(ys) - 1)
+            index = np.arange(low, high + 1)[inner] % 6
+            residues += np.bincount(index, weights=ys[inner], minlength=6)
+
+            fine.append(self.table_rule(method, xs, ys))
+            # Every second node; an odd last node is kept so both grids end at b
+            xs_coarse, ys_coarse = xs[::2], ys[::2]
+            if (high - low) % 2:
+                xs_coarse = np.append(xs_coarse, xs[-1])
+                ys_coarse = np.append(ys_coarse, ys[-1])
+            if len(xs_coarse) > 1:
+                coarse.append(self.table_rule(method, xs_coarse, ys_coarse))
+
+        I = math.fsum(fine)
+        I_coarse = math.fsum(coarse)
+        if simpson:
+            if n % 2:
+                I += self.simpson_tail(x[n - 2 :], y[n - 2 :])
+            last = [n - 3, n - 1, n] if n % 2 else [n - 4, n - 2, n]
+            coarse_intervals = (n + 1) // 2
+            if coarse_intervals % 2 and coarse_intervals > 1:
+                I_coarse += self.simpson_tail(x[last], y[last])
+
+        if uniform and (not simpson or n % 2 == 0):
+            I = self.rule_from_sums(
+                method, a, b, n, (float(y[0]), float(y[-1]), list(residues))
+            )
+
+        if simpson and n < 3:
+            error = None
+        else:
+            error = self.runge_principle(I_coarse, I, self.rule_order(method))
+        return I, n + 1, error, {"a": a, "b": b, "uniform": uniform}
+
+    def compute_table_integration(self, methods, path):
+        """Integrate a tabulated file with the selected rules; executed as a background job"""
+        x, y = load_table(path)
+        outcomes = []
+        for method_name, method in methods:
+            if method not in (self.trapezoidal_rule, self.simpson_rule):
+                raise ValueError(
+                    f"{method_name} недоступен для табличных данных, "
+                    "выберите метод трапеций или Симпсона"
+                )
+            self.check_job(f"Выполняются вычисления: {method_name}")
+            start_time = time.time()
+            outcome = self.integrate_table(method, x, y)
+            outcomes.append((outcome, time.time() - start_time))
+        return outcomes
+
+    def rule_order(self, method):
+        """Order p of the rule's error O(h^p) used by the Runge principle"""
+        if method in (self.simpson_rule, self.newton_cotes):
+            return 4
+        if method == self.gauss_legendre_rule:
+            return 2 * self.gauss_order
+        return 2
+
+    def runge_principle(self, I1, I2, p, ratio=2):
+        """Error of I2 on a grid ratio times finer than that of I1"""
+        return abs(I2 - I1) / (ratio**p - 1)
+
+    def richardson_factor(self, method):
+        """Ratio r such that the rule equals (r²·T(n) - T(n/r)) / (r² - 1)"""
+        if method == self.trapezoidal_rule:
+            return 1
+        if method == self.simpson_rule:
+            return 2
+        if method == self.newton_cotes:
+            return 3
+        return None
+
+    def refine_trapezoid(self, a, b, n, T_n, keep_samples=False):
+        """Trapezoid sum on 2n segments from T(n): f is evaluated only at the new midpoints"""
+        h = (b - a) / (2 * n)
+        if keep_samples:
+            x_mid = a + h * np.arange(1, 2 * n, 2)
+            y_mid = np.broadcast_to(self.f(x_mid), x_mid.shape)
+            mid_sums = [np.sum(y_mid[residue::3]) for residue in range(3)]
+        else:
+            x_mid = y_mid = None
+            mid_sums = self.sample_sums(a + h, 2 * h, n, 3)
+        return T_n / 2 + h * math.fsum(mid_sums), mid_sums, x_mid, y_mid
+
+    def step_record(self, n, I, error, f_a, f_b, sum_odd, sum_even, x=None, y=None):
+        """Compact record of one refinement step; the samples are kept only if given"""
+        step = {
+            "n": n,
+            "I": I,
+            "error": error,
+            "f_a": f_a,
+            "f_b": f_b,
+            "sum_odd": sum_odd,
+            "sum_even": sum_even,
+            "sum_inner": None if sum_odd is None else sum_odd + sum_even,
+        }
+        if y is not None:
+            step["x"] = x
+            step["y"] = y
+        return step
+
+    def integrate(
+        self,
+        method,
+        a,
+        b,
+        eps,
+        initial_n,
+        nested=True,
+        keep_samples=False,
+        predictive=False,
+    ):
+        if predictive:
+            return self.integrate_predictive(method, a, b, eps, initial_n)
+        if nested and self.richardson_factor(method) is not None:
+            return self.integrate_nested(method, a, b, eps, initial_n, keep_samples)
+
+        r = self.richardson_factor(method)
+
+        def evaluate(n, error=None):
+            if r is None:
+                # Gauss nodes carry no meaningful endpoint or partial sums
+                I, x, y = method(a, b, n)
+                if not keep_samples:
+                    x = y = None
+                return I, self.step_record(n, I, error, None, None, None, None, x, y)
+
+            sums, x, y = self.grid_sums(a, b, n, keep_samples)
+            I = self.rule_from_sums(method, a, b, n, sums)
+            f_a, f_b, residues = sums
+            sum_odd = residues[1] + residues[3] + residues[5]
+            sum_even = residues[0] + residues[2] + residues[4]
+            return I, self.step_record(n, I, error, f_a, f_b, sum_odd, sum_even, x, y)
+
+        n = initial_n
+        if r is not None and n % r != 0:
+            n = r * (n // r + 1)
+        I1, step = evaluate(n)
+        iterations = 1
+
+        steps = []
+        steps.append(step)
+
+        while True:
+            self.check_job()
+            n *= 2
+            I2, step = evaluate(n)
+
+            p = self.rule_order(method)
+            error = self.runge_principle(I1, I2, p)
+            step["error"] = error
+
+            steps.append(step)
+
+            if error < eps or iterations > 15:
+                return I2, n, error, steps
+
+            I1 = I2
+            iterations += 1
+
+    def integrate_nested(self, method, a, b, eps, initial_n, keep_samples=False):
+        """Runge-controlled integration on nested grids built from trapezoid sums"""
+        r = self.richardson_factor(method)
+        n = initial_n
+        if n % r != 0:
+            n = r * (n // r + 1)
+
+        h = (b - a) / n
+        (f_a, f_b, residues), x, y = self.grid_sums(a, b, n, keep_samples)
+        sum_odd = residues[1] + residues[3] + residues[5]
+        sum_even = residues[0] + residues[2] + residues[4]
+        T = h * (0.5 * f_a + 0.5 * f_b + sum_odd + sum_even)
+        # Interior nodes of the n/r grid are the nodes with index divisible by r
+        if r == 2:
+            T_coarse = 2 * h * (0.5 * f_a + 0.5 * f_b + sum_even)
+        elif r == 3:
+            T_coarse = 3 * h * (0.5 * f_a + 0.5 * f_b + residues[0] + residues[3])
+        else:
+            T_coarse = T
+
+        def combine(T_fine, T_coarse):
+            if r == 1:
+                return T_fine
+            return (r**2 * T_fine - T_coarse) / (r**2 - 1)
+
+        p = 2 if r == 1 else 4
+        I1 = combine(T, T_coarse)
+        iterations = 1
+
+        steps = []
+        steps.append(self.step_record(n, I1, None, f_a, f_b, sum_odd, sum_even, x, y))
+
+        while True:
+            self.check_job()
+            T_new, mid_sums, x_mid, y_mid = self.refine_trapezoid(
+                a, b, n, T, keep_samples
+            )
+            if r == 2:
+                T_coarse = T
+            elif r == 3:
+                # Midpoints of the n/3 grid are every third new midpoint of the n grid
+                T_coarse = T_coarse / 2 + 3 * (b - a) / (2 * n) * mid_sums[1]
+            T = T_new
+            n *= 2
+
+            # Old nodes become the even nodes of the refined grid, midpoints the odd
+            sum_even, sum_odd = sum_odd + sum_even, math.fsum(mid_sums)
+
+            if keep_samples:
+                x_new = np.empty(n + 1)
+                y_new = np.empty(n + 1)
+                x_new[::2], x_new[1::2] = x, x_mid
+                y_new[::2], y_new[1::2] = y, y_mid
+                x, y = x_new, y_new
+
+            I2 = combine(T, T_coarse)
+            error = self.runge_principle(I1, I2, p)
+
+            steps.append(
+                self.step_record(n, I2, error, f_a, f_b, sum_odd, sum_even, x, y)
+            )
+
+            if error < eps or iterations > 15:
+                return I2, n, error, steps
+
+            I1 = I2
+            iterations += 1
+
+    def refine_grid(self, a, b, n, m, residues):
+        """Interior sums by node index mod 6 on the n·m grid from those on the n grid:
+        node j becomes node j·m, and f is evaluated only at the new nodes"""
+        h = (b - a) / (n * m)
+        refined = [0.0] * 6
+        for residue in range(6):
+            refined[residue * m % 6] += residues[residue]
+        # New nodes j + m·i, i < n, for each offset 0 < j < m
+        for j in range(1, m):
+            sums = self.sample_sums(a + j * h, m * h, n, 6)
+            for i, value in enumerate(sums):
+                refined[(j + m * i) % 6] += value
+        return refined
+
+    def integrate_predictive(self, method, a, b, eps, initial_n, safety=1.25):
+        """Jump to the n predicted by the Runge error model instead of doubling blindly
+
+        n is doubled until three successive values converge at the rule's order p,
+        i.e. their differences shrink by about 2^p; before that the model
+        error ≈ C·h^p does not hold. Then n jumps to the multiple m·n the model
+        predicts, so every sample taken so far is reused, and the Runge pair is
+        (n, m·n) with the error |ΔI|/(m^p - 1). Gauss panels do not nest and are
+        evaluated afresh."""
+        p = self.rule_order(method)
+        r = self.richardson_factor(method)
+        n = initial_n
+        if r is not None and n % r != 0:
+            n = r * (n // r + 1)
+        max_n = n * 2**16
+
+        def level(n, sums):
+            if r is None:
+                I = method(a, b, n)[0]
+                return I, self.step_record(n, I, None, None, None, None, None)
+            f_a, f_b, residues = sums
+            I = self.rule_from_sums(method, a, b, n, sums)
+            sum_odd = residues[1] + residues[3] + residues[5]
+            sum_even = residues[0] + residues[2] + residues[4]
+            return I, self.step_record(n, I, None, f_a, f_b, sum_odd, sum_even)
+
+        def refine(n, m, sums):
+            if r is None:
+                return None
+            f_a, f_b, residues = sums
+            return f_a, f_b, self.refine_grid(a, b, n, m, residues)
+
+        sums = None if r is None else self.grid_sums(a, b, n)[0]
+        I, step = level(n, sums)
+        steps = [step]
+        # Values of the current chain of doublings
+        chain = [I]
+        error = float("inf")
+
+        while error >= eps and n < max_n:
+            self.check_job()
+            m = 2
+            if len(chain) >= 3 and chain[-1] != chain[-2]:
+                ratio = abs((chain[-2] - chain[-3]) / (chain[-1] - chain[-2]))
+                if 2 ** (p - 0.25) <= ratio <= 2 ** (p + 0.25):
+                    # error ≈ C·h^p, so eps is reached at n·(error/eps)^(1/p);
+                    # doubling would stop at the next power of two above that
+                    growth = (error / eps) ** (1 / p)
+                    doubling = 2 ** math.ceil(math.log2(growth))
+                    m = max(2, min(math.ceil(safety * growth), doubling, max_n // n))
+
+            sums = refine(n, m, sums)
+            n *= m
+            I2, step = level(n, sums)
+            error = self.runge_principle(I, I2, p, m)
+            step["error"] = error
+            steps.append(step)
+            # Only a chain of doublings shows whether the model holds
+            chain = chain + [I2] if m == 2 else [I2]
+            I = I2
+
+        return I, n, error, steps
+
+    def romberg_method(self, a, b, eps, initial_n, max_levels=20):
+        """Romberg integration: Richardson table built from nested trapezoid sums"""
+        n = initial_n
+        h = (b - a) / n
+        x = np.linspace(a, b, n + 1)
+        y = np.broadcast_to(self.f(x), x.shape)
+        T = h * (0.5 * y[0] + 0.5 * y[-1] + np.sum(y[1:-1]))
+
+        table = [[T]]
+        error = float("inf")
+
+        for k in range(1, max_levels):
+            self.check_job()
+            T, _, _, _ = self.refine_trapezoid(a, b, n, T)
+            n *= 2
+
+            row = [T]
+            for j in range(1, k + 1):
+                row.append(row[j - 1] + (row[j - 1] - table[k - 1][j - 1]) / (4**j - 1))
+            table.append(row)
+
+            error = abs(row[-1] - table[k - 1][-1])
+            if error < eps:
+                break
+
+        return table[-1][-1], n, error, table
+
+    def gauss_kronrod_panel(self, a, b, samples=None):
+        """G7-K15 on [a, b]: Kronrod value and |K15 - G7| as the local error"""
+        c = (a + b) / 2
+        r = (b - a) / 2
+        y = np.broadcast_to(self.f(c + r * GAUSS_KRONROD_NODES), 15)
+        kronrod = r * np.dot(GAUSS_KRONROD_WEIGHTS, y)
+        gauss = r * np.dot(GAUSS_7_WEIGHTS, y)
+        return kronrod, abs(kronrod - gauss), None, len(GAUSS_KRONROD_NODES)
+
+    def simpson_panel(self, a, b, samples=None):
+        """Simpson on 2 and 4 segments of [a, b], reusing f(a), f(mid), f(b) of the parent"""
+        h = (b - a) / 4
+        if samples is None:
+            y = np.broadcast_to(self.f(np.linspace(a, b, 5)), 5)
+            evaluations = 5
+        else:
+            y_quarters = np.broadcast_to(self.f(np.array([a + h, b - h])), 2)
+            y = np.array(
+                [samples[0], y_quarters[0], samples[1], y_quarters[1], samples[2]]
+            )
+            evaluations = 2
+
+        coarse = 2 * h / 3 * (y[0] + 4 * y[2] + y[4])
+        fine = h / 3 * (y[0] + 4 * y[1] + 2 * y[2] + 4 * y[3] + y[4])
+        return fine + (fine - coarse) / 15, abs(fine - coarse) / 15, y, evaluations
+
+    def adaptive_quadrature(self, panel, a, b, eps, max_intervals=2000):
+        """Globally adaptive integration: always bisect the subinterval with the largest error"""
+        value, error, samples, evaluations = panel(a, b)
+        heap = [(-error, a, b, value, error, samples)]
+        total_error = error
+
+        while total_error > eps and len(heap) < max_intervals:
+            self.check_job()
+            _, left, right, value, error, samples = heapq.heappop(heap)
+            mid = (left + right) / 2
+            if not left < mid < right:
+                heapq.heappush(heap, (-error, left, right, value, error, samples))
+                break
+
+            if samples is None:
+                halves = (None, None)
+            else:
+                halves = (samples[0:3], samples[2:5])
+
+            for (sub_a, sub_b), sub_samples in zip(((left, mid), (mid, right)), halves):
+                sub_value, sub_error, sub_y, sub_evaluations = panel(
+                    sub_a, sub_b, sub_samples
+                )
+                heapq.heappush(
+                    heap, (-sub_error, sub_a, sub_b, sub_value, sub_error, sub_y)
+                )
+                evaluations += sub_evaluations
+
+            # Summed afresh: a running total updated by += and -= cannot fall
+            # below the rounding error of the first, largest estimates
+            total_error = math.fsum(item[4] for item in heap)
+
+        partition = sorted((item[1], item[2], item[3], item[4]) for item in heap)
+        total_value = math.fsum(item[2] for item in partition)
+        total_error = math.fsum(item[3] for item in partition)
+        return total_value, evaluations, total_error, partition
+
+    def tanh_sinh_method(self, a, b, eps, max_levels=12, t_max=None):
+        """Tanh-sinh (double exponential) quadrature; a and b are never evaluated
+
+        The error is the change between levels plus a truncation bound for the
+        tail past t_max and the nodes dropped at the endpoints: the terms w·f decay
+        double exponentially in t, so each tail is below |w·f| at the outermost
+        node kept on its side times the unit step in t."""
+        d = (b - a) / 2
+        if t_max is None:
+            # Past t_max the distance to an endpoint, 2d·exp(-π·sinh t), underflows
+            t_max = math.asinh(
+                (math.log(2 * d) - math.log(np.nextafter(0.0, 1.0))) / np.pi
+            )
+
+        # Terms at the outermost nodes kept on the left and on the right, as (|t|, term)
+        edges = [(-1.0, 0.0), (-1.0, 0.0)]
+
+        def level_sum(t):
+            u = np.pi / 2 * np.sinh(t)
+            # Distance to the nearer endpoint and the weight d·π/2·cosh t / cosh² u,
+            # both through exp(-2|u|), which underflows instead of overflowing
+            e = np.exp(-2 * np.abs(u))
+            delta = 2 * d * e / (1 + e)
+            x = np.where(u < 0, a + delta, b - delta)
+            w = d * np.pi / 2 * np.cosh(t) * 4 * e / (1 + e) ** 2
+            # Nodes that round onto an endpoint are dropped
+            inside = (x > a) & (x < b)
+            with np.errstate(over="ignore", divide="ignore"):
+                y = np.broadcast_to(self.f(x[inside]), x[inside].shape)
+            # So are nodes where an integrable singularity overflows f
+            finite = ~np.isinf(y)
+            t, terms = t[inside][finite], w[inside][finite] * y[finite]
+            for side, mask in enumerate((t < 0, t > 0)):
+                if np.any(mask):
+                    k = np.argmax(np.abs(np.where(mask, t, 0.0)))
+                    edges[side] = max(edges[side], (abs(t[k]), abs(terms[k])))
+            return math.fsum(terms), int(np.count_nonzero(inside))
+
+        h = 1.0
+        t = np.arange(0.0, t_max, h)
+        total, evaluations = level_sum(np.concatenate((-t[:0:-1], t)))
+        I = h * total
+        error = float("inf")
+        levels = [(h, evaluations, I, None)]
+
+        for _ in range(1, max_levels):
+            self.check_job()
+            # Halving h adds only the odd multiples of the new step
+            h /= 2
+            t = np.arange(h, t_max, 2 * h)
+            new_total, new_evaluations = level_sum(np.concatenate((-t[::-1], t)))
+            total += new_total
+            evaluations += new_evaluations
+
+            I_new = h * total
+            truncation = edges[0][1] + edges[1][1]
+            error = abs(I_new - I) + truncation
+            I = I_new
+            levels.append((h, evaluations, I, error))
+            if error < eps:
+                break
+
+        return I, evaluations, error, levels
+
+    def clenshaw_curtis_method(self, a, b, eps, initial_n=4, max_levels=16):
+        """Clenshaw-Curtis quadrature on nested Chebyshev points, weights via FFT"""
+        c, d = (a + b) / 2, (b - a) / 2
+
+        def evaluate(k, N):
+            x = c + d * np.cos(np.pi * k / N)
+            return np.broadcast_to(self.f(x), x.shape)
+
+        def quadrature(y):
+            coefficients = chebyshev_coefficients(y)
+            N = len(y) - 1
+            # ∫ T_j over [-1, 1] is 2/(1 - j²) for even j and zero for odd j
+            j = np.arange(0, N + 1, 2)
+            return d * math.fsum(coefficients[j] * 2 / (1 - j**2))
+
+        N = initial_n
+        y = evaluate(np.arange(N + 1), N)
+        I = quadrature(y)
+        error = float("inf")
+        levels = [(N, N + 1, I, None)]
+
+        for _ in range(1, max_levels):
+            self.check_job()
+            # Points of the N grid are the even points of the 2N grid
+            y_new = np.empty(2 * N + 1)
+            y_new[::2] = y
+            y_new[1::2] = evaluate(np.arange(1, 2 * N, 2), 2 * N)
+            y = y_new
+            N *= 2
+
+            I_new = quadrature(y)
+            error = abs(I_new - I)
+            I = I_new
+            levels.append((N, N + 1, I, error))
+            if error < eps:
+                break
+
+        return I, N + 1, error, levels
+
+    def integration_methods(self, selected_method):
+        """(name, method) pairs for a method key of the integration tab"""
+        methods = []
+        if selected_method == "all" or selected_method == "trapezoidal":
+            methods.append(("Метод трапеций", self.trapezoidal_rule))
+        if selected_method == "all" or selected_method == "simpson":
+            methods.append(("Метод Симпсона", self.simpson_rule))
+        if selected_method == "all" or selected_method == "newton_cotes":
+            methods.append(("Метод Ньютона-Котеса", self.newton_cotes))
+        if selected_method == "romberg":
+            methods.append(("Метод Ромберга", self.romberg_method))
+        if selected_method == "gauss":
+            methods.append(("Метод Гаусса-Лежандра", self.gauss_legendre_rule))
+        if selected_method == "adaptive":
+            methods.append(
+                ("Адаптивный метод Гаусса-Кронрода", self.gauss_kronrod_panel)
+            )
+        if selected_method == "adaptive_simpson":
+            methods.append(("Адаптивный метод Симпсона", self.simpson_panel))
+        if selected_method == "tanh_sinh":
+            methods.append(("Метод tanh-sinh", self.tanh_sinh_method))
+        if selected_method == "clenshaw_curtis":
+            methods.append(("Метод Кленшоу-Кертиса", self.clenshaw_curtis_method))
+        if selected_method == "monte_carlo":
+            methods.append(("Метод Монте-Карло", self.monte_carlo_method))
+
+        if not methods:
+            raise ValueError(f"Неизвестный метод интегрирования: {selected_method}")
+        return methods
+
+    def compute_integration(self, methods, a, b, eps, initial_n, predictive):
+        """Run the selected integration methods; executed as a background job"""
+        # With several methods selected, their integrate() runs go to worker
+        # processes up front and are collected below in method order
+        parallel = {}
+        if len(methods) > 1:
+            pool = self.get_process_pool(len(methods))
+            for _, method in methods:
+                parallel[method] = pool.submit(
+                    integrate_in_worker,
+                    self.expressions["function"],
+                    method.__name__,
+                    a,
+                    b,
+                    eps,
+                    initial_n,
+                    predictive,
+                )
+
+        outcomes = []
+        try:
+            for method_name, method in methods:
+                self.check_job(f"Выполняются вычисления: {method_name}")
+                start_time = time.time()
+
+                if method in parallel:
+                    while not parallel[method].done():
+                        self.check_job()
+                        time.sleep(0.05)
+                    outcome, execution_time = parallel[method].result()
+                    outcomes.append((outcome, execution_time))
+                    continue
+
+                if method in (self.gauss_kronrod_panel, self.simpson_panel):
+                    outcome = self.adaptive_quadrature(method, a, b, eps)
+                elif method == self.romberg_method:
+                    outcome = self.romberg_method(a, b, eps, initial_n)
+                elif method == self.tanh_sinh_method:
+                    outcome = self.tanh_sinh_method(a, b, eps)
+                elif method == self.clenshaw_curtis_method:
+                    outcome = self.clenshaw_curtis_method(a, b, eps, initial_n)
+                elif method == self.monte_carlo_method:
+                    outcome = self.monte_carlo_method(a, b, eps)
+                else:
+                    n = 1 if method == self.gauss_legendre_rule else initial_n
+                    outcome = self.integrate(
+                        method, a, b, eps, n, predictive=predictive
+                    )
+                outcomes.append((outcome, time.time() - start_time))
+        except JobCancelled:
+            # Cancelling the futures would leave the running methods to finish
+            self.shutdown_process_pool(wait=False, terminate=True)
+            raise
+
+        return outcomes
+
+    def tensor_nodes(self, rule, a, b, n):
+        """Nodes and weights of a composite rule on one axis of a tensor-product cubature"""
+        if rule == "gauss":
+            nodes, weights = gauss_legendre_nodes(self.gauss_order)
+            half = (b - a) / (2 * n)
+            centers = a + half * np.arange(1, 2 * n, 2)
+            return (centers[:, np.newaxis] + half * nodes).ravel(), np.tile(
+                half * weights, n
+            )
+
+        h = (b - a) / n
+        weights = np.full(n + 1, 2 * h / 3)
+        weights[1::2] = 4 * h / 3
+        weights[0] = weights[-1] = h / 3
+        return np.linspace(a, b, n + 1), weights
+
+    def tensor_sum(self, nodes, weights, start, stop):
+        """Weighted sum of f over the tensor grid, rows start:stop of the first axis"""
+        dimension = len(nodes)
+        # The other axes are broadcast against a block of first-axis nodes
+        inner = [
+            axis.reshape((1,) * (k + 1) + (-1,) + (1,) * (dimension - k - 2))
+            for k, axis in enumerate(nodes[1:])
+        ]
+        inner_weights = reduce(np.multiply.outer, weights[1:]).ravel()
+        block = max(1, self.chunk_size // inner_weights.size)
+
+        partial = []
+        for low in range(start, stop, block):
+            self.check_job()
+            high = min(low + block, stop)
+            x = nodes[0][low:high].reshape((-1,) + (1,) * (dimension - 1))
+            y = np.broadcast_to(
+                self.f_multi(x, *inner),
+                (high - low, *(len(axis) for axis in nodes[1:])),
+            )
+            partial.append(
+                weights[0][low:high] @ y.reshape(high - low, -1) @ inner_weights
+            )
+        return math.fsum(partial)
+
+    def halton_sums(self, limits, shifts, start, stop):
+        """Sums of f over Halton points start:stop, one sum per random shift"""
+        lower = np.array([a for a, _ in limits])
+        width = np.array([b - a for a, b in limits])
+
+        partial = []
+        for low in range(start, stop, self.chunk_size):
+            self.check_job()
+            high = min(low + self.chunk_size, stop)
+            u = halton_points(low, high, len(limits))
+            # Cranley-Patterson rotation: each shift is an independent randomized rule
+            partial.append(
+                [
+                    np.sum(
+                        np.broadcast_to(
+                            self.f_multi(*(lower + width * ((u + shift) % 1.0)).T),
+                            (high - low,),
+                        )
+                    )
+                    for shift in shifts
+                ]
+            )
+        return np.sum(partial, axis=0)
+
+    def distributed_sum(self, part, start, stop, workers, *args):
+        """part(*args, start, stop), split into slices over worker processes if asked"""
+        if workers < 2 or stop - start < 2:
+            return getattr(self, part)(*args, start, stop)
+
+        bounds = np.linspace(start, stop, min(workers, stop - start) + 1).astype(int)
+        return sum(
+            self.gather(
+                [
+                    (part, *args, int(low), int(high))
+                    for low, high in zip(bounds[:-1], bounds[1:])
+                ],
+                workers,
+            )
+        )
+
+    def gather(self, calls, workers):
+        """Results of (part, *args) calls run by cubature_in_worker in worker processes"""
+        # The pool is sized by workers, not by this batch of calls, so that it is
+        # started once even when early rounds have fewer slices
+        pool = self.get_process_pool(workers)
+        futures = [
+            pool.submit(
+                cubature_in_worker, self.expressions["multiple_function"], *call
+            )
+            for call in calls
+        ]
+        try:
+            while not all(future.done() for future in futures):
+                self.check_job()
+                time.sleep(0.05)
+        except JobCancelled:
+            self.shutdown_process_pool(wait=False, terminate=True)
+            raise
+        return [future.result() for future in futures]
+
+    def tensor_cubature(self, rule, limits, eps, initial_n, workers, max_points):
+        """Tensor-product cubature over a box, n doubled on every axis until Runge's
+        estimate is below eps"""
+        dimension = len(limits)
+        p = 2 * self.gauss_order if rule == "gauss" else 4
+
+        def evaluate(n):
+            axes = [self.tensor_nodes(rule, a, b, n) for a, b in limits]
+            nodes = [axis[0] for axis in axes]
+            weights = [axis[1] for axis in axes]
+            I = self.distributed_sum(
+                "tensor_sum", 0, len(nodes[0]), workers, nodes, weights
+            )
+            return I, len(nodes[0]) ** dimension
+
+        n = initial_n
+        if rule == "simpson" and n % 2 != 0:
+            n += 1
+        I, points = evaluate(n)
+        evaluations = points
+        error = float("inf")
+        levels = [(n, points, I, None)]
+
+        while points * 2**dimension <= max_points:
+            self.check_job(f"Кубатура: {2 * n} отрезков по каждой оси")
+            n *= 2
+            I_new, points = evaluate(n)
+            evaluations += points
+            error = self.runge_principle(I, I_new, p)
+            I = I_new
+            levels.append((n, points, I, error))
+            if error < eps:
+                break
+
+        return I, evaluations, error, levels
+
+    def simpson_cubature(self, limits, eps, workers=1, max_points=2**24):
+        return self.tensor_cubature("simpson", limits, eps, 2, workers, max_points)
+
+    def gauss_cubature(self, limits, eps, workers=1, max_points=2**24):
+        return self.tensor_cubature("gauss", limits, eps, 1, workers, max_points)
+
+    def quasi_monte_carlo(
+        self,
+        limits,
+        eps,
+        workers=1,
+        max_points=2**24,
+        initial_n=1024,
+        shifts=8,
+        seed=None,
+    ):
+        """Randomly shifted Halton rule; the error is the standard error over the shifts"""
+        dimension = len(limits)
+        volume = math.prod(b - a for a, b in limits)
+        shift_vectors = np.random.default_rng(seed).random((shifts, dimension))
+
+        sums = np.zeros(shifts)
+        n = 0
+        target = initial_n
+        levels = []
+        while True:
+            self.check_job(f"Квази-Монте-Карло: {target} точек")
+            # The sequence is extended, so earlier points keep their contribution
+            sums = sums + self.distributed_sum(
+                "halton_sums", n, target, workers, limits, shift_vectors
+            )
+            n = target
+            estimates = volume * sums / n
+            I = float(np.mean(estimates))
+            error = float(np.std(estimates, ddof=1) / math.sqrt(shifts))
+            levels.append((n, n * shifts, I, error))
+            if error < eps or 2 * n * shifts > max_points:
+                break
+            target = 2 * n
+
+        return I, n * shifts, error, levels
+
+    def monte_carlo_moments(self, limits, seed, replicates, antithetic, strata):
+        """Moments of replicate means drawn from the random stream of seed"""
+        rng = np.random.default_rng(seed)
+        dimension = len(limits)
+        lower = np.array([a for a, _ in limits])
+        width = np.array([b - a for a, b in limits])
+        volume = math.prod(width)
+        # A replicate takes one point in each of the strata**dimension cells
+        # of the unit cube, plus the mirrored points 1 - u if antithetic
+        cells = np.indices((strata,) * dimension).reshape(dimension, -1).T
+        per_replicate = len(cells) * (2 if antithetic else 1)
+        block = max(1, self.chunk_size // per_replicate)
+
+        moments = EMPTY_MOMENTS
+        for low in range(0, replicates, block):
+            self.check_job()
+            count = min(block, replicates - low)
+            u = (cells + rng.random((count, len(cells), dimension))) / strata
+            if antithetic:
+                u = np.concatenate((u, 1 - u), axis=1)
+            y = np.broadcast_to(
+                self.f_multi(*np.moveaxis(lower + width * u, -1, 0)), u.shape[:-1]
+            )
+            F = volume * np.mean(y, axis=1)
+            # Control variate: Σ(u_i - 1/2)² has mean dimension/12 and, unlike a
+            # linear control, is not cancelled by the antithetic pairs
+            G = np.mean(np.sum((u - 0.5) ** 2, axis=2), axis=1)
+            moments = merge_moments(moments, sample_moments(F, G))
+        return moments
+
+    def monte_carlo(
+        self,
+        limits,
+        eps,
+        workers=1,
+        max_points=10**9,
+        antithetic=True,
+        stratified=True,
+        control=True,
+        seed=None,
+        initial_points=2**14,
+    ):
+        """Monte Carlo with variance reduction; stops once the standard error is below eps"""
+        dimension = len(limits)
+        strata = round(64 ** (1 / dimension)) if stratified else 1
+        per_replicate = strata**dimension * (2 if antithetic else 1)
+        max_replicates = max(2, max_points // per_replicate)
+        root = np.random.SeedSequence(seed)
+
+        moments = EMPTY_MOMENTS
+        target = min(max(2, initial_points // per_replicate), max_replicates)
+        levels = []
+        while True:
+            self.check_job(f"Монте-Карло: {target * per_replicate} точек")
+            new = target - moments[0]
+            # Every round and every worker draws from its own child stream
+            streams = root.spawn(max(1, workers))
+            if workers < 2:
+                parts = [
+                    self.monte_carlo_moments(
+                        limits, streams[0], new, antithetic, strata
+                    )
+                ]
+            else:
+                counts = np.diff(np.linspace(0, new, workers + 1).astype(int))
+                parts = self.gather(
+                    [
+                        (
+                            "monte_carlo_moments",
+                            limits,
+                            stream,
+                            int(count),
+                            antithetic,
+                            strata,
+                        )
+                        for stream, count in zip(streams, counts)
+                        if count
+                    ],
+                    workers,
+                )
+            moments = reduce(merge_moments, parts, moments)
+
+            n, mean_f, mean_g, ff, gg, fg = moments
+            beta = fg / gg if control and gg > 0 else 0.0
+            I = float(mean_f - beta * (mean_g - dimension / 12))
+            error = math.sqrt(max(ff - beta * fg, 0.0) / (n - 1) / n)
+            levels.append((n * per_replicate, n * per_replicate, I, error))
+            if error < eps or n >= max_replicates:
+                break
+
+            # Replicates predicted for a standard error of eps, at most 16 times more
+            needed = math.ceil(n * (error / eps) ** 2 * 1.1)
+            target = min(needed, 16 * n, max_replicates)
+
+        return I, n * per_replicate, error, levels
+
+    def monte_carlo_method(self, a, b, eps):
+        """Monte Carlo over [a, b] for the integration tab"""
+        saved = self.expressions.get("multiple_function")
+        self.expressions["multiple_function"] = self.expressions["function"]
+        try:
+            return self.monte_carlo([(a, b)], eps)
+        finally:
+            if saved is None:
+                del self.expressions["multiple_function"]
+            else:
+                self.expressions["multiple_function"] = saved
+
+    def cubature_methods(self, selected_method):
+        """(name, method) pairs for a method key of the multiple integrals tab"""
+        methods = []
+        if selected_method in ("all", "simpson"):
+            methods.append(("Кубатура Симпсона", self.simpson_cubature))
+        if selected_method in ("all", "gauss"):
+            methods.append(("Кубатура Гаусса-Лежандра", self.gauss_cubature))
+        if selected_method in ("all", "qmc"):
+            methods.append(("Квази-Монте-Карло (Халтон)", self.quasi_monte_carlo))
+        if selected_method in ("all", "monte_carlo"):
+            methods.append(("Метод Монте-Карло", self.monte_carlo))
+
+        if not methods:
+            raise ValueError(f"Неизвестный метод кубатуры: {selected_method}")
+        return methods
+
+    def compute_cubature(self, methods, limits, eps, workers):
+        """Run the selected cubature methods; executed as a background job"""
+        if len(limits) not in (2, 3):
+            raise ValueError("Кратный интеграл: два или три отрезка интегрирования")
+        for a, b in limits:
+            if a >= b:
+                raise ValueError("Верхний предел должен быть больше нижнего")
+
+        outcomes = []
+        for method_name, method in methods:
+            self.check_job(f"Выполняются вычисления: {method_name}")
+            start_time = time.time()
+            outcome = method(limits, eps, workers)
+            outcomes.append((outcome, time.time() - start_time))
+        return outcomes
+
+    def lagrange_basis(self, nodes, x):
+        """Values of all Lagrange basis polynomials at x (a number or an array),
+        O(n) per point from the barycentric weights; the last axis runs over nodes"""
+        nodes = np.asarray(nodes, dtype=float)
+        weights = barycentric_weights(tuple(nodes))
+        difference = np.asarray(x, dtype=float)[..., np.newaxis] - nodes
+        exact = difference == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = weights / difference
+            basis = terms / np.sum(terms, axis=-1, keepdims=True)
+        # At a node the formula is inf/inf; the basis there is a unit vector
+        return np.where(exact.any(axis=-1, keepdims=True), exact.astype(float), basis)
+
+    def barycentric_lagrange(self, data, x):
+        """Lagrange polynomial through data in the second barycentric form"""
+        nodes, values = np.array(data, dtype=float).T
+        x = np.asarray(x, dtype=float)
+        flat = x.ravel()
+        result = np.empty(flat.shape)
+        # The basis matrix is points × nodes, so long arrays of x go in chunks
+        rows = max(1, self.chunk_size // len(nodes))
+        for low in range(0, len(flat), rows):
+            result[low : low + rows] = (
+                self.lagrange_basis(nodes, flat[low : low + rows]) @ values
+            )
+        return result.reshape(x.shape)[()]
+
+    def lagrange_polynomial(self, data, x):
+        """Value at x and the terms y_i * L_i(x) of the Lagrange polynomial"""
+        nodes, values = np.array(data, dtype=float).T
+        basis = self.lagrange_basis(nodes, x)
+        terms = [f"{y:.4f} * {L:.6f}" for y, L in zip(values, basis)]
+        return float(basis @ values), terms
+
+    def divided_differences(self, nodes, values, table=None):
+        """Newton coefficients f[x_0], f[x_0, x_1], ... computed in place in one vector
+
+        After step j, c[i] for i >= j holds f[x_(i-j), ..., x_i], that is column j
+        of the divided-difference table; its entries (i, j, value) are appended
+        to table if one is given."""
+        x = np.asarray(nodes, dtype=float)
+        c = np.array(values, dtype=float)
+        for j in range(1, len(x)):
+            c[j:] = (c[j:] - c[j - 1 : -1]) / (x[j:] - x[:-j])
+            if table is not None:
+                table.extend((i, j, value) for i, value in enumerate(c[j:]))
+        return c
+
+    def newton_horner(self, nodes, coefficients, x):
+        """Newton form at x (a number or an array) by nested multiplication"""
+        x = np.asarray(x, dtype=float)
+        result = np.full(x.shape, coefficients[-1])
+        for k in range(len(coefficients) - 2, -1, -1):
+            result = result * (x - nodes[k]) + coefficients[k]
+        return result[()]
+
+    def newton_polynomial(self, data, x, detailed=True):
+        """Value at x of the Newton polynomial; with detailed, also its terms and the
+        divided-difference table as (i, j, value) entries
+
+        Both take O(n²) memory, so past TRACE_LIMIT nodes the terms are None and
+        only row i = 0 of the table, the coefficients f[x_0, ..., x_j], is kept."""
+        nodes, values = np.array(data, dtype=float).T
+        traced = detailed and len(nodes) <= TRACE_LIMIT
+        divided_diff = [] if traced else None
+        coefficients = self.divided_differences(nodes, values, divided_diff)
+        result = self.newton_horner(nodes, coefficients, x)
+        if detailed and not traced:
+            divided_diff = [(0, j, coefficients[j]) for j in range(1, len(nodes))]
+
+        terms = None
+        if traced:
+            terms = [
+                f"{coefficients[j]:.4f}"
+                + "".join(f" * (x - {nodes[i]:.4f})" for i in range(j))
+                for j in range(len(nodes))
+            ]
+
+        return result, terms, divided_diff
+
+    def cubic_spline(self, data, boundary="natural", slopes=(0.0, 0.0)):
+        """Nodes and the (n, 4) coefficient array of a cubic spline through data
+
+        Row i holds a, b, c, d of a + b·t + c·t² + d·t³ on [x_i, x_(i+1)],
+        t = x - x_i. boundary is "natural" (zero S'' at the ends), "clamped"
+        (S' equal to slopes at the ends) or "not_a_knot" (continuous third
+        derivative at x_1 and x_(n-1))."""
+        nodes, values = np.array(sorted(data), dtype=float).reshape(-1, 2).T
+        if len(nodes) < 2:
+            raise ValueError("Для сплайна нужно не меньше двух узлов")
+        h = np.diff(nodes)
+        if np.any(h == 0):
+            raise ValueError("Узлы интерполяции должны быть различны")
+        if boundary not in ("natural", "clamped", "not_a_knot"):
+            raise ValueError(f"Неизвестный тип сплайна: {boundary}")
+
+        n = len(h)
+        slope = np.diff(values) / h
+        if boundary == "not_a_knot" and n < 3:
+            # Through two or three nodes the not-a-knot spline is the line or
+            # parabola through them
+            c = np.full(n + 1, (slope[-1] - slope[0]) / (nodes[-1] - nodes[0]))
+        else:
+            # Continuity of S' at the interior nodes is a tridiagonal system in c = S''/2
+            lower = np.zeros(n + 1)
+            diagonal = np.ones(n + 1)
+            upper = np.zeros(n + 1)
+            rhs = np.zeros(n + 1)
+            lower[1:n] = h[:-1]
+            diagonal[1:n] = 2 * (h[:-1] + h[1:])
+            upper[1:n] = h[1:]
+            rhs[1:n] = 3 * (slope[1:] - slope[:-1])
+
+            if boundary == "clamped":
+                diagonal[0], upper[0] = 2 * h[0], h[0]
+                rhs[0] = 3 * (slope[0] - slopes[0])
+                lower[n], diagonal[n] = h[-1], 2 * h[-1]
+                rhs[n] = 3 * (slopes[1] - slope[-1])
+
+            if boundary == "not_a_knot":
+                # c_0 and c_n are eliminated through the end conditions, which keeps
+                # the system for c_1..c_(n-1) tridiagonal and diagonally dominant
+                diagonal[1] += h[0] * (h[0] + h[1]) / h[1]
+                upper[1] -= h[0] ** 2 / h[1]
+                diagonal[n - 1] += h[-1] * (h[-2] + h[-1]) / h[-2]
+                lower[n - 1] -= h[-1] ** 2 / h[-2]
+                c = np.zeros(n + 1)
+                c[1:n] = thomas_solve(lower[1:n], diagonal[1:n], upper[1:n], rhs[1:n])
+                c[0] = ((h[0] + h[1]) * c[1] - h[0] * c[2]) / h[1]
+                c[n] = ((h[-2] + h[-1]) * c[n - 1] - h[-1] * c[n - 2]) / h[-2]
+            else:
+                c = thomas_solve(lower, diagonal, upper, rhs)
+
+        coefficients = np.column_stack(
+            (
+                values[:-1],
+                slope - h * (2 * c[:-1] + c[1:]) / 3,
+                c[:-1],
+                (c[1:] - c[:-1]) / (3 * h),
+            )
+        )
+        return nodes, coefficients
+
+    def spline_evaluate(self, nodes, coefficients, x):
+        """Spline at x (a number or an array): interval by binary search, then Horner"""
+        x = np.asarray(x, dtype=float)
+        # Points outside [x_0, x_n] use the polynomial of the nearest end interval
+        interval = np.clip(
+            np.searchsorted(nodes, x, side="right") - 1, 0, len(coefficients) - 1
+        )
+        t = x - nodes[interval]
+        a, b, c, d = coefficients[interval].T
+        return (((d * t + c) * t + b) * t + a)[()]
+
+    def chebyshev_approximation(self, a, b, eps, initial_n=16, max_n=2**16):
+        """Chebyshev series of f_interp on [a, b], truncated to the tolerance eps
+
+        The function is sampled on nested grids of Chebyshev points, doubling N
+        until the upper half of the coefficients sums to less than eps; the series
+        is then cut where the sum of the dropped |c_j|, a bound on the error in
+        [a, b], falls below eps. Returns (coefficients, samples, error, levels)
+        with levels of (N, samples, degree, tail) per grid."""
+        if a >= b:
+            raise ValueError("Правый конец отрезка должен быть больше левого")
+        if eps <= 0:
+            raise ValueError("Точность должна быть положительным числом")
+        c, d = (a + b) / 2, (b - a) / 2
+
+        def evaluate(k, N):
+            x = c + d * np.cos(np.pi * k / N)
+            return np.broadcast_to(self.f_interp(x), x.shape)
+
+        N = initial_n
+        y = evaluate(np.arange(N + 1), N)
+        levels = []
+        while True:
+            self.check_job(f"Выполняется аппроксимация: {N + 1} точек Чебышёва")
+            if not np.all(np.isfinite(y)):
+                raise ValueError("Функция не определена в точках Чебышёва на [a, b]")
+            coefficients = chebyshev_coefficients(y)
+            # tail[j] is Σ |c_k| over k ≥ j
+            tail = np.append(np.cumsum(np.abs(coefficients)[::-1])[::-1], 0.0)
+            degree = int(np.argmax(tail[1:] < eps))
+            levels.append((N, N + 1, degree, float(tail[N // 2])))
+            if tail[N // 2] < eps or 2 * N > max_n:
+                break
+
+            # Points of the N grid are the even points of the 2N grid
+            y_new = np.empty(2 * N + 1)
+            y_new[::2] = y
+            y_new[1::2] = evaluate(np.arange(1, 2 * N, 2), 2 * N)
+            y = y_new
+            N *= 2
+
+        if tail[N // 2] >= eps:
+            # Not resolved within max_n points: the whole series is kept and the
+            # upper half of it stands for the error
+            return coefficients, N + 1, float(tail[N // 2]), levels
+        return coefficients[: degree + 1], N + 1, float(tail[degree + 1]), levels
+
+    def chebyshev_evaluate(self, coefficients, a, b, x):
+        """Chebyshev series on [a, b] at x (a number or an array)"""
+        t = (2 * np.asarray(x, dtype=float) - (a + b)) / (b - a)
+        return clenshaw(coefficients, t)
+
+    def compute_chebyshev_approximation(self, a, b, eps, x_star):
+        """Approximate f_interp and evaluate it at x*; executed as a background job"""
+        start_time = time.time()
+        coefficients, samples, error, levels = self.chebyshev_approximation(a, b, eps)
+        value = self.chebyshev_evaluate(coefficients, a, b, x_star)
+        return coefficients, samples, error, levels, value, time.time() - start_time
+
+    def compute_interpolation(
+        self,
+        data,
+        x_star,
+        selected_method,
+        detailed=True,
+        spline_boundary="natural",
+        spline_slopes=(0.0, 0.0),
+    ):
+        """Evaluate the selected interpolation polynomials at x*"""
+        lagrange_result = None
+        newton_result = None
+        lagrange_terms = None
+        newton_terms = None
+        divided_diff = None
+
+        if selected_method in ["both", "lagrange"]:
+            self.check_job("Выполняется интерполяция: многочлен Лагранжа")
+            if detailed:
+                lagrange_result, lagrange_terms = self.lagrange_polynomial(data, x_star)
+            else:
+                lagrange_result = self.barycentric_lagrange(data, x_star)
+
+        if selected_method in ["both", "newton"]:
+            self.check_job("Выполняется интерполяция: многочлен Ньютона")
+            newton_result, newton_terms, divided_diff = self.newton_polynomial(
+                data, x_star, detailed
+            )
+
+        spline = None
+        if selected_method == "spline":
+            self.check_job("Выполняется интерполяция: кубический сплайн")
+            nodes, coefficients = self.cubic_spline(
+                data, spline_boundary, spline_slopes
+            )
+            spline = (
+                self.spline_evaluate(nodes, coefficients, x_star),
+                nodes,
+                coefficients,
+            )
+
+        return (
+            lagrange_result,
+            lagrange_terms,
+            newton_result,
+            newton_terms,
+            divided_diff,
+            spline,
+        )
+
+    def compute_differentiation(self, x, h, derivative_order, input_method, data):
+        """Difference derivatives over a sequence of halved steps"""
+        if input_method == "analytic":
+            function_str = self.expressions["diff_function"]
+            x_sym = sp.Symbol("x")
+            f_sym = sp.sympify(function_str.replace("^", "**"))
+            if derivative_order == "first":
+                df_sym = sp.diff(f_sym, x_sym)
+                exact_derivative = float(df_sym.subs(x_sym, x))
+            else:
+                df_sym = sp.diff(f_sym, x_sym, 2)
+                exact_derivative = float(df_sym.subs(x_sym, x))
+
+            x_range = np.linspace(x - 2, x + 2, 1000)
+            y_range = np.array([self.f_diff(xi) for xi in x_range])
+
+            data = [
+                (x - 2 * h, self.f_diff(x - 2 * h)),
+                (x - h, self.f_diff(x - h)),
+                (x, self.f_diff(x)),
+                (x + h, self.f_diff(x + h)),
+                (x + 2 * h, self.f_diff(x + 2 * h)),
+            ]
+        else:
+            x_data = np.array([point[0] for point in data])
+            y_data = np.array([point[1] for point in data])
+
+            poly = np.polyfit(x_data, y_data, len(data) - 1)
+            poly_derivative = np.polyder(poly, 1 if derivative_order == "first" else 2)
+            exact_derivative = np.polyval(poly_derivative, x)
+
+            x_range = np.linspace(min(x_data), max(x_data), 1000)
+            y_range = np.polyval(poly, x_range)
+
+            function_str = "Табличная функция"
+
+        if derivative_order == "first":
+            formulas = [
+                (
+                    "Левая разностная",
+                    lambda x, h: (self.f_diff(x) - self.f_diff(x - h)) / h,
+                ),
+                (
+                    "Правая разностная",
+                    lambda x, h: (self.f_diff(x + h) - self.f_diff(x)) / h,
+                ),
+                (
+                    "Центральная разностная",
+                    lambda x, h: (self.f_diff(x + h) - self.f_diff(x - h)) / (2 * h),
+                ),
+                (
+                    "Трехточечная",
+                    lambda x, h: (
+                        -3 * self.f_diff(x)
+                        + 4 * self.f_diff(x + h)
+                        - self.f_diff(x + 2 * h)
+                    )
+                    / (2 * h),
+                ),
+            ]
+
+            if input_method == "tabular":
+
+                def tabular_f(x_val):
+                    for i, (xi, yi) in enumerate(data):
+                        if abs(xi - x_val) < 1e-10:
+                            return yi
+                    return np.interp(x_val, [p[0] for p in data], [p[1] for p in data])
+
+                formulas = [
+                    (
+                        "Левая разностная",
+                        lambda x, h: (tabular_f(x) - tabular_f(x - h)) / h,
+                    ),
+                    (
+                        "Правая разностная",
+                        lambda x, h: (tabular_f(x + h) - tabular_f(x)) / h,
+                    ),
+                    (
+                        "Центральная разностная",
+                        lambda x, h: (tabular_f(x + h) - tabular_f(x - h)) / (2 * h),
+                    ),
+                    (
+                        "Трехточечная",
+                        lambda x, h: (
+                            -3 * tabular_f(x)
+                            + 4 * tabular_f(x + h)
+                            - tabular_f(x + 2 * h)
+                        )
+                        / (2 * h),
+                    ),
+                ]
+        else:
+            formulas = [
+                (
+                    "Центральная разностная",
+                    lambda x, h: (
+                        self.f_diff(x + h) - 2 * self.f_diff(x) + self.f_diff(x - h)
+                    )
+                    / (h**2),
+                ),
+                (
+                    "Пятиточечная",
+                    lambda x, h: (
+                        -self.f_diff(x + 2 * h)
+                        + 16 * self.f_diff(x + h)
+                        - 30 * self.f_diff(x)
+                        + 16 * self.f_diff(x - h)
+                        - self.f_diff(x - 2 * h)
+                    )
+                    / (12 * h**2),
+                ),
+            ]
+
+            if input_method == "tabular":
+
+                def tabular_f(x_val):
+                    for i, (xi, yi) in enumerate(data):
+                        if abs(xi - x_val) < 1e-10:
+                            return yi
+                    return np.interp(x_val, [p[0] for p in data], [p[1] for p in data])
+
+                formulas = [
+                    (
+                        "Центральная разностная",
+                        lambda x, h: (
+                            tabular_f(x + h) - 2 * tabular_f(x) + tabular_f(x - h)
+                        )
+                        / (h**2),
+                    ),
+                    (
+                        "Пятиточечная",
+                        lambda x, h: (
+                            -tabular_f(x + 2 * h)
+                            + 16 * tabular_f(x + h)
+                            - 30 * tabular_f(x)
+                            + 16 * tabular_f(x - h)
+                            - tabular_f(x - 2 * h)
+                        )
+                        / (12 * h**2),
+                    ),
+                ]
+
+        h_values = []
+        errors = {formula[0]: [] for formula in formulas}
+        derivative_values = {formula[0]: [] for formula in formulas}
+
+        current_h = h
+        for i in range(10):
+            self.check_job(f"Выполняется дифференцирование: h = {current_h:.8f}")
+            h_values.append(current_h)
+
+            for name, formula in formulas:
+                try:
+                    derivative = formula(x, current_h)
+                    error = abs(derivative - exact_derivative)
+
+                    errors[name].append(error)
+                    derivative_values[name].append(derivative)
+                except Exception as e:
+                    errors[name].append(np.nan)
+                    derivative_values[name].append(np.nan)
+
+            current_h /= 2
+
+        best_h = {}
+        best_derivative = {}
+        best_error = {}
+
+        for name, formula in formulas:
+            min_error = float("inf")
+            optimal_h = h
+            optimal_derivative = None
+
+            for i in range(len(h_values) - 1):
+                if np.isnan(errors[name][i]) or np.isnan(errors[name][i + 1]):
+                    continue
+
+                p = 1 if "Левая" in name or "Правая" in name else 2
+                runge_error = abs(
+                    derivative_values[name][i + 1] - derivative_values[name][i]
+                ) / (2**p - 1)
+
+                if runge_error < min_error:
+                    min_error = runge_error
+                    optimal_h = h_values[i + 1]
+                    optimal_derivative = derivative_values[name][i + 1]
+
+            best_h[name] = optimal_h
+            best_derivative[name] = optimal_derivative
+            best_error[name] = min_error
+
+        return {
+            "function_str": function_str,
+            "data": data,
+            "exact_derivative": exact_derivative,
+            "x_range": x_range,
+            "y_range": y_range,
+            "h_values": h_values,
+            "errors": errors,
+            "derivative_values": derivative_values,
+            "best_h": best_h,
+            "best_derivative": best_derivative,
+            "best_error": best_error,
+        }
+
+    def equation_methods(self, selected_method):
+        """(name, method) pairs for a method key of the equations tab"""
+        methods = []
+        if selected_method == "all" or selected_method == "bisection":
+            methods.append(("Метод половинного деления", self.bisection_method))
+        if selected_method == "all" or selected_method == "chord":
+            methods.append(("Метод хорд", self.chord_method))
+        if selected_method == "all" or selected_method == "newton":
+            methods.append(("Метод Ньютона", self.newton_method))
+        if selected_method == "all" or selected_method == "secant":
+            methods.append(("Метод секущих", self.secant_method))
+        if selected_method == "all" or selected_method == "hybrid":
+            methods.append(
+                ("Гибридный метод Ньютона-половинного деления", self.hybrid_method)
+            )
+
+        if not methods:
+            raise ValueError(f"Неизвестный метод решения: {selected_method}")
+        return methods
+
+    def compute_equation(self, methods, a, b, eps, x0):
+        """Run the selected root-finding methods"""
+        results = []
+
+        for method_name, method in methods:
+            self.check_job(f"Решение уравнения: {method_name}")
+            start_time = time.time()
+
+            if method_name == "Метод Ньютона" or method_name == "Метод секущих":
+                root, iterations, convergence_data = method(a, b, eps, x0)
+            else:
+                root, iterations, convergence_data = method(a, b, eps)
+
+            execution_time = time.time() - start_time
+
+            results.append(
+                (method_name, root, iterations, execution_time, convergence_data)
+            )
+
+        return results
+
+    def bisection_method(self, a, b, eps):
+        """Bisection method for solving nonlinear equations"""
+        fa = self.f_eq(a)
+        fb = self.f_eq(b)
+
+        if fa * fb > 0:
+            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
+
+        iterations = 0
+        convergence_data = []
+
+        while (b - a) > eps:
+            c = (a + b) / 2
+            fc = self.f_eq(c)
+
+            convergence_data.append((a, b, c, fc, b - a))
+
+            if abs(fc) < eps:
+                break
+
+            if fa * fc < 0:
+                b = c
+                fb = fc
+            else:
+                a = c
+                fa = fc
+
+            iterations += 1
+
+            if iterations > 1000:
+                break
+
+        root = (a + b) / 2
+        return root, iterations, convergence_data
+
+    def chord_method(self, a, b, eps):
+        """Chord method for solving nonlinear equations"""
+        fa = self.f_eq(a)
+        fb = self.f_eq(b)
+
+        if fa * fb > 0:
+            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
+
+        iterations = 0
+        c_prev = a
+        c = a - fa * (b - a) / (fb - fa)
+
+        convergence_data = [(a, b, c, self.f_eq(c), None)]
+
+        while abs(c - c_prev) > eps:
+            fc = self.f_eq(c)
+
+            if abs(fc) < eps:
+                break
+
+            if fa * fc < 0:
+                b = c
+                fb = fc
+            else:
+                a = c
+                fa = fc
+
+            c_prev = c
+            c = a - fa * (b - a) / (fb - fa)
+
+            convergence_data.append((a, b, c, self.f_eq(c), abs(c - c_prev)))
+
+            iterations += 1
+
+            if iterations > 1000:
+                break
+
+        return c, iterations, convergence_data
+
+    def newton_method(self, a, b, eps, x0):
+        """Newton's method for solving nonlinear equations"""
+        if x0 < a or x0 > b:
+            x0 = (a + b) / 2
+
+        iterations = 0
+        x = x0
+
+        convergence_data = []
+
+        while True:
+            fx = self.f_eq(x)
+            dfx = self.df_eq(x)
+
+            if abs(dfx) < 1e-10:
+                raise ValueError("Производная близка к нулю, метод Ньютона не сходится")
+
+            x_new = x - fx / dfx
+
+            if iterations > 0:
+                delta = abs(x_new - x)
+                convergence_data.append((x, fx, dfx, delta))
+            else:
+                convergence_data.append((x, fx, dfx, None))
+
+            if abs(x_new - x) < eps or abs(fx) < eps:
+                x = x_new
+                break
+
+            x = x_new
+            iterations += 1
+
+            if iterations > 1000:
+                break
+
+            if x < a or x > b:
+                raise ValueError(f"Решение вышло за пределы отрезка [{a}, {b}]")
+
+        return x, iterations, convergence_data
+
+    def secant_method(self, a, b, eps, x0):
+        """Secant method for solving nonlinear equations"""
+        if x0 < a or x0 > b:
+            x0 = (a + b) / 2
+
+        iterations = 0
+        x_prev = x0
+        x = x0 + 0.1 * abs(x0)
+
+        if x < a or x > b:
+            x = x0 - 0.1 * abs(x0)
+
+        convergence_data = [(x_prev, x, self.f_eq(x), None)]
+
+        while True:
+            fx_prev = self.f_eq(x_prev)
+            fx = self.f_eq(x)
+
+            if abs(fx - fx_prev) < 1e-10:
+                raise ValueError(
+                    "Разность значений функции близка к нулю, метод секущих не сходится"
+                )
+
+            x_new = x - fx * (x - x_prev) / (fx - fx_prev)
+
+            delta = abs(x_new - x)
+            convergence_data.append((x, x_new, self.f_eq(x_new), delta))
+
+            if delta < eps or abs(fx) < eps:
+                x = x_new
+                break
+
+            x_prev = x
+            x = x_new
+            iterations += 1
+
+            if iterations > 1000:
+                break
+
+            if x < a or x > b:
+                raise ValueError(f"Решение вышло за пределы отрезка [{a}, {b}]")
+
+        return x, iterations, convergence_data
+
+    def hybrid_method(self, a, b, eps):
+        """Hybrid Newton-bisection method for solving nonlinear equations"""
+        fa = self.f_eq(a)
+        fb = self.f_eq(b)
+
+        if fa * fb > 0:
+            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
+
+        iterations = 0
+        x = (a + b) / 2
+
+        convergence_data = [(a, b, x, self.f_eq(x), "Бисекция", None)]
+
+        while (b - a) > eps:
+            fx = self.f_eq(x)
+
+            if abs(fx) < eps:
+                break
+
+            dfx = self.df_eq(x)
+
+            if abs(dfx) > 1e-10:
+                x_newton = x - fx / dfx
+
+                if a <= x_newton <= b and abs(x_newton - x) < 0.5 * (b - a):
+                    x_prev = x
+                    x = x_newton
+                    method_used = "Ньютон"
+                else:
+                    c = (a + b) / 2
+                    fc = self.f_eq(c)
+
+                    if fa * fc < 0:
+                        b = c
+                        fb = fc
+                    else:
+                        a = c
+                        fa = fc
+
+                    x_prev = x
+                    x = (a + b) / 2
+                    method_used = "Бисекция"
+            else:
+                c = (a + b) / 2
+                fc = self.f_eq(c)
+
+                if fa * fc < 0:
+                    b = c
+                    fb = fc
+                else:
+                    a = c
+                    fa = fc
+
+                x_prev = x
+                x = (a + b) / 2
+                method_used = "Бисекция"
+
+            if iterations > 0:
+                delta = abs(x - x_prev)
+                convergence_data.append((a, b, x, self.f_eq(x), method_used, delta))
+            else:
+                convergence_data.append((a, b, x, self.f_eq(x), method_used, None))
+
+            iterations += 1
+
+            if iterations > 1000:
+                break
+
+        return x, iterations, convergence_data
+
+    def compute_benchmark(self, test_equations, a, b, x0, precision_levels):
+        """Iteration counts and times of every method for each test equation"""
+        all_results = []
+
+        for eq_idx, equation in enumerate(test_equations):
+            # f_eq reads the core's expression, so each equation gets a core of its own
+            core = NumericalCore(**dict(self.expressions, equation=equation))
+            methods = [
+                ("Метод половинного деления", core.bisection_method),
+                ("Метод хорд", core.chord_method),
+                ("Метод Ньютона", core.newton_method),
+                ("Метод секущих", core.secant_method),
+                ("Гибридный метод", core.hybrid_method),
+            ]
+            equation_results = {"equation": equation, "methods": {}}
+            all_results.append(equation_results)
+
+            try:
+                fa = core.f_eq(a)
+                fb = core.f_eq(b)
+                equation_results["same_sign"] = fa * fb > 0
+            except Exception as e:
+                equation_results["error"] = str(e)
+                continue
+
+            for method_name, method in methods:
+                iterations_by_precision = []
+                times_by_precision = []
+
+                for eps in precision_levels:
+                    self.check_job(
+                        f"Сравнительный анализ: уравнение {eq_idx+1}, {method_name}, ε = {eps}"
+                    )
+                    try:
+                        start_time = time.time()
+
+                        if method_name in ["Метод Ньютона", "Метод секущих"]:
+                            root, iterations, _ = method(a, b, eps, x0)
+                        else:
+                            root, iterations, _ = method(a, b, eps)
+
+                        execution_time = time.time() - start_time
+
+                        iterations_by_precision.append(iterations)
+                        times_by_precision.append(execution_time)
+
+                    except Exception as e:
+                        iterations_by_precision.append("N/A")
+                        times_by_precision.append("N/A")
+
+                equation_results["methods"][method_name] = {
+                    "iterations": iterations_by_precision,
+                    "times": times_by_precision,
+                }
+
+        return all_results
+
+
+# Names of the difference formulas produced by compute_differentiation
+DIFFERENCE_FORMULAS = {
+    "left": "Левая разностная",
+    "right": "Правая разностная",
+    "central": "Центральная разностная",
+    "three_point": "Трехточечная",
+    "five_point": "Пятиточечная",
+}
+
+
+def integrate(
+    expression,
+    a,
+    b,
+    eps=1e-6,
+    method="simpson",
+    initial_n=4,
+    predictive=False,
+    gauss_order=5,
+):
+    """Integrate an expression in x over [a, b] with one method of the integration tab"""
+    if a >= b:
+        raise ValueError("Верхний предел должен быть больше нижнего")
+    if eps <= 0:
+        raise ValueError("Точность должна быть положительным числом")
+    if method == "all":
+        raise ValueError("Укажите один метод интегрирования")
+
+    core = NumericalCore(function=expression)
+    core.gauss_order = gauss_order
+    methods = core.integration_methods(method)
+    [(outcome, execution_time)] = core.compute_integration(
+        methods, a, b, eps, initial_n, predictive
+    )
+    I, count, error = outcome[0], outcome[1], outcome[2]
+
+    result = {"method": method, "value": float(I), "error": float(error)}
+    if methods[0][1] in (
+        core.gauss_kronrod_panel,
+        core.simpson_panel,
+        core.tanh_sinh_method,
+        core.clenshaw_curtis_method,
+        core.monte_carlo_method,
+    ):
+        result["evaluations"] = count
+    else:
+        result["n"] = count
+    result["time"] = execution_time
+    return result
+
+
+def integrate_multiple(
+    expression, limits, eps=1e-6, method="simpson", workers=1, gauss_order=5
+):
+    """Double or triple integral of an expression in x, y, z over a box
+    limits = [(a_x, b_x), (a_y, b_y)] or with a third pair for z"""
+    if eps <= 0:
+        raise ValueError("Точность должна быть положительным числом")
+    if method == "all":
+        raise ValueError("Укажите один метод интегрирования")
+
+    core = NumericalCore(multiple_function=expression)
+    core.gauss_order = gauss_order
+    limits = [tuple(map(float, pair)) for pair in limits]
+    try:
+        [(outcome, execution_time)] = core.compute_cubature(
+            core.cubature_methods(method), limits, eps, workers
+        )
+    finally:
+        core.shutdown_process_pool()
+    I, evaluations, error, _ = outcome
+    return {
+        "method": method,
+        "value": float(I),
+        "error": float(error),
+        "evaluations": evaluations,
+        "time": execution_time,
+    }
+
+
+def integrate_table(path, method="trapezoidal"):
+    """Integrate tabulated (x, y) data from a CSV or .npy file"""
+    if method not in ("trapezoidal", "simpson"):
+        raise ValueError("Для табличных данных доступны методы trapezoidal и simpson")
+
+    core = NumericalCore()
+    [(outcome, execution_time)] = core.compute_table_integration(
+        core.integration_methods(method), path
+    )
+    I, points, error, info = outcome
+    return {
+        "method": method,
+        "value": float(I),
+        "error": None if error is None else float(error),
+        "points": points,
+        "uniform": info["uniform"],
+        "time": execution_time,
+    }
+
+
+def integrate_intervals(expressions, limits, eps=1e-6, method="simpson", initial_n=4):
+    """integrate_batch for job files: lists of values, errors and n per expression"""
+    start_time = time.time()
+    values, errors, counts = integrate_batch(
+        expressions, limits, eps, method, initial_n
+    )
+    return {
+        "method": method,
+        "values": values.tolist(),
+        "errors": errors.tolist(),
+        "n": counts.tolist(),
+        "time": time.time() - start_time,
+    }
+
+
+def interpolate(points, x, method="newton", boundary="natural", slopes=(0.0, 0.0)):
+    """Value at x of the Lagrange or Newton polynomial or of the cubic spline
+    through (x_i, y_i) points; boundary and slopes only apply to the spline"""
+    if method not in ("lagrange", "newton", "spline"):
+        raise ValueError(f"Неизвестный метод интерполяции: {method}")
+    if len(slopes) != 2:
+        raise ValueError("Укажите две производные на концах: S'(a) S'(b)")
+
+    data = [tuple(map(float, point)) for point in points]
+    (
+        lagrange_result,
+        _,
+        newton_result,
+        _,
+        _,
+        spline,
+    ) = NumericalCore().compute_interpolation(
+        data,
+        x,
+        method,
+        detailed=False,
+        spline_boundary=boundary,
+        spline_slopes=tuple(map(float, slopes)),
+    )
+    if method == "spline":
+        value = spline[0]
+    else:
+        value = lagrange_result if method == "lagrange" else newton_result
+    return {"method": method, "value": float(value)}
+
+
+def approximate(expression, a, b, x, eps=1e-10):
+    """Value at x of the Chebyshev approximation of an expression on [a, b]"""
+    core = NumericalCore(interp_function=expression)
+    coefficients, samples, error, _, value, execution_time = (
+        core.compute_chebyshev_approximation(a, b, eps, x)
+    )
+    return {
+        "value": float(value),
+        "degree": len(coefficients) - 1,
+        "samples": samples,
+        "error": float(error),
+        "time": execution_time,
+    }
+
+
+def differentiate(
+    x, expression=None, points=None, h=0.1, order="first", method="central"
+):
+    """Derivative at x of an expression or of tabulated points, with the Runge-optimal step"""
+    if method not in DIFFERENCE_FORMULAS:
+        raise ValueError(f"Неизвестная разностная формула: {method}")
+
+    if points is None:
+        input_method = "analytic"
+        data = None
+    else:
+        input_method = "tabular"
+        data = sorted(tuple(map(float, point)) for point in points)
+        if x < data[0][0] or x > data[-1][0]:
+            raise ValueError(
+                "Точка x должна быть в пределах диапазона табличных данных"
+            )
+
+    core = NumericalCore(diff_function=expression)
+    outcome = core.compute_differentiation(x, h, order, input_method, data)
+    name = DIFFERENCE_FORMULAS[method]
+    if name not in outcome["best_derivative"]:
+        raise ValueError(f"Формула {method} недоступна для производной порядка {order}")
+
+    return {
+        "method": method,
+        "value": float(outcome["best_derivative"][name]),
+        "h": outcome["best_h"][name],
+        "error": float(outcome["best_error"][name]),
+        "reference": float(outcome["exact_derivative"]),
+    }
+
+
+def solve(expression, a, b, eps=1e-6, method="bisection", x0=None):
+    """Root of expression = 0 on [a, b] by one method of the equations tab"""
+    if a >= b:
+        raise ValueError("Правая граница должна быть больше левой")
+    if eps <= 0:
+        raise ValueError("Точность должна быть положительным числом")
+    if method == "all":
+        raise ValueError("Укажите один метод решения")
+    if x0 is None:
+        x0 = (a + b) / 2
+
+    core = NumericalCore(equation=expression)
+    [(_, root, iterations, execution_time, _)] = core.compute_equation(
+        core.equation_methods(method), a, b, eps, x0
+    )
+    return {
+        "method": method,
+        "root": float(root),
+        "residual": float(core.f_eq(root)),
+        "iterations": iterations,
+        "time": execution_time,
+    }
@@ -5,15 +5,73 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends.backend_pdf import PdfPages
-import time
-import sympy as sp
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tkmacosx import ColorVar
 
+from numerical_core import (
+    TRACE_LIMIT,
+    IncrementalNewtonInterpolant,
+    JobCancelled,
+    NumericalCore,
+    gauss_legendre_nodes,
+    load_table,
+)
 
-class NumericalMethodsApp:
+
+class ReportBuilder:
+    """Collects report text and writes it into a Text widget in one insert
+
+    The widget shows the text page by page, so the full text is also kept in
+    texts[widget] for saving."""
+
+    # Lines shown at once; the rest is revealed page by page on request
+    page_lines = 2000
+
+    def __init__(self, widget, texts):
+        self.widget = widget
+        self.texts = texts
+        self.parts = []
+
+    def insert(self, index, text):
+        # Same call shape as Text.insert; reports are only ever appended
+        self.parts.append(text)
+
+    def flush(self):
+        text = "".join(self.parts)
+        self.texts[self.widget] = text
+        lines = text.splitlines(keepends=True)
+        self.widget.delete(1.0, tk.END)
+        self.show(lines, 0)
+
+    def show(self, lines, start):
+        end = start + self.page_lines
+        self.widget.insert(tk.END, "".join(lines[start:end]))
+        if end >= len(lines):
+            return
+
+        tag = "show_more"
+        self.widget.insert(
+            tk.END,
+            f"▼ Показать ещё {min(self.page_lines, len(lines) - end)} "
+            f"из {len(lines) - end} строк\n",
+            tag,
+        )
+        self.widget.tag_configure(tag, foreground="#007AFF", underline=True)
+        self.widget.tag_bind(
+            tag, "<Button-1>", lambda event: self.show_more(lines, end)
+        )
+
+    def show_more(self, lines, start):
+        self.widget.delete("show_more.first", "show_more.last")
+        self.show(lines, start)
+
+
+class NumericalMethodsApp(NumericalCore):
     def __init__(self, root):
+        super().__init__()
         self.root = root
         self.root.title(
             "Численные методы: Интегрирование, Интерполяция, Дифференцирование, Уравнения"
@@ -50,6 +108,17 @@ class NumericalMethodsApp:
 
         self.theme = "light"
 
+        # Numeric work runs here so that the Tk event loop stays responsive
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.job = None
+        # Full text of each report; result widgets hold only the pages shown
+        self.report_texts = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.close_window)
+
+        # Newton interpolant kept up to date by the "Поток точек" controls
+        self.live_interpolant = None
+        self.live_points_text = None
+
     def load_text_file(self, filename):
         try:
             with open(filename, "r", encoding="utf-8") as file:
@@ -175,7 +244,7 @@ class NumericalMethodsApp:
         menu_bar.add_cascade(label="Файл", menu=file_menu)
         file_menu.add_command(label="Сохранить результаты", command=self.save_results)
         file_menu.add_separator()
-        file_menu.add_command(label="Выход", command=self.root.quit)
+        file_menu.add_command(label="Выход", command=self.close_window)
 
         view_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Смена темы", menu=view_menu)
@@ -191,6 +260,7 @@ class NumericalMethodsApp:
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         self.integration_frame = ttk.Frame(self.notebook, padding="10")
+        self.multiple_frame = ttk.Frame(self.notebook, padding="10")
         self.interpolation_frame = ttk.Frame(self.notebook, padding="10")
         self.differentiation_frame = ttk.Frame(
             self.notebook, padding="10"
@@ -202,6 +272,7 @@ class NumericalMethodsApp:
         self.help_frame = ttk.Frame(self.notebook, padding="10")
 
         self.notebook.add(self.integration_frame, text="Интегрирование ЛР №2")
+        self.notebook.add(self.multiple_frame, text="Кратные интегралы")
         self.notebook.add(self.interpolation_frame, text="Интерполяция ЛР №1")
         self.notebook.add(
             self.differentiation_frame, text="Дифференцирование ЛР №3"
@@ -213,6 +284,7 @@ class NumericalMethodsApp:
         self.notebook.add(self.help_frame, text="Справка о программе")
 
         self.setup_integration_tab()
+        self.setup_multiple_integration_tab()
         self.setup_interpolation_tab()
         self.setup_differentiation_tab()  # Setup for Lab 3
         self.setup_equations_tab()  # Setup for Lab 4
@@ -233,6 +305,11 @@ class NumericalMethodsApp:
         version_label = ttk.Label(status_frame, text="v1.0.0", padding=(10, 5))
         version_label.pack(side=tk.RIGHT)
 
+        self.cancel_button = ttk.Button(
+            status_frame, text="Отменить", command=self.cancel_job, state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.RIGHT)
+
     def setup_integration_tab(self):
         container_frame = ttk.Frame(self.integration_frame)
         container_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -290,6 +367,13 @@ class NumericalMethodsApp:
             ("Метод трапеций", "trapezoidal"),
             ("Метод Симпсона", "simpson"),
             ("Метод Ньютона-Котеса", "newton_cotes"),
+            ("Метод Ромберга", "romberg"),
+            ("Метод Гаусса-Лежандра", "gauss"),
+            ("Адаптивный метод Гаусса-Кронрода", "adaptive"),
+            ("Адаптивный метод Симпсона", "adaptive_simpson"),
+            ("Метод tanh-sinh", "tanh_sinh"),
+            ("Метод Кленшоу-Кертиса", "clenshaw_curtis"),
+            ("Метод Монте-Карло", "monte_carlo"),
         ]
 
         for i, (text, value) in enumerate(methods):
@@ -298,6 +382,42 @@ class NumericalMethodsApp:
             )
             rb.grid(row=i, column=0, sticky=tk.W, pady=2)
 
+        ttk.Label(input_frame, text="Узлов Гаусса:", style="Subtitle.TLabel").grid(
+            row=6, column=0, sticky=tk.W, pady=5
+        )
+        self.gauss_order_entry = ttk.Entry(input_frame, width=20, font=("SF Pro", 10))
+        self.gauss_order_entry.grid(row=6, column=1, sticky=(tk.W, tk.E), pady=5)
+        self.gauss_order_entry.insert(0, str(self.gauss_order))
+
+        self.detailed_trace_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            input_frame,
+            text="Подробный вывод по сегментам",
+            variable=self.detailed_trace_var,
+        ).grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
+
+        self.predictive_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            input_frame,
+            text="Прогноз числа отрезков по оценке Рунге",
+            variable=self.predictive_var,
+        ).grid(row=8, column=0, columnspan=2, sticky=tk.W, pady=5)
+
+        self.table_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            input_frame,
+            text="Табличные данные из файла (столбцы x, y; CSV или .npy)",
+            variable=self.table_var,
+        ).grid(row=9, column=0, columnspan=2, sticky=tk.W, pady=5)
+
+        table_frame = ttk.Frame(input_frame)
+        table_frame.grid(row=10, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+        self.table_path_entry = ttk.Entry(table_frame, width=40, font=("SF Pro", 10))
+        self.table_path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(table_frame, text="Обзор...", command=self.choose_table_file).pack(
+            side=tk.LEFT, padx=(5, 0)
+        )
+
         self.calculate_button = ttk.Button(
             input_frame,
             text="Вычислить",
@@ -305,7 +425,7 @@ class NumericalMethodsApp:
             style="Rounded.TButton",
         )
         self.calculate_button.grid(
-            row=6, column=0, columnspan=2, pady=(15, 0), sticky=(tk.W, tk.E)
+            row=11, column=0, columnspan=2, pady=(15, 0), sticky=(tk.W, tk.E)
         )
 
         output_frame = ttk.Frame(container_frame)
@@ -343,6 +463,131 @@ class NumericalMethodsApp:
         output_frame.rowconfigure(0, weight=1)
         output_frame.rowconfigure(1, weight=1)
 
+    def setup_multiple_integration_tab(self):
+        """Setup the tab of double and triple integrals over a box"""
+        container_frame = ttk.Frame(self.multiple_frame)
+        container_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        input_frame = ttk.LabelFrame(
+            container_frame, text="Входные данные", padding="15"
+        )
+        input_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
+
+        ttk.Label(
+            input_frame, text="Функция f(x, y, z):", style="Subtitle.TLabel"
+        ).grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        self.multiple_function_entry = ttk.Entry(
+            input_frame, width=40, font=("SF Pro", 10)
+        )
+        self.multiple_function_entry.grid(
+            row=0, column=1, sticky=(tk.W, tk.E), pady=(0, 5)
+        )
+        self.multiple_function_entry.insert(0, "exp(-x**2 - y**2)")
+
+        ttk.Label(
+            input_frame,
+            text="Пределы записываются как «a, b»; пустые пределы по z — двойной интеграл",
+            font=("SF Pro", 8),
+        ).grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(0, 15))
+
+        self.limits_entries = []
+        for row, (variable, default) in enumerate(
+            [("x", "0, 1"), ("y", "0, 1"), ("z", "")], start=2
+        ):
+            ttk.Label(
+                input_frame, text=f"Пределы по {variable}:", style="Subtitle.TLabel"
+            ).grid(row=row, column=0, sticky=tk.W, pady=5)
+            entry = ttk.Entry(input_frame, width=20, font=("SF Pro", 10))
+            entry.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=5)
+            entry.insert(0, default)
+            self.limits_entries.append(entry)
+
+        ttk.Label(input_frame, text="Точность (eps):", style="Subtitle.TLabel").grid(
+            row=5, column=0, sticky=tk.W, pady=5
+        )
+        self.multiple_eps_entry = ttk.Entry(input_frame, width=20, font=("SF Pro", 10))
+        self.multiple_eps_entry.grid(row=5, column=1, sticky=(tk.W, tk.E), pady=5)
+        self.multiple_eps_entry.insert(0, "1e-6")
+
+        ttk.Label(input_frame, text="Методы:", style="Subtitle.TLabel").grid(
+            row=6, column=0, sticky=tk.W, pady=5
+        )
+
+        multiple_methods_frame = ttk.Frame(input_frame)
+        multiple_methods_frame.grid(row=6, column=1, sticky=(tk.W, tk.E), pady=5)
+
+        self.multiple_method_var = tk.StringVar(value="all")
+        multiple_methods = [
+            ("Все методы", "all"),
+            ("Кубатура Симпсона", "simpson"),
+            ("Кубатура Гаусса-Лежандра", "gauss"),
+            ("Квази-Монте-Карло (Халтон)", "qmc"),
+            ("Метод Монте-Карло", "monte_carlo"),
+        ]
+
+        for i, (text, value) in enumerate(multiple_methods):
+            rb = ttk.Radiobutton(
+                multiple_methods_frame,
+                text=text,
+                value=value,
+                variable=self.multiple_method_var,
+            )
+            rb.grid(row=i, column=0, sticky=tk.W, pady=2)
+
+        ttk.Label(input_frame, text="Процессов:", style="Subtitle.TLabel").grid(
+            row=7, column=0, sticky=tk.W, pady=5
+        )
+        self.workers_entry = ttk.Entry(input_frame, width=20, font=("SF Pro", 10))
+        self.workers_entry.grid(row=7, column=1, sticky=(tk.W, tk.E), pady=5)
+        self.workers_entry.insert(0, "1")
+
+        self.multiple_button = ttk.Button(
+            input_frame,
+            text="Вычислить",
+            command=self.calculate_multiple_integration,
+            style="Rounded.TButton",
+        )
+        self.multiple_button.grid(
+            row=8, column=0, columnspan=2, pady=(15, 0), sticky=(tk.W, tk.E)
+        )
+
+        output_frame = ttk.Frame(container_frame)
+        output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.plot_frame_multiple = ttk.LabelFrame(
+            output_frame, text="Графики", padding="10"
+        )
+        self.plot_frame_multiple.grid(
+            row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10)
+        )
+
+        self.fig_multiple = Figure(figsize=(10, 8), dpi=100)
+        self.canvas_multiple = FigureCanvasTkAgg(
+            self.fig_multiple, master=self.plot_frame_multiple
+        )
+        self.canvas_multiple.draw()
+        self.canvas_multiple.get_tk_widget().pack(
+            fill=tk.BOTH, expand=True, padx=5, pady=5
+        )
+
+        results_frame = ttk.LabelFrame(
+            output_frame, text="Результаты вычислений", padding="10"
+        )
+        results_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.multiple_result_text = scrolledtext.ScrolledText(
+            results_frame, wrap=tk.WORD, width=80, height=20, font=("SF Mono", 9)
+        )
+        self.multiple_result_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self.multiple_frame.columnconfigure(0, weight=1)
+        self.multiple_frame.rowconfigure(0, weight=1)
+        container_frame.columnconfigure(1, weight=3)
+        container_frame.rowconfigure(0, weight=1)
+        output_frame.columnconfigure(0, weight=1)
+        output_frame.rowconfigure(0, weight=1)
+        output_frame.rowconfigure(1, weight=1)
+
     def setup_interpolation_tab(self):
         container_frame = ttk.Frame(self.interpolation_frame)
         container_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -389,6 +634,8 @@ class NumericalMethodsApp:
             ("Оба метода", "both"),
             ("Многочлен Лагранжа", "lagrange"),
             ("Многочлен Ньютона", "newton"),
+            ("Кубический сплайн", "spline"),
+            ("Аппроксимация Чебышёва f(x)", "chebyshev"),
         ]
 
         for i, (text, value) in enumerate(interp_methods):
@@ -400,13 +647,86 @@ class NumericalMethodsApp:
             )
             rb.grid(row=i, column=0, sticky=tk.W, pady=2)
 
+        spline_frame = ttk.LabelFrame(
+            input_frame, text="Краевые условия сплайна", padding="10"
+        )
+        spline_frame.grid(row=6, column=0, pady=(5, 0), sticky=(tk.W, tk.E))
+
+        self.spline_boundary_var = tk.StringVar(value="natural")
+        spline_boundaries = [
+            ("Естественный: S''(a) = S''(b) = 0", "natural"),
+            ("Закреплённый: заданы S'(a), S'(b)", "clamped"),
+            ("Not-a-knot: S''' непрерывна в x_1, x_(n-1)", "not_a_knot"),
+        ]
+        for i, (text, value) in enumerate(spline_boundaries):
+            ttk.Radiobutton(
+                spline_frame,
+                text=text,
+                value=value,
+                variable=self.spline_boundary_var,
+            ).grid(row=i, column=0, columnspan=2, sticky=tk.W, pady=2)
+
+        ttk.Label(spline_frame, text="S'(a) S'(b):").grid(
+            row=3, column=0, sticky=tk.W, pady=2
+        )
+        self.spline_slopes_entry = ttk.Entry(
+            spline_frame, width=15, font=("SF Pro", 10)
+        )
+        self.spline_slopes_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.spline_slopes_entry.insert(0, "0 0")
+
+        chebyshev_frame = ttk.LabelFrame(
+            input_frame, text="Аппроксимация Чебышёва", padding="10"
+        )
+        chebyshev_frame.grid(row=7, column=0, pady=(5, 0), sticky=(tk.W, tk.E))
+
+        chebyshev_fields = [
+            ("Функция f(x):", "chebyshev_function_entry", "exp(x)*sin(5*x)"),
+            ("Левый конец a:", "chebyshev_a_entry", "-1"),
+            ("Правый конец b:", "chebyshev_b_entry", "2"),
+            ("Точность ε:", "chebyshev_eps_entry", "1e-10"),
+        ]
+        for i, (text, name, default) in enumerate(chebyshev_fields):
+            ttk.Label(chebyshev_frame, text=text).grid(
+                row=i, column=0, sticky=tk.W, pady=2
+            )
+            entry = ttk.Entry(chebyshev_frame, width=15, font=("SF Pro", 10))
+            entry.grid(row=i, column=1, sticky=(tk.W, tk.E), pady=2)
+            entry.insert(0, default)
+            setattr(self, name, entry)
+
         self.interpolate_button = ttk.Button(
             input_frame,
             text="Интерполировать",
             command=self.calculate_interpolation,
             style="Rounded.TButton",
         )
-        self.interpolate_button.grid(row=6, column=0, pady=(15, 0), sticky=(tk.W, tk.E))
+        self.interpolate_button.grid(row=8, column=0, pady=(15, 0), sticky=(tk.W, tk.E))
+
+        stream_frame = ttk.LabelFrame(input_frame, text="Поток точек", padding="10")
+        stream_frame.grid(row=9, column=0, pady=(15, 0), sticky=(tk.W, tk.E))
+
+        ttk.Label(stream_frame, text="Новая точка (x y):").grid(
+            row=0, column=0, sticky=tk.W, pady=2
+        )
+        self.stream_point_entry = ttk.Entry(stream_frame, width=15, font=("SF Pro", 10))
+        self.stream_point_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.stream_point_entry.bind("<Return>", lambda event: self.add_stream_point())
+
+        ttk.Label(stream_frame, text="Окно (узлов):").grid(
+            row=1, column=0, sticky=tk.W, pady=2
+        )
+        self.stream_window_entry = ttk.Entry(
+            stream_frame, width=15, font=("SF Pro", 10)
+        )
+        self.stream_window_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2)
+
+        ttk.Button(
+            stream_frame, text="Добавить точку", command=self.add_stream_point
+        ).grid(row=2, column=0, pady=(5, 0), sticky=(tk.W, tk.E))
+        ttk.Button(
+            stream_frame, text="Удалить первую", command=self.drop_stream_point
+        ).grid(row=2, column=1, pady=(5, 0), sticky=(tk.W, tk.E))
 
         output_frame = ttk.Frame(container_frame)
         output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -823,6 +1143,7 @@ class NumericalMethodsApp:
             self.notebook.configure(style="Light.TNotebook")
             for tab in (
                 self.integration_frame,
+                self.multiple_frame,
                 self.interpolation_frame,
                 self.differentiation_frame,
                 self.equations_frame,
@@ -833,6 +1154,7 @@ class NumericalMethodsApp:
 
             # Update button styles
             self.calculate_button.configure(style="Light.TButton")
+            self.multiple_button.configure(style="Light.TButton")
             self.interpolate_button.configure(style="Light.TButton")
             self.differentiate_button.configure(style="Light.TButton")
             self.solve_equation_button.configure(style="Light.TButton")
@@ -849,6 +1171,7 @@ class NumericalMethodsApp:
             self.notebook.configure(style="Dark.TNotebook")
             for tab in (
                 self.integration_frame,
+                self.multiple_frame,
                 self.interpolation_frame,
                 self.differentiation_frame,
                 self.equations_frame,
@@ -858,6 +1181,7 @@ class NumericalMethodsApp:
                 tab.configure(style="Dark.TFrame")
 
             self.calculate_button.configure(style="Dark.TButton")
+            self.multiple_button.configure(style="Dark.TButton")
             self.interpolate_button.configure(style="Dark.TButton")
             self.differentiate_button.configure(style="Dark.TButton")
             self.solve_equation_button.configure(style="Dark.TButton")
@@ -868,6 +1192,7 @@ class NumericalMethodsApp:
     def update_plot_style(self):
         for fig_attr, canvas_attr in [
             ("fig_integration", "canvas_integration"),
+            ("fig_multiple", "canvas_multiple"),
             ("fig_interpolation", "canvas_interpolation"),
             ("fig_differentiation", "canvas_differentiation"),
             ("fig_equation", "canvas_equation"),
@@ -915,129 +1240,258 @@ class NumericalMethodsApp:
             self.diff_analytic_frame.grid_remove()
             self.diff_tabular_frame.grid()
 
-    def f(self, x):
-        function_str = self.function_entry.get().replace("ln(", "log(")
-        local_dict = {
-            "x": x,
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "exp": np.exp,
-            "log": np.log10,
-            "ln": np.log,
-            "log10": np.log10,
-            "sqrt": np.sqrt,
-            "abs": np.abs,
-            "pi": np.pi,
-            "e": np.e,
-        }
-        return eval(function_str, {"__builtins__": {}}, local_dict)
-
-    def f_diff(self, x):
-        """Evaluate the function for differentiation"""
-        function_str = self.diff_function_entry.get().replace("ln(", "log(")
-        local_dict = {
-            "x": x,
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "exp": np.exp,
-            "log": np.log10,
-            "ln": np.log,
-            "log10": np.log10,
-            "sqrt": np.sqrt,
-            "abs": np.abs,
-            "pi": np.pi,
-            "e": np.e,
-        }
-        return eval(function_str, {"__builtins__": {}}, local_dict)
-
-    def f_eq(self, x):
-        """Evaluate the function for equation solving"""
-        function_str = self.equation_entry.get().replace("ln(", "log(")
-        local_dict = {
-            "x": x,
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "exp": np.exp,
-            "log": np.log10,
-            "ln": np.log,
-            "log10": np.log10,
-            "sqrt": np.sqrt,
-            "abs": np.abs,
-            "pi": np.pi,
-            "e": np.e,
-        }
-        return eval(function_str, {"__builtins__": {}}, local_dict)
-
-    def df_eq(self, x):
-        """Calculate the derivative of the equation function using central difference"""
-        h = 1e-6
-        return (self.f_eq(x + h) - self.f_eq(x - h)) / (2 * h)
-
-    def trapezoidal_rule(self, a, b, n):
-        h = (b - a) / n
-        x = np.linspace(a, b, n + 1)
-        y = self.f(x)
-        return h * (0.5 * y[0] + 0.5 * y[-1] + np.sum(y[1:-1])), x, y
-
-    def simpson_rule(self, a, b, n):
-        if n % 2 != 0:
-            n += 1
-        h = (b - a) / n
-        x = np.linspace(a, b, n + 1)
-        y = self.f(x)
-        return (
-            h / 3 * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2])),
-            x,
-            y,
+    def job_running(self):
+        """Warn and return True while a job runs; handlers check it before reading input"""
+        if self.job is None:
+            return False
+        messagebox.showwarning(
+            "Предупреждение",
+            "Дождитесь завершения текущего вычисления или отмените его",
+        )
+        return True
+
+    def job_core(self, **expressions):
+        """A core holding the input of one job, so that edits made while it
+        runs never reach it"""
+        core = NumericalCore(**dict(self.expressions, **expressions))
+        core.gauss_order = self.gauss_order
+        # The worker processes outlive single jobs
+        core.process_pool = self.process_pool
+        core.process_pool_size = self.process_pool_size
+        return core
+
+    def run_job(self, core, status, compute, render, error_message, error_status):
+        """Run compute() on the job core off the Tk event loop, then render() its result"""
+        if self.job_running():
+            return
+
+        core.job_cancel = threading.Event()
+        core.job_progress = status
+        self.job_core_running = core
+        self.status_var.set(status)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.job = self.executor.submit(compute)
+        self.root.after(100, self.poll_job, render, error_message, error_status)
+
+    def poll_job(self, render, error_message, error_status):
+        core = self.job_core_running
+        if not self.job.done():
+            self.status_var.set(core.job_progress)
+            self.root.after(100, self.poll_job, render, error_message, error_status)
+            return
+
+        job, self.job = self.job, None
+        self.process_pool = core.process_pool
+        self.process_pool_size = core.process_pool_size
+        self.cancel_button.config(state=tk.DISABLED)
+        try:
+            outcome = job.result()
+            # Reports and plots evaluate the expressions the result came from
+            self.expressions = core.expressions
+            self.gauss_order = core.gauss_order
+            render(outcome)
+        except JobCancelled:
+            self.status_var.set("Вычисления отменены")
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"{error_message}: {str(e)}")
+            self.status_var.set(error_status)
+
+    def cancel_job(self):
+        """Stop the running job; its worker processes are killed, so the next
+        job starts a fresh pool"""
+        if self.job is not None:
+            self.job_core_running.job_cancel.set()
+            self.job_core_running.job_progress = "Отмена вычислений..."
+            self.job_core_running.shutdown_process_pool(wait=False, terminate=True)
+
+    def close_window(self):
+        """Stop the running job and the worker processes, then close the window"""
+        if self.job is not None:
+            self.job_core_running.job_cancel.set()
+            self.job_core_running.shutdown_process_pool(wait=False, terminate=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.shutdown_process_pool(wait=False, terminate=True)
+        self.root.destroy()
+
+    def report_adaptive_integration(
+        self, report, method_name, outcome, execution_time, eps
+    ):
+        """Print where the error budget of an adaptive quadrature went"""
+        I, evaluations, error, partition = outcome
+
+        widths = [right - left for left, right, _, _ in partition]
+        report.insert(
+            tk.END, "Адаптивное разбиение (очередь подынтервалов по погрешности)\n"
+        )
+        report.insert(tk.END, f"• Число подынтервалов: {len(partition)}\n")
+        report.insert(
+            tk.END,
+            f"• Минимальная длина: {min(widths):.6e}, максимальная: {max(widths):.6e}\n\n",
         )
 
-    def newton_cotes(self, a, b, n):
-        if n % 3 != 0:
-            n = 3 * (n // 3 + 1)
-        h = (b - a) / n
-        x = np.linspace(a, b, n + 1)
-        y = self.f(x)
+        report.insert(tk.END, "Подынтервалы с наибольшей погрешностью:\n")
+        for left, right, value, local_error in sorted(
+            partition, key=lambda item: item[3], reverse=True
+        )[:10]:
+            report.insert(
+                tk.END,
+                f"• [{left:.6f}, {right:.6f}]: I = {value:.10f}, погрешность = {local_error:.3e}\n",
+            )
 
-        result = 0
-        for i in range(0, n, 3):
-            if i + 3 <= n:
-                segment_result = (
-                    3 * h / 8 * (y[i] + 3 * y[i + 1] + 3 * y[i + 2] + y[i + 3])
-                )
-                result += segment_result
+        report.insert(tk.END, "\n🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+        report.insert(tk.END, f"• Значение интеграла: {I:.10f}\n")
+        report.insert(tk.END, f"• Оценка погрешности: {error:.10e}\n")
+        if error > eps:
+            report.insert(
+                tk.END,
+                f"• Точность {eps} не достигнута: разбиение остановлено "
+                f"на {len(partition)} подынтервалах\n",
+            )
+        report.insert(tk.END, f"• Вычислений функции: {evaluations}\n")
+        report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        return method_name, I, evaluations, error, execution_time, partition
+
+    def report_level_integration(
+        self, report, method_name, outcome, execution_time, parameter, eps
+    ):
+        """Print a quadrature refined level by level on nested point sets"""
+        I, evaluations, error, levels = outcome
+
+        for level, (step, level_evaluations, I_level, level_error) in enumerate(levels):
+            report.insert(tk.END, f"Уровень {level} ({parameter} = {step:g}):\n")
+            report.insert(tk.END, f"• Вычислений функции: {level_evaluations}\n")
+            report.insert(tk.END, f"• Значение интеграла: {I_level:.10f}\n")
+            if level_error is not None:
+                report.insert(tk.END, f"• Погрешность: {level_error:.10e}\n")
+            report.insert(tk.END, "\n")
+
+        report.insert(tk.END, "🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+        report.insert(tk.END, f"• Значение интеграла: {I:.10f}\n")
+        report.insert(tk.END, f"• Оценка погрешности: {error:.10e}\n")
+        if error > eps:
+            report.insert(
+                tk.END,
+                f"• Точность {eps} не достигнута за {len(levels)} уровней\n",
+            )
+        report.insert(tk.END, f"• Вычислений функции: {evaluations}\n")
+        report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        return method_name, I, evaluations, error, execution_time, levels
 
-        return result, x, y
+    def choose_table_file(self):
+        path = filedialog.askopenfilename(
+            filetypes=[("Таблицы", "*.csv *.txt *.npy"), ("Все файлы", "*.*")],
+            title="Табличные данные",
+        )
+        if path:
+            self.table_path_entry.delete(0, tk.END)
+            self.table_path_entry.insert(0, path)
+            self.table_var.set(True)
+
+    def calculate_table_integration(self):
+        if self.job_running():
+            return
+
+        try:
+            path = self.table_path_entry.get().strip()
+            if not path:
+                raise ValueError("Укажите файл с табличными данными")
+
+            core = self.job_core()
+            selected_method = self.method_var.get()
+            methods = core.integration_methods(selected_method)
+            if selected_method == "all":
+                methods = [
+                    (method_name, method)
+                    for method_name, method in methods
+                    if method in (core.trapezoidal_rule, core.simpson_rule)
+                ]
 
-    def runge_principle(self, I1, I2, p):
-        return abs(I2 - I1) / (2**p - 1)
+            self.run_job(
+                core,
+                "Чтение табличных данных...",
+                lambda: core.compute_table_integration(methods, path),
+                lambda outcomes: self.render_table_integration(methods, outcomes, path),
+                "Произошла ошибка при вычислениях",
+                "Ошибка вычислений",
+            )
 
-    def integrate(self, method, a, b, eps, initial_n):
-        n = initial_n
-        I1, x, y = method(a, b, n)
-        iterations = 1
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при вычислениях: {str(e)}"
+            )
+            self.status_var.set("Ошибка вычислений")
 
-        steps = []
-        steps.append((n, I1, x, y))
+    def render_table_integration(self, methods, outcomes, path):
+        """Write the report and plot of integrated tabulated data"""
+        report = ReportBuilder(self.result_text, self.report_texts)
+
+        report.insert(tk.END, "🔢 ИНТЕГРИРОВАНИЕ ТАБЛИЧНЫХ ДАННЫХ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        _, points, _, info = outcomes[0][0]
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Файл: {path}\n")
+        report.insert(tk.END, f"• Число точек: {points}\n")
+        report.insert(tk.END, f"• Интервал: [{info['a']}, {info['b']}]\n")
+        report.insert(
+            tk.END,
+            f"• Шаг: {'равномерный' if info['uniform'] else 'неравномерный'}\n",
+        )
+        report.insert(tk.END, "-" * 60 + "\n\n")
+
+        for (method_name, _), (outcome, execution_time) in zip(methods, outcomes):
+            I, points, error, _ = outcome
+            report.insert(tk.END, f"📊 {method_name.upper()}\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
+            report.insert(tk.END, "🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+            report.insert(tk.END, f"• Значение интеграла: {I:.10f}\n")
+            if error is None:
+                report.insert(tk.END, "• Оценка погрешности: недостаточно точек\n")
+            else:
+                report.insert(
+                    tk.END,
+                    f"• Оценка погрешности (по каждой второй точке): {error:.10e}\n",
+                )
+            report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+            report.insert(tk.END, "=" * 60 + "\n\n")
 
-        while True:
-            n *= 2
-            I2, x, y = method(a, b, n)
+        report.flush()
 
-            p = 4 if method in (self.simpson_rule, self.newton_cotes) else 2
-            error = self.runge_principle(I1, I2, p)
+        self.plot_table_integration(path)
 
-            steps.append((n, I2, x, y))
+        self.status_var.set("Вычисления завершены")
 
-            if error < eps or iterations > 15:
-                return I2, n, error, steps
+    def plot_table_integration(self, path):
+        self.fig_integration.clear()
 
-            I1 = I2
-            iterations += 1
+        x, y = load_table(path)
+        # Large tables are thinned to a few thousand points for drawing
+        step = max(1, len(x) // 2000)
+        x, y = np.asarray(x[::step]), np.asarray(y[::step])
+
+        ax = self.fig_integration.add_subplot(111)
+        ax.plot(x, y, "b-", linewidth=1.5, label="Табличные данные")
+        ax.fill_between(x, 0, y, alpha=0.3, color="blue")
+        ax.set_title("Табличные данные")
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.legend()
+        ax.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+
+        self.fig_integration.tight_layout(pad=1.5)
+        self.canvas_integration.draw()
 
     def calculate_integration(self):
+        if self.job_running():
+            return
+        if self.table_var.get():
+            self.calculate_table_integration()
+            return
+
         try:
             a = float(self.a_entry.get())
             b = float(self.b_entry.get())
@@ -1048,197 +1502,292 @@ class NumericalMethodsApp:
             if a >= b:
                 raise ValueError("Верхний предел должен быть больше нижнего")
 
+            core = self.job_core(function=self.function_entry.get())
+            if selected_method == "gauss":
+                core.gauss_order = int(self.gauss_order_entry.get())
+                if core.gauss_order < 1:
+                    raise ValueError("Число узлов Гаусса должно быть положительным")
+
             if eps <= 0:
                 raise ValueError("Точность должна быть положительным числом")
 
-            self.result_text.delete(1.0, tk.END)
-
-            self.result_text.insert(tk.END, "🔢 ЧИСЛЕННОЕ ИНТЕГРИРОВАНИЕ\n")
-            self.result_text.insert(tk.END, "=" * 60 + "\n\n")
+            predictive = self.predictive_var.get()
+            detailed_trace = self.detailed_trace_var.get()
+
+            methods = core.integration_methods(selected_method)
+
+            self.run_job(
+                core,
+                "Выполняются вычисления...",
+                lambda: core.compute_integration(
+                    methods, a, b, eps, initial_n, predictive
+                ),
+                # The report tells the methods apart by comparing with its own
+                lambda outcomes: self.render_integration(
+                    self.integration_methods(selected_method),
+                    outcomes,
+                    a,
+                    b,
+                    eps,
+                    initial_n,
+                    detailed_trace,
+                ),
+                "Произошла ошибка при вычислениях",
+                "Ошибка вычислений",
+            )
 
-            self.result_text.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
-            self.result_text.insert(tk.END, f"• Функция: {self.function_entry.get()}\n")
-            self.result_text.insert(tk.END, f"• Интервал: [{a}, {b}]\n")
-            self.result_text.insert(tk.END, f"• Требуемая точность: {eps}\n")
-            self.result_text.insert(tk.END, "-" * 60 + "\n\n")
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при вычислениях: {str(e)}"
+            )
+            self.status_var.set("Ошибка вычислений")
 
-            self.status_var.set("Выполняются вычисления...")
-            self.root.update()
+    def render_integration(
+        self, methods, outcomes, a, b, eps, initial_n, detailed_trace
+    ):
+        """Write the integration report and plots for finished results"""
+        report = ReportBuilder(self.result_text, self.report_texts)
 
-            methods = []
-            if selected_method == "all" or selected_method == "trapezoidal":
-                methods.append(("Метод трапеций", self.trapezoidal_rule))
-            if selected_method == "all" or selected_method == "simpson":
-                methods.append(("Метод Симпсона", self.simpson_rule))
-            if selected_method == "all" or selected_method == "newton_cotes":
-                methods.append(("Метод Ньютона-Котеса", self.newton_cotes))
+        report.insert(tk.END, "🔢 ЧИСЛЕННОЕ ИНТЕГРИРОВАНИЕ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
 
-            results = []
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Функция: {self.expressions['function']}\n")
+        report.insert(tk.END, f"• Интервал: [{a}, {b}]\n")
+        report.insert(tk.END, f"• Требуемая точность: {eps}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
 
-            for method_name, method in methods:
-                self.result_text.insert(tk.END, f"📊 {method_name.upper()}\n")
-                self.result_text.insert(tk.END, "-" * 60 + "\n\n")
+        results = []
 
-                self.result_text.insert(tk.END, "Шаг 1: Начальное разбиение\n")
-                n = initial_n
-                h = (b - a) / n
-                x = np.linspace(a, b, n + 1)
-                y = self.f(x)
+        for (method_name, method), (outcome, execution_time) in zip(methods, outcomes):
+            report.insert(tk.END, f"📊 {method_name.upper()}\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
 
-                self.result_text.insert(tk.END, f"• Число отрезков: {n}\n")
-                self.result_text.insert(
-                    tk.END, f"• Шаг h = (b-a)/n = ({b}-{a})/{n} = {h:.8f}\n\n"
+            if method in (self.gauss_kronrod_panel, self.simpson_panel):
+                results.append(
+                    self.report_adaptive_integration(
+                        report, method_name, outcome, execution_time, eps
+                    )
                 )
+                continue
 
-                self.result_text.insert(
-                    tk.END, "Шаг 2: Вычисление значений функции в узлах\n"
+            if method == self.tanh_sinh_method:
+                report.insert(
+                    tk.END,
+                    "Замена x = (a+b)/2 + (b-a)/2 * tanh(π/2 * sinh(t)), "
+                    "узлы t = k*h; концы отрезка не вычисляются\n\n",
                 )
-                for i in range(n + 1):
-                    self.result_text.insert(
-                        tk.END, f"• x[{i}] = {x[i]:.6f}, f(x[{i}]) = {y[i]:.6f}\n"
+                results.append(
+                    self.report_level_integration(
+                        report, method_name, outcome, execution_time, "h", eps
                     )
+                )
+                continue
 
-                start_time = time.time()
-
-                if method == self.trapezoidal_rule:
-                    I1 = h * (0.5 * y[0] + 0.5 * y[-1] + np.sum(y[1:-1]))
-                    self.result_text.insert(
-                        tk.END, "\nВычисление по формуле метода трапеций:\n"
-                    )
-                    self.result_text.insert(
-                        tk.END, f"I1 = h * (0.5 * f(a) + 0.5 * f(b) + сумма(f(x_i)))\n"
-                    )
-                    self.result_text.insert(
-                        tk.END,
-                        f"I1 = {h:.6f} * (0.5 * {y[0]:.6f} + 0.5 * {y[-1]:.6f} + {np.sum(y[1:-1]):.6f})\n",
-                    )
-                elif method == self.simpson_rule:
-                    if n % 2 != 0:
-                        n += 1
-                        h = (b - a) / n
-                        x = np.linspace(a, b, n + 1)
-                        y = self.f(x)
-                    I1 = (
-                        h
-                        / 3
-                        * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2]))
-                    )
-                    self.result_text.insert(
-                        tk.END, "\nВычисление по формуле метода Симпсона:\n"
-                    )
-                    self.result_text.insert(
-                        tk.END,
-                        f"I1 = h/3 * (f(a) + f(b) + 4*сумма(f(x_нечет)) + 2*сумма(f(x_чет)))\n",
-                    )
-                    self.result_text.insert(
-                        tk.END,
-                        f"I1 = {h:.6f}/3 * ({y[0]:.6f} + {y[-1]:.6f} + 4*{np.sum(y[1:-1:2]):.6f} + 2*{np.sum(y[2:-1:2]):.6f})\n",
+            if method == self.monte_carlo_method:
+                report.insert(
+                    tk.END,
+                    "Случайные точки по одной в каждой ячейке стратификации, антитетические пары u и 1 - u, "
+                    "контрольная переменная Σ(u_i - 1/2)²; погрешность — стандартная ошибка\n\n",
+                )
+                results.append(
+                    self.report_level_integration(
+                        report, method_name, outcome, execution_time, "точек", eps
                     )
-                else:
-                    if n % 3 != 0:
-                        n = 3 * (n // 3 + 1)
-                        h = (b - a) / n
-                        x = np.linspace(a, b, n + 1)
-                        y = self.f(x)
-                    I1 = 0
-                    self.result_text.insert(
-                        tk.END,
-                        "\nВычисление по формуле метода Ньютона-Котеса (правило 3/8):\n",
+                )
+                continue
+
+            if method == self.clenshaw_curtis_method:
+                report.insert(
+                    tk.END,
+                    "Узлы Чебышёва x_k = (a+b)/2 + (b-a)/2 * cos(kπ/N); веса через БПФ, "
+                    "при переходе N → 2N используются прежние значения функции\n\n",
+                )
+                results.append(
+                    self.report_level_integration(
+                        report, method_name, outcome, execution_time, "N", eps
                     )
-                    for i in range(0, n, 3):
-                        if i + 3 <= n:
-                            segment_result = (
-                                3
-                                * h
-                                / 8
-                                * (y[i] + 3 * y[i + 1] + 3 * y[i + 2] + y[i + 3])
-                            )
-                            self.result_text.insert(
-                                tk.END,
-                                f"Сегмент [{x[i]:.6f}, {x[i+3]:.6f}]: 3*{h:.6f}/8 * ({y[i]:.6f} + 3*{y[i+1]:.6f} + 3*{y[i+2]:.6f} + {y[i+3]:.6f}) = {segment_result:.10f}\n",
-                            )
-                            I1 += segment_result
+                )
+                continue
+
+            report.insert(tk.END, "Шаг 1: Начальное разбиение\n")
+            if method == self.gauss_legendre_rule:
+                n = 1
+                h = b - a
+                _, x, y = self.gauss_legendre_rule(a, b, n)
+            else:
+                n = initial_n
+                h = (b - a) / n
+                x = np.linspace(a, b, n + 1)
+                y = np.broadcast_to(self.f(x), x.shape)
+
+            report.insert(tk.END, f"• Число отрезков: {n}\n")
+            report.insert(tk.END, f"• Шаг h = (b-a)/n = ({b}-{a})/{n} = {h:.8f}\n\n")
+
+            report.insert(tk.END, "Шаг 2: Вычисление значений функции в узлах\n")
+            for i in range(len(x)):
+                report.insert(
+                    tk.END, f"• x[{i}] = {x[i]:.6f}, f(x[{i}]) = {y[i]:.6f}\n"
+                )
 
-                self.result_text.insert(
-                    tk.END, f"\nПервое приближение I1 = {I1:.10f}\n\n"
+            if method in (self.trapezoidal_rule, self.romberg_method):
+                I1 = h * (0.5 * y[0] + 0.5 * y[-1] + np.sum(y[1:-1]))
+                report.insert(tk.END, "\nВычисление по формуле метода трапеций:\n")
+                report.insert(
+                    tk.END, f"I1 = h * (0.5 * f(a) + 0.5 * f(b) + сумма(f(x_i)))\n"
+                )
+                report.insert(
+                    tk.END,
+                    f"I1 = {h:.6f} * (0.5 * {y[0]:.6f} + 0.5 * {y[-1]:.6f} + {np.sum(y[1:-1]):.6f})\n",
+                )
+            elif method == self.simpson_rule:
+                if n % 2 != 0:
+                    n += 1
+                    h = (b - a) / n
+                    x = np.linspace(a, b, n + 1)
+                    y = np.broadcast_to(self.f(x), x.shape)
+                I1 = (
+                    h
+                    / 3
+                    * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2]))
+                )
+                report.insert(tk.END, "\nВычисление по формуле метода Симпсона:\n")
+                report.insert(
+                    tk.END,
+                    f"I1 = h/3 * (f(a) + f(b) + 4*сумма(f(x_нечет)) + 2*сумма(f(x_чет)))\n",
+                )
+                report.insert(
+                    tk.END,
+                    f"I1 = {h:.6f}/3 * ({y[0]:.6f} + {y[-1]:.6f} + 4*{np.sum(y[1:-1:2]):.6f} + 2*{np.sum(y[2:-1:2]):.6f})\n",
+                )
+            elif method == self.gauss_legendre_rule:
+                _, weights = gauss_legendre_nodes(self.gauss_order)
+                I1 = h / 2 * np.dot(weights, y)
+                report.insert(
+                    tk.END,
+                    f"\nВычисление по квадратуре Гаусса-Лежандра ({self.gauss_order} узлов):\n",
+                )
+                report.insert(tk.END, "I1 = (b-a)/2 * сумма(w_i * f(x_i))\n")
+                report.insert(
+                    tk.END,
+                    f"I1 = {h:.6f}/2 * ("
+                    + " + ".join(f"{w:.6f}*{y_i:.6f}" for w, y_i in zip(weights, y))
+                    + ")\n",
+                )
+            else:
+                if n % 3 != 0:
+                    n = 3 * (n // 3 + 1)
+                    h = (b - a) / n
+                    x = np.linspace(a, b, n + 1)
+                    y = np.broadcast_to(self.f(x), x.shape)
+                segment_results = (
+                    3 * h / 8 * (y[0:-1:3] + 3 * y[1::3] + 3 * y[2::3] + y[3::3])
+                )
+                I1 = np.sum(segment_results)
+                report.insert(
+                    tk.END,
+                    "\nВычисление по формуле метода Ньютона-Котеса (правило 3/8):\n",
                 )
+                if detailed_trace:
+                    for k, segment_result in enumerate(segment_results[:TRACE_LIMIT]):
+                        i = 3 * k
+                        report.insert(
+                            tk.END,
+                            f"Сегмент [{x[i]:.6f}, {x[i+3]:.6f}]: 3*{h:.6f}/8 * ({y[i]:.6f} + 3*{y[i+1]:.6f} + 3*{y[i+2]:.6f} + {y[i+3]:.6f}) = {segment_result:.10f}\n",
+                        )
+                    if len(segment_results) > TRACE_LIMIT:
+                        report.insert(
+                            tk.END,
+                            f"... и ещё {len(segment_results) - TRACE_LIMIT} сегментов\n",
+                        )
+                else:
+                    report.insert(tk.END, f"Сумма {len(segment_results)} сегментов\n")
 
-                self.result_text.insert(
-                    tk.END, "Шаг 3: Уточнение результата (метод Рунге)\n"
+            report.insert(tk.END, f"\nПервое приближение I1 = {I1:.10f}\n\n")
+
+            if method == self.romberg_method:
+                report.insert(
+                    tk.END, "Шаг 3: Экстраполяция Ричардсона (метод Ромберга)\n"
                 )
-                iteration = 1
 
-                I2, final_n, error, steps = self.integrate(method, a, b, eps, n)
+                I2, final_n, error, steps = outcome
+
+                for k, row in enumerate(steps):
+                    report.insert(
+                        tk.END,
+                        f"R[{k}] (n = {n * 2**k}): "
+                        + " | ".join(f"{value:.10f}" for value in row)
+                        + "\n",
+                    )
+                    if k > 0:
+                        report.insert(
+                            tk.END,
+                            f"• Погрешность |R[{k}][{k}] - R[{k-1}][{k-1}]|: {abs(row[-1] - steps[k - 1][-1]):.10e}\n",
+                        )
+                report.insert(tk.END, "\n")
+            else:
+                report.insert(tk.END, "Шаг 3: Уточнение результата (метод Рунге)\n")
+                I2, final_n, error, steps = outcome
 
-                for i, (n_i, I_i, x_i, y_i) in enumerate(steps[1:], 1):
+                for i, step in enumerate(steps[1:], 1):
+                    n_i, I_i, error_i = step["n"], step["I"], step["error"]
                     h_i = (b - a) / n_i
-                    p = 4 if method in (self.simpson_rule, self.newton_cotes) else 2
-                    prev_I = steps[i - 1][1]
-                    error_i = self.runge_principle(prev_I, I_i, p)
 
-                    self.result_text.insert(tk.END, f"Итерация {i}:\n")
-                    self.result_text.insert(tk.END, f"• Число отрезков: {n_i}\n")
-                    self.result_text.insert(tk.END, f"• Шаг: {h_i:.10f}\n")
+                    report.insert(tk.END, f"Итерация {i}:\n")
+                    report.insert(tk.END, f"• Число отрезков: {n_i}\n")
+                    report.insert(tk.END, f"• Шаг: {h_i:.10f}\n")
 
                     if method == self.trapezoidal_rule:
-                        self.result_text.insert(
+                        report.insert(
                             tk.END,
-                            f"• I{i+1} = {h_i:.6f} * (0.5 * {y_i[0]:.6f} + 0.5 * {y_i[-1]:.6f} + {np.sum(y_i[1:-1]):.6f})\n",
+                            f"• I{i+1} = {h_i:.6f} * (0.5 * {step['f_a']:.6f} + 0.5 * {step['f_b']:.6f} + {step['sum_inner']:.6f})\n",
                         )
                     elif method == self.simpson_rule:
-                        self.result_text.insert(
+                        report.insert(
+                            tk.END,
+                            f"• I{i+1} = {h_i:.6f}/3 * ({step['f_a']:.6f} + {step['f_b']:.6f} + 4*{step['sum_odd']:.6f} + 2*{step['sum_even']:.6f})\n",
+                        )
+                    elif method == self.gauss_legendre_rule:
+                        report.insert(
                             tk.END,
-                            f"• I{i+1} = {h_i:.6f}/3 * ({y_i[0]:.6f} + {y_i[-1]:.6f} + 4*{np.sum(y_i[1:-1:2]):.6f} + 2*{np.sum(y_i[2:-1:2]):.6f})\n",
+                            f"• I{i+1} = сумма квадратур Гаусса по {n_i} отрезкам\n",
                         )
                     else:
-                        self.result_text.insert(
+                        report.insert(
                             tk.END, f"• I{i+1} = сумма сегментов по правилу 3/8\n"
                         )
 
-                    self.result_text.insert(
-                        tk.END, f"• Значение интеграла: {I_i:.10f}\n"
-                    )
-                    self.result_text.insert(
-                        tk.END, f"• Погрешность: {error_i:.10e}\n\n"
-                    )
-
-                execution_time = time.time() - start_time
+                    report.insert(tk.END, f"• Значение интеграла: {I_i:.10f}\n")
+                    report.insert(tk.END, f"• Погрешность: {error_i:.10e}\n\n")
 
-                self.result_text.insert(tk.END, "🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
-                self.result_text.insert(tk.END, f"• Значение интеграла: {I2:.10f}\n")
-                self.result_text.insert(
-                    tk.END, f"• Достигнутая точность: {error:.10e}\n"
-                )
-                self.result_text.insert(
-                    tk.END, f"• Потребовалось итераций: {len(steps)-1}\n"
-                )
-                self.result_text.insert(
-                    tk.END, f"• Финальное число отрезков: {final_n}\n"
-                )
-                self.result_text.insert(
-                    tk.END, f"• Время выполнения: {execution_time:.6f} сек\n"
-                )
-                self.result_text.insert(tk.END, "=" * 60 + "\n\n")
+            report.insert(tk.END, "🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+            report.insert(tk.END, f"• Значение интеграла: {I2:.10f}\n")
+            report.insert(tk.END, f"• Достигнутая точность: {error:.10e}\n")
+            report.insert(tk.END, f"• Потребовалось итераций: {len(steps)-1}\n")
+            report.insert(tk.END, f"• Финальное число отрезков: {final_n}\n")
+            report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+            report.insert(tk.END, "=" * 60 + "\n\n")
 
-                results.append((method_name, I2, final_n, error, execution_time, steps))
+            results.append((method_name, I2, final_n, error, execution_time, steps))
 
-            self.plot_integration_results(a, b, results)
+        report.flush()
 
-            self.status_var.set("Вычисления завершены")
+        self.plot_integration_results(a, b, results)
 
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка", f"Произошла ошибка при вычислениях: {str(e)}"
-            )
-            self.status_var.set("Ошибка вычислений")
+        self.status_var.set("Вычисления завершены")
 
     def plot_integration_results(self, a, b, results):
         self.fig_integration.clear()
 
         ax1 = self.fig_integration.add_subplot(221)
         x = np.linspace(a, b, 1000)
-        y = self.f(x)
-        ax1.plot(x, y, "b-", linewidth=2, label=f"f(x) = {self.function_entry.get()}")
+        with np.errstate(all="ignore"):
+            y = np.broadcast_to(self.f(x), x.shape)
+        # Endpoint singularities are left as gaps in the plot
+        y = np.where(np.isfinite(y), y, np.nan)
+        ax1.plot(
+            x, y, "b-", linewidth=2, label=f"f(x) = {self.expressions['function']}"
+        )
         ax1.fill_between(x, 0, y, alpha=0.3, color="blue")
         ax1.set_title("График функции")
         ax1.set_xlabel("x")
@@ -1252,7 +1801,7 @@ class NumericalMethodsApp:
             if trap_result:
                 n = min(20, trap_result[2])
                 x_trap = np.linspace(a, b, n + 1)
-                y_trap = self.f(x_trap)
+                y_trap = np.broadcast_to(self.f(x_trap), x_trap.shape)
                 ax2.plot(x, y, "b-", linewidth=1, alpha=0.5)
                 ax2.plot(x_trap, y_trap, "ro-", markersize=4)
                 for i in range(n):
@@ -1283,7 +1832,7 @@ class NumericalMethodsApp:
                 if n % 2 != 0:
                     n += 1
                 x_simp = np.linspace(a, b, n + 1)
-                y_simp = self.f(x_simp)
+                y_simp = np.broadcast_to(self.f(x_simp), x_simp.shape)
                 ax3.plot(x, y, "b-", linewidth=1, alpha=0.5)
                 ax3.plot(x_simp, y_simp, "go-", markersize=4)
                 for i in range(0, n, 2):
@@ -1348,232 +1897,604 @@ class NumericalMethodsApp:
         self.fig_integration.tight_layout()
         self.canvas_integration.draw()
 
-    def lagrange_polynomial(self, data, x):
-        n = len(data)
-        result = 0.0
+    def calculate_multiple_integration(self):
+        if self.job_running():
+            return
 
-        terms = []
-
-        for i in range(n):
-            term = data[i][1]
-            L_i = 1.0
+        try:
+            limits = []
+            for variable, entry in zip("xyz", self.limits_entries):
+                text = entry.get().strip()
+                if not text and variable == "z":
+                    continue
+                try:
+                    a, b = map(float, text.replace(";", ",").split(","))
+                except ValueError:
+                    raise ValueError(f"Пределы по {variable} записываются как «a, b»")
+                limits.append((a, b))
 
-            term_parts = []
-            for j in range(n):
-                if i != j:
-                    L_i *= (x - data[j][0]) / (data[i][0] - data[j][0])
-                    term_parts.append(
-                        f"(x - {data[j][0]:.4f}) / ({data[i][0]:.4f} - {data[j][0]:.4f})"
-                    )
+            eps = float(self.multiple_eps_entry.get())
+            if eps <= 0:
+                raise ValueError("Точность должна быть положительным числом")
+            workers = int(self.workers_entry.get())
+            if workers < 1:
+                raise ValueError("Число процессов должно быть положительным")
+
+            core = self.job_core(multiple_function=self.multiple_function_entry.get())
+            selected_method = self.multiple_method_var.get()
+            methods = core.cubature_methods(selected_method)
+
+            self.run_job(
+                core,
+                "Выполняются вычисления...",
+                lambda: core.compute_cubature(methods, limits, eps, workers),
+                lambda outcomes: self.render_multiple_integration(
+                    self.cubature_methods(selected_method), outcomes, limits, eps
+                ),
+                "Произошла ошибка при вычислениях",
+                "Ошибка вычислений",
+            )
 
-            term *= L_i
-            terms.append(f"{data[i][1]:.4f} * {' * '.join(term_parts)}")
-            result += term
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при вычислениях: {str(e)}"
+            )
+            self.status_var.set("Ошибка вычислений")
+
+    def render_multiple_integration(self, methods, outcomes, limits, eps):
+        """Write the report and plots of finished double or triple integrals"""
+        report = ReportBuilder(self.multiple_result_text, self.report_texts)
 
-        return result, terms
+        report.insert(tk.END, "🔢 КРАТНЫЙ ИНТЕГРАЛ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
 
-    def newton_polynomial(self, data, x):
-        n = len(data)
-        f = np.zeros((n, n))
-        for i in range(n):
-            f[i][0] = data[i][1]
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Функция: {self.expressions['multiple_function']}\n")
+        for variable, (a, b) in zip("xyz", limits):
+            report.insert(tk.END, f"• {variable} ∈ [{a}, {b}]\n")
+        report.insert(tk.END, f"• Требуемая точность: {eps}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
 
-        divided_diff = []
+        results = []
+        for (method_name, method), (outcome, execution_time) in zip(methods, outcomes):
+            report.insert(tk.END, f"📊 {method_name.upper()}\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
 
-        for j in range(1, n):
-            for i in range(n - j):
-                f[i][j] = (f[i + 1][j - 1] - f[i][j - 1]) / (
-                    data[i + j][0] - data[i][0]
+            if method == self.quasi_monte_carlo:
+                report.insert(
+                    tk.END,
+                    "Точки Халтона со случайными сдвигами по модулю 1; "
+                    "погрешность — стандартная ошибка среднего по сдвигам\n\n",
+                )
+                parameter = "точек"
+            elif method == self.monte_carlo:
+                report.insert(
+                    tk.END,
+                    "Случайные точки по одной в каждой ячейке стратификации, антитетические пары u и 1 - u, "
+                    "контрольная переменная Σ(u_i - 1/2)²; погрешность — стандартная ошибка\n\n",
+                )
+                parameter = "точек"
+            else:
+                report.insert(
+                    tk.END,
+                    "Тензорное произведение составных правил, n отрезков по каждой оси; "
+                    "погрешность по правилу Рунге\n\n",
+                )
+                parameter = "n"
+            results.append(
+                self.report_level_integration(
+                    report, method_name, outcome, execution_time, parameter, eps
                 )
-                divided_diff.append((i, j, f[i][j]))
+            )
+
+        report.flush()
+
+        self.plot_multiple_integration_results(limits, results)
 
-        result = f[0][0]
-        terms = [f"{f[0][0]:.4f}"]
+        self.status_var.set("Вычисления завершены")
 
-        for j in range(1, n):
-            term = f[0][j]
-            term_str = f"{f[0][j]:.4f}"
+    def plot_multiple_integration_results(self, limits, results):
+        self.fig_multiple.clear()
 
-            for i in range(j):
-                term *= x - data[i][0]
-                term_str += f" * (x - {data[i][0]:.4f})"
+        ax1 = self.fig_multiple.add_subplot(121)
+        (a_x, b_x), (a_y, b_y) = limits[:2]
+        x, y = np.meshgrid(np.linspace(a_x, b_x, 200), np.linspace(a_y, b_y, 200))
+        coordinates = [x, y]
+        if len(limits) == 3:
+            # A triple integral is shown by its slice through the middle of z
+            coordinates.append(np.full_like(x, sum(limits[2]) / 2))
+        with np.errstate(all="ignore"):
+            z = np.broadcast_to(self.f_multi(*coordinates), x.shape)
+        contour = ax1.contourf(x, y, np.where(np.isfinite(z), z, np.nan), levels=30)
+        self.fig_multiple.colorbar(contour, ax=ax1)
+        title = "f(x, y)" if len(limits) == 2 else "f(x, y, z) при z = (e+f)/2"
+        ax1.set_title(title)
+        ax1.set_xlabel("x")
+        ax1.set_ylabel("y")
 
-            terms.append(term_str)
-            result += term
+        ax2 = self.fig_multiple.add_subplot(122)
+        for method_name, _, _, _, _, levels in results:
+            points = [level[1] for level in levels if level[3]]
+            errors = [level[3] for level in levels if level[3]]
+            ax2.loglog(points, errors, "o-", label=method_name)
+        ax2.set_title("Сходимость")
+        ax2.set_xlabel("Вычислений функции на уровне")
+        ax2.set_ylabel("Оценка погрешности")
+        ax2.legend()
+        ax2.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
 
-        return result, terms, divided_diff
+        self.fig_multiple.tight_layout(pad=1.5)
+        self.canvas_multiple.draw()
 
     def calculate_interpolation(self):
+        if self.job_running():
+            return
+        if self.interp_method_var.get() == "chebyshev":
+            self.calculate_chebyshev_approximation()
+            return
+
         try:
             points_str = self.points_text.get("1.0", tk.END).strip().split("\n")
             data = [tuple(map(float, point.split())) for point in points_str]
             x_star = float(self.x_star_entry.get())
             selected_method = self.interp_method_var.get()
+            spline_boundary = self.spline_boundary_var.get()
+            spline_slopes = (0.0, 0.0)
+            if selected_method == "spline" and spline_boundary == "clamped":
+                spline_slopes = tuple(
+                    map(float, self.spline_slopes_entry.get().split())
+                )
+                if len(spline_slopes) != 2:
+                    raise ValueError("Укажите две производные на концах: S'(a) S'(b)")
+
+            core = self.job_core()
+            self.run_job(
+                core,
+                "Выполняется интерполяция...",
+                lambda: core.compute_interpolation(
+                    data,
+                    x_star,
+                    selected_method,
+                    spline_boundary=spline_boundary,
+                    spline_slopes=spline_slopes,
+                ),
+                lambda outcome: self.render_interpolation(
+                    data,
+                    x_star,
+                    selected_method,
+                    outcome,
+                    spline_boundary,
+                    spline_slopes,
+                ),
+                "Произошла ошибка при интерполяции",
+                "Ошибка интерполяции",
+            )
+
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при интерполяции: {str(e)}"
+            )
+            self.status_var.set("Ошибка интерполяции")
 
-            self.interpolation_result_text.delete(1.0, tk.END)
-            self.interpolation_result_text.insert(tk.END, "🔢 ИНТЕРПОЛЯЦИЯ\n")
-            self.interpolation_result_text.insert(tk.END, "=" * 60 + "\n\n")
+    def calculate_chebyshev_approximation(self):
+        if self.job_running():
+            return
 
-            self.interpolation_result_text.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
-            self.interpolation_result_text.insert(
-                tk.END,
-                f"• Узловые точки: {', '.join([f'({x:.2f}, {y:.2f})' for x, y in data])}\n",
+        try:
+            a = float(self.chebyshev_a_entry.get())
+            b = float(self.chebyshev_b_entry.get())
+            eps = float(self.chebyshev_eps_entry.get())
+            x_star = float(self.x_star_entry.get())
+
+            if a >= b:
+                raise ValueError("Правый конец отрезка должен быть больше левого")
+            if eps <= 0:
+                raise ValueError("Точность должна быть положительным числом")
+
+            core = self.job_core(interp_function=self.chebyshev_function_entry.get())
+            self.run_job(
+                core,
+                "Выполняется аппроксимация...",
+                lambda: core.compute_chebyshev_approximation(a, b, eps, x_star),
+                lambda outcome: self.render_chebyshev_approximation(
+                    a, b, eps, x_star, outcome
+                ),
+                "Произошла ошибка при интерполяции",
+                "Ошибка интерполяции",
             )
-            self.interpolation_result_text.insert(
-                tk.END, f"• Точка интерполяции x*: {x_star}\n"
+
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при интерполяции: {str(e)}"
+            )
+            self.status_var.set("Ошибка интерполяции")
+
+    def render_chebyshev_approximation(self, a, b, eps, x_star, outcome):
+        """Write the report and plots of a Chebyshev approximation"""
+        coefficients, samples, error, levels, value, execution_time = outcome
+        function_str = self.expressions["interp_function"]
+        degree = len(coefficients) - 1
+
+        report = ReportBuilder(self.interpolation_result_text, self.report_texts)
+        report.insert(tk.END, "🔢 АППРОКСИМАЦИЯ ЧЕБЫШЁВА\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Функция: f(x) = {function_str}\n")
+        report.insert(tk.END, f"• Отрезок: [{a}, {b}]\n")
+        report.insert(tk.END, f"• Точность: {eps}\n")
+        report.insert(tk.END, f"• Точка x*: {x_star}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
+
+        report.insert(
+            tk.END,
+            "Шаг 1: Значения f в точках x_k = (a+b)/2 + (b-a)/2·cos(πk/N), "
+            "коэффициенты c_j через ДКП (БПФ)\n",
+        )
+        header = "N | точек | степень | Σ|c_j|, j ≥ N/2"
+        report.insert(tk.END, header + "\n")
+        report.insert(tk.END, "-" * len(header) + "\n")
+        for N, points, level_degree, tail in levels:
+            report.insert(tk.END, f"{N} | {points} | {level_degree} | {tail:.6e}\n")
+
+        report.insert(
+            tk.END,
+            f"\nШаг 2: Ряд обрезан до степени {degree}: "
+            f"отброшенные Σ|c_j| = {error:.6e}\n",
+        )
+        report.insert(tk.END, "p(x) = Σ c_j·T_j(t), t = (2x - a - b)/(b - a)\n")
+        for j, c in enumerate(coefficients[:TRACE_LIMIT]):
+            report.insert(tk.END, f"c_{j} = {c: .10e}\n")
+        if len(coefficients) > TRACE_LIMIT:
+            report.insert(
+                tk.END, f"... и ещё {len(coefficients) - TRACE_LIMIT} коэффициентов\n"
+            )
+
+        report.insert(tk.END, f"\nШаг 3: Вычисление p({x_star}) по схеме Кленшоу\n\n")
+
+        report.insert(tk.END, "🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+        report.insert(tk.END, f"• p({x_star}) = {value:.15f}\n")
+        report.insert(tk.END, f"• Степень многочлена: {degree}\n")
+        report.insert(tk.END, f"• Вычислений функции: {samples}\n")
+        if levels[-1][3] < eps:
+            report.insert(tk.END, f"• Оценка погрешности на [a, b]: {error:.6e}\n")
+        else:
+            report.insert(
+                tk.END,
+                f"• Точность не достигнута, оценка погрешности: {error:.6e}\n",
             )
-            self.interpolation_result_text.insert(tk.END, "-" * 60 + "\n\n")
+        report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+
+        report.flush()
+
+        self.plot_chebyshev_approximation(
+            a, b, eps, x_star, coefficients, samples, value
+        )
+
+        self.status_var.set("Аппроксимация завершена")
 
-            self.status_var.set("Выполняется интерполяция...")
-            self.root.update()
+    def plot_chebyshev_approximation(
+        self, a, b, eps, x_star, coefficients, samples, value
+    ):
+        self.fig_interpolation.clear()
 
-            lagrange_result = None
-            newton_result = None
-            lagrange_terms = None
-            newton_terms = None
-            divided_diff = None
+        x = np.linspace(a, b, 2000)
+        y = np.broadcast_to(self.f_interp(x), x.shape)
+        p = self.chebyshev_evaluate(coefficients, a, b, x)
+        # The sampled points, thinned to a few hundred for drawing
+        N = samples - 1
+        k = np.arange(0, N + 1, max(1, N // 256))
+        nodes = (a + b) / 2 + (b - a) / 2 * np.cos(np.pi * k / N)
 
-            if selected_method in ["both", "lagrange"]:
-                self.interpolation_result_text.insert(tk.END, "📊 МНОГОЧЛЕН ЛАГРАНЖА\n")
-                self.interpolation_result_text.insert(tk.END, "-" * 60 + "\n\n")
+        ax1 = self.fig_interpolation.add_subplot(221)
+        ax1.plot(x, y, "b-", linewidth=2, label="f(x)")
+        ax1.plot(x, p, "g--", linewidth=2, label="Ряд Чебышёва")
+        ax1.plot(
+            nodes,
+            np.broadcast_to(self.f_interp(nodes), nodes.shape),
+            "ro",
+            markersize=4,
+            label="Точки Чебышёва",
+        )
+        ax1.plot(x_star, value, "g*", markersize=10, label="p(x*)")
+        ax1.set_title("Аппроксимация Чебышёва")
+        ax1.set_xlabel("x")
+        ax1.set_ylabel("y")
+        ax1.legend()
+        ax1.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+
+        ax2 = self.fig_interpolation.add_subplot(222)
+        # Zero values would be lost on the log scale
+        error = np.maximum(np.abs(y - p), np.finfo(float).tiny)
+        ax2.semilogy(x, error, "r-", linewidth=1.5, label="|f(x) - p(x)|")
+        ax2.axhline(eps, color="k", linestyle=":", label="ε")
+        ax2.set_title("Погрешность аппроксимации")
+        ax2.set_xlabel("x")
+        ax2.set_ylabel("|f(x) - p(x)|")
+        ax2.legend()
+        ax2.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+
+        ax3 = self.fig_interpolation.add_subplot(212)
+        magnitude = np.maximum(np.abs(coefficients), np.finfo(float).tiny)
+        ax3.semilogy(np.arange(len(coefficients)), magnitude, "m.-", label="|c_j|")
+        ax3.axhline(eps, color="k", linestyle=":", label="ε")
+        ax3.set_title("Коэффициенты Чебышёва")
+        ax3.set_xlabel("j")
+        ax3.set_ylabel("|c_j|")
+        ax3.legend()
+        ax3.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+
+        self.fig_interpolation.tight_layout()
+        self.canvas_interpolation.draw()
+
+    def stream_interpolant(self):
+        """The live Newton interpolant; rebuilt only if the nodes, x* or window were
+        changed by hand since the last streamed point"""
+        x_star = float(self.x_star_entry.get())
+        window = self.stream_window_entry.get().strip()
+        window = int(window) if window else None
+        if window is not None and window < 1:
+            raise ValueError("Окно должно содержать хотя бы один узел")
+
+        points_text = self.points_text.get("1.0", tk.END).strip()
+        live = self.live_interpolant
+        if (
+            live is None
+            or live.x_star != x_star
+            or live.window != window
+            or points_text != self.live_points_text
+        ):
+            lines = [line for line in points_text.split("\n") if line.strip()]
+            live = IncrementalNewtonInterpolant(x_star, window)
+            for line in lines:
+                live.append(*map(float, line.split()))
+            self.live_interpolant = live
+
+            # With a window only the newest lines remain nodes
+            self.points_text.delete("1.0", tk.END)
+            self.points_text.insert(tk.END, "\n".join(lines[len(lines) - len(live) :]))
+            self.live_points_text = self.points_text.get("1.0", tk.END).strip()
+        return live
+
+    def report_stream_value(self):
+        live = self.live_interpolant
+        self.live_points_text = self.points_text.get("1.0", tk.END).strip()
+        self.status_var.set(
+            f"Поток точек: узлов {len(live)}, N({live.x_star}) = {live.value:.10f}"
+        )
+
+    def add_stream_point(self):
+        try:
+            point = self.stream_point_entry.get().split()
+            x, y = map(float, point)
+            live = self.stream_interpolant()
+            count = len(live)
+            live.append(x, y)
+
+            if len(live) == count:
+                self.points_text.delete("1.0", "2.0")
+            separator = "\n" if len(live) > 1 else ""
+            self.points_text.insert(tk.END, separator + " ".join(point))
+            self.stream_point_entry.delete(0, tk.END)
+            self.report_stream_value()
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось добавить точку: {str(e)}")
+            self.status_var.set("Ошибка интерполяции")
+
+    def drop_stream_point(self):
+        try:
+            self.stream_interpolant().drop_oldest()
+            self.points_text.delete("1.0", "2.0")
+            self.report_stream_value()
+
+        except Exception as e:
+            messagebox.showerror("Ошибка", f"Не удалось удалить точку: {str(e)}")
+            self.status_var.set("Ошибка интерполяции")
 
-                self.interpolation_result_text.insert(
-                    tk.END, "Шаг 1: Вычисление базисных полиномов\n"
+    def render_interpolation(
+        self,
+        data,
+        x_star,
+        selected_method,
+        outcome,
+        spline_boundary="natural",
+        spline_slopes=(0.0, 0.0),
+    ):
+        """Write the interpolation report and plots for finished results"""
+        (
+            lagrange_result,
+            lagrange_terms,
+            newton_result,
+            newton_terms,
+            divided_diff,
+            spline,
+        ) = outcome
+
+        report = ReportBuilder(self.interpolation_result_text, self.report_texts)
+        report.insert(tk.END, "🔢 ИНТЕРПОЛЯЦИЯ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(
+            tk.END,
+            f"• Узловые точки: {', '.join([f'({x:.2f}, {y:.2f})' for x, y in data])}\n",
+        )
+        report.insert(tk.END, f"• Точка интерполяции x*: {x_star}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
+
+        if selected_method in ["both", "lagrange"]:
+            report.insert(tk.END, "📊 МНОГОЧЛЕН ЛАГРАНЖА\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
+
+            report.insert(tk.END, "Шаг 1: Вычисление базисных полиномов\n")
+            # Each basis polynomial has n - 1 factors, so all of them take O(n²)
+            n = len(data)
+            if n > TRACE_LIMIT:
+                report.insert(
+                    tk.END,
+                    "L_i(x) = Π (x - x_j) / (x_i - x_j) по j ≠ i; "
+                    f"узлов больше {TRACE_LIMIT}, множители не выписываются\n",
                 )
-                for i in range(len(data)):
-                    self.interpolation_result_text.insert(tk.END, f"L_{i}(x) = ")
+            else:
+                for i in range(n):
+                    report.insert(tk.END, f"L_{i}(x) = ")
                     terms = []
-                    for j in range(len(data)):
+                    for j in range(n):
                         if i != j:
                             terms.append(
                                 f"(x - {data[j][0]:.4f}) / ({data[i][0]:.4f} - {data[j][0]:.4f})"
                             )
-                    self.interpolation_result_text.insert(
-                        tk.END, " * ".join(terms) + "\n"
-                    )
-
-                self.interpolation_result_text.insert(
-                    tk.END, "\nШаг 2: Построение многочлена Лагранжа\n"
-                )
-                self.interpolation_result_text.insert(tk.END, "L(x) = ")
-                terms = [f"{data[i][1]:.4f} * L_{i}(x)" for i in range(len(data))]
-                self.interpolation_result_text.insert(
-                    tk.END, " + ".join(terms) + "\n\n"
-                )
-
-                lagrange_result, lagrange_terms = self.lagrange_polynomial(data, x_star)
-                self.interpolation_result_text.insert(
-                    tk.END, f"Шаг 3: Вычисление значения в точке x* = {x_star}\n"
-                )
-                self.interpolation_result_text.insert(
-                    tk.END, "L(x*) = " + " + ".join(lagrange_terms) + "\n"
-                )
-                self.interpolation_result_text.insert(
-                    tk.END, f"L({x_star}) = {lagrange_result:.10f}\n\n"
-                )
-
-            if selected_method in ["both", "newton"]:
-                self.interpolation_result_text.insert(tk.END, "📊 МНОГОЧЛЕН НЬЮТОНА\n")
-                self.interpolation_result_text.insert(tk.END, "-" * 60 + "\n\n")
-
-                self.interpolation_result_text.insert(
-                    tk.END, "Шаг 1: Вычисление разделенных разностей\n"
-                )
-                newton_result, newton_terms, divided_diff = self.newton_polynomial(
-                    data, x_star
+                    report.insert(tk.END, " * ".join(terms) + "\n")
+
+            report.insert(tk.END, "\nШаг 2: Построение многочлена Лагранжа\n")
+            report.insert(tk.END, "L(x) = ")
+            terms = [f"{data[i][1]:.4f} * L_{i}(x)" for i in range(min(n, TRACE_LIMIT))]
+            if n > TRACE_LIMIT:
+                terms.append(f"... (ещё {n - TRACE_LIMIT} слагаемых)")
+            report.insert(tk.END, " + ".join(terms) + "\n\n")
+
+            report.insert(tk.END, f"Шаг 3: Вычисление значения в точке x* = {x_star}\n")
+            terms = lagrange_terms[:TRACE_LIMIT]
+            if n > TRACE_LIMIT:
+                terms.append(f"... (ещё {n - TRACE_LIMIT} слагаемых)")
+            report.insert(tk.END, "L(x*) = " + " + ".join(terms) + "\n")
+            report.insert(tk.END, f"L({x_star}) = {lagrange_result:.10f}\n\n")
+
+        if selected_method in ["both", "newton"]:
+            report.insert(tk.END, "📊 МНОГОЧЛЕН НЬЮТОНА\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
+
+            report.insert(tk.END, "Шаг 1: Вычисление разделенных разностей\n")
+            n = len(data)
+            if n > TRACE_LIMIT:
+                report.insert(
+                    tk.END,
+                    f"Узлов больше {TRACE_LIMIT}, таблица не строится; "
+                    "коэффициенты c_j = f[x_0,...,x_j]:\n",
                 )
-
-                self.interpolation_result_text.insert(
-                    tk.END, "Таблица разделенных разностей:\n"
+                report.insert(tk.END, f"c_0 = f[x0] = {data[0][1]:.6f}\n")
+                for i, j, val in divided_diff[: TRACE_LIMIT - 1]:
+                    report.insert(tk.END, f"c_{j} = f[x0,...,x{j}] = {val:.6f}\n")
+                report.insert(tk.END, f"... и ещё {n - TRACE_LIMIT} коэффициентов\n")
+
+                report.insert(tk.END, "\nШаг 2: Построение многочлена Ньютона\n")
+                report.insert(
+                    tk.END, "N(x) = Σ c_j * (x - x_0) * ... * (x - x_(j-1))\n\n"
                 )
-                n = len(data)
-                f = np.zeros((n, n))
-                for i in range(n):
-                    f[i][0] = data[i][1]
+            else:
+                report.insert(tk.END, "Таблица разделенных разностей:\n")
+                table = {(i, j): value for i, j, value in divided_diff}
 
                 header = "i | x_i | f[x_i]"
                 for j in range(1, n):
-                    header += f" | f[x_i,...,x_{i+j}]"
-                self.interpolation_result_text.insert(tk.END, header + "\n")
-                self.interpolation_result_text.insert(tk.END, "-" * len(header) + "\n")
+                    header += f" | f[x_i,...,x_(i+{j})]"
+                report.insert(tk.END, header + "\n")
+                report.insert(tk.END, "-" * len(header) + "\n")
 
                 for i in range(n):
-                    row = f"{i} | {data[i][0]:.4f} | {f[i][0]:.6f}"
+                    row = f"{i} | {data[i][0]:.4f} | {data[i][1]:.6f}"
                     for j in range(1, n):
                         if i < n - j:
-                            row += f" | {f[i][j]:.6f}"
+                            row += f" | {table[i, j]:.6f}"
                         else:
                             row += " | -"
-                    self.interpolation_result_text.insert(tk.END, row + "\n")
+                    report.insert(tk.END, row + "\n")
 
-                self.interpolation_result_text.insert(
-                    tk.END, "\nРазделенные разности первого порядка:\n"
-                )
+                report.insert(tk.END, "\nРазделенные разности первого порядка:\n")
                 for i, j, val in divided_diff:
                     if j == 1:
-                        self.interpolation_result_text.insert(
+                        report.insert(
                             tk.END,
                             f"f[x{i},x{i+1}] = (f[x{i+1}] - f[x{i}]) / (x{i+1} - x{i}) = ",
                         )
-                        self.interpolation_result_text.insert(
+                        report.insert(
                             tk.END,
                             f"({data[i+1][1]:.6f} - {data[i][1]:.6f}) / ({data[i+1][0]:.6f} - {data[i][0]:.6f}) = {val:.6f}\n",
                         )
 
-                self.interpolation_result_text.insert(
-                    tk.END, "\nРазделенные разности высших порядков:\n"
-                )
+                report.insert(tk.END, "\nРазделенные разности высших порядков:\n")
                 for i, j, val in divided_diff:
                     if j > 1:
-                        self.interpolation_result_text.insert(
+                        report.insert(
                             tk.END,
                             f"f[x{i},...,x{i+j}] = (f[x{i+1},...,x{i+j}] - f[x{i},...,x{i+j-1}]) / (x{i+j} - x{i}) = {val:.6f}\n",
                         )
 
-                self.interpolation_result_text.insert(
-                    tk.END, "\nШаг 2: Построение многочлена Ньютона\n"
-                )
-                self.interpolation_result_text.insert(
-                    tk.END, "N(x) = " + " + ".join(newton_terms) + "\n\n"
-                )
+                report.insert(tk.END, "\nШаг 2: Построение многочлена Ньютона\n")
+                report.insert(tk.END, "N(x) = " + " + ".join(newton_terms) + "\n\n")
 
-                self.interpolation_result_text.insert(
-                    tk.END, f"Шаг 3: Вычисление значения в точке x* = {x_star}\n"
-                )
-                self.interpolation_result_text.insert(
-                    tk.END, f"N({x_star}) = {newton_result:.10f}\n\n"
-                )
+            report.insert(tk.END, f"Шаг 3: Вычисление значения в точке x* = {x_star}\n")
+            report.insert(tk.END, f"N({x_star}) = {newton_result:.10f}\n\n")
 
-            if selected_method == "both":
-                self.interpolation_result_text.insert(
-                    tk.END, "🎯 СРАВНЕНИЕ РЕЗУЛЬТАТОВ:\n"
-                )
-                self.interpolation_result_text.insert(tk.END, "-" * 60 + "\n")
-                self.interpolation_result_text.insert(
+        if selected_method == "both":
+            report.insert(tk.END, "🎯 СРАВНЕНИЕ РЕЗУЛЬТАТОВ:\n")
+            report.insert(tk.END, "-" * 60 + "\n")
+            report.insert(
+                tk.END,
+                f"• Многочлен Лагранжа: L({x_star}) = {lagrange_result:.10f}\n",
+            )
+            report.insert(
+                tk.END, f"• Многочлен Ньютона: N({x_star}) = {newton_result:.10f}\n"
+            )
+            report.insert(
+                tk.END,
+                f"• Разница |L(x*) - N(x*)|: {abs(lagrange_result - newton_result):.10e}\n",
+            )
+
+        if spline is not None:
+            spline_value, nodes, coefficients = spline
+            boundary = {
+                "natural": "естественный, S''(a) = S''(b) = 0",
+                "clamped": "закреплённый, S'(a) = {:g}, S'(b) = {:g}".format(
+                    *spline_slopes
+                ),
+                "not_a_knot": "not-a-knot, S''' непрерывна в x_1 и x_(n-1)",
+            }[spline_boundary]
+
+            report.insert(tk.END, "📊 КУБИЧЕСКИЙ СПЛАЙН\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
+            report.insert(tk.END, f"Краевые условия: {boundary}\n\n")
+            report.insert(
+                tk.END,
+                "Шаг 1: Прогонка трёхдиагональной системы для c_i = S''(x_i)/2\n",
+            )
+            report.insert(
+                tk.END,
+                "Шаг 2: S(x) = a_i + b_i*t + c_i*t^2 + d_i*t^3, t = x - x_i на [x_i, x_(i+1)]\n",
+            )
+
+            header = "i | [x_i, x_(i+1)] | a_i | b_i | c_i | d_i"
+            report.insert(tk.END, header + "\n")
+            report.insert(tk.END, "-" * len(header) + "\n")
+            for i, (a, b, c, d) in enumerate(coefficients[:TRACE_LIMIT]):
+                report.insert(
                     tk.END,
-                    f"• Многочлен Лагранжа: L({x_star}) = {lagrange_result:.10f}\n",
+                    f"{i} | [{nodes[i]:.4f}, {nodes[i + 1]:.4f}] | {a:.6f} | "
+                    f"{b:.6f} | {c:.6f} | {d:.6f}\n",
                 )
-                self.interpolation_result_text.insert(
-                    tk.END, f"• Многочлен Ньютона: N({x_star}) = {newton_result:.10f}\n"
-                )
-                self.interpolation_result_text.insert(
+            if len(coefficients) > TRACE_LIMIT:
+                report.insert(
                     tk.END,
-                    f"• Разница |L(x*) - N(x*)|: {abs(lagrange_result - newton_result):.10e}\n",
+                    f"... и ещё {len(coefficients) - TRACE_LIMIT} интервалов\n",
                 )
 
-            self.plot_interpolation_results(
-                data, x_star, lagrange_result, newton_result
+            report.insert(
+                tk.END, f"\nШаг 3: Вычисление значения в точке x* = {x_star}\n"
             )
+            report.insert(tk.END, f"S({x_star}) = {spline_value:.10f}\n\n")
 
-            self.status_var.set("Интерполяция завершена")
+        report.flush()
 
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка", f"Произошла ошибка при интерполяции: {str(e)}"
-            )
-            self.status_var.set("Ошибка интерполяции")
+        self.plot_interpolation_results(
+            data, x_star, lagrange_result, newton_result, spline
+        )
+
+        self.status_var.set("Интерполяция завершена")
 
-    def plot_interpolation_results(self, data, x_star, lagrange_result, newton_result):
+    def plot_interpolation_results(
+        self, data, x_star, lagrange_result, newton_result, spline=None
+    ):
         self.fig_interpolation.clear()
 
         ax1 = self.fig_interpolation.add_subplot(221)
@@ -1585,9 +2506,7 @@ class NumericalMethodsApp:
         y_newton = None
 
         if lagrange_result is not None:
-            y_lagrange = np.array(
-                [self.lagrange_polynomial(data, xi)[0] for xi in x_interp]
-            )
+            y_lagrange = self.barycentric_lagrange(data, x_interp)
             ax1.plot(
                 x_interp, y_lagrange, "b-", linewidth=2, label="Многочлен Лагранжа"
             )
@@ -1600,9 +2519,7 @@ class NumericalMethodsApp:
             )
 
         if newton_result is not None:
-            y_newton = np.array(
-                [self.newton_polynomial(data, xi)[0] for xi in x_interp]
-            )
+            y_newton = self.newton_polynomial(data, x_interp, detailed=False)[0]
             ax1.plot(x_interp, y_newton, "g--", linewidth=2, label="Многочлен Ньютона")
             ax1.plot(
                 x_star,
@@ -1612,6 +2529,33 @@ class NumericalMethodsApp:
                 label="Интерполяция (Ньютон)",
             )
 
+        if spline is not None:
+            spline_value, nodes, coefficients = spline
+            ax1.plot(
+                x_interp,
+                self.spline_evaluate(nodes, coefficients, x_interp),
+                "m-",
+                linewidth=2,
+                label="Кубический сплайн",
+            )
+            ax1.plot(
+                x_star, spline_value, "m*", markersize=10, label="Интерполяция (сплайн)"
+            )
+
+            # S'' is continuous and linear between nodes, so its node values
+            # show the whole curve and the end conditions
+            ax2 = self.fig_interpolation.add_subplot(222)
+            a, b, c, d = coefficients[-1]
+            second = 2 * np.append(
+                coefficients[:, 2], c + 3 * d * (nodes[-1] - nodes[-2])
+            )
+            ax2.plot(nodes, second, "m-o", linewidth=2, label="S''(x)")
+            ax2.set_title("Вторая производная сплайна")
+            ax2.set_xlabel("x")
+            ax2.set_ylabel("S''(x)")
+            ax2.legend()
+            ax2.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+
         ax1.plot(x, y, "ro", markersize=8, label="Узловые точки")
         ax1.set_title("Интерполяция")
         ax1.set_xlabel("x")
@@ -1631,30 +2575,39 @@ class NumericalMethodsApp:
 
         if lagrange_result is not None:
             ax3 = self.fig_interpolation.add_subplot(223)
-            for i in range(len(data)):
-                y_basis = [1.0 if j == i else 0.0 for j in range(len(data))]
-                basis_data = list(zip(x, y_basis))
-                basis_poly = np.array(
-                    [self.lagrange_polynomial(basis_data, xi)[0] for xi in x_interp]
+            basis = self.lagrange_basis(x, x_interp)
+            for i in range(min(len(data), TRACE_LIMIT)):
+                ax3.plot(x_interp, basis[:, i], label=f"L_{i}(x)")
+            if len(data) > TRACE_LIMIT:
+                ax3.set_title(
+                    f"Базисные функции Лагранжа (первые {TRACE_LIMIT} из {len(data)})"
                 )
-                ax3.plot(x_interp, basis_poly, label=f"L_{i}(x)")
-            ax3.set_title("Базисные функции Лагранжа")
+            else:
+                ax3.set_title("Базисные функции Лагранжа")
             ax3.set_xlabel("x")
             ax3.set_ylabel("L_i(x)")
             ax3.legend()
             ax3.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
 
-        if newton_result is not None:
+        if newton_result is not None and len(data) > TRACE_LIMIT:
+            # The n × n table is not drawn for many nodes, only its row i = 0
+            ax4 = self.fig_interpolation.add_subplot(224)
+            coefficients = self.divided_differences(x, y)
+            ax4.semilogy(np.abs(coefficients), "g-o", markersize=3, label="|c_j|")
+            ax4.set_title("Коэффициенты многочлена Ньютона")
+            ax4.set_xlabel("j")
+            ax4.set_ylabel("|f[x_0,...,x_j]|")
+            ax4.legend()
+            ax4.grid(True, linestyle="-", linewidth=0.5, alpha=0.7)
+        elif newton_result is not None:
             ax4 = self.fig_interpolation.add_subplot(224)
             n = len(data)
+            entries = []
+            self.divided_differences(x, y, entries)
             divided_diff = np.zeros((n, n))
-            for i in range(n):
-                divided_diff[i][0] = data[i][1]
-            for j in range(1, n):
-                for i in range(n - j):
-                    divided_diff[i][j] = (
-                        divided_diff[i + 1][j - 1] - divided_diff[i][j - 1]
-                    ) / (data[i + j][0] - data[i][0])
+            divided_diff[:, 0] = y
+            for i, j, value in entries:
+                divided_diff[i, j] = value
 
             im = ax4.imshow(divided_diff, cmap="viridis", aspect="auto")
             ax4.set_title("Таблица разделенных разностей")
@@ -1672,6 +2625,9 @@ class NumericalMethodsApp:
 
     def calculate_differentiation(self):
         """Calculate numerical differentiation (Lab 3)"""
+        if self.job_running():
+            return
+
         try:
             h = float(self.diff_h_entry.get())
             eps = float(self.diff_eps_entry.get())
@@ -1680,26 +2636,8 @@ class NumericalMethodsApp:
 
             if input_method == "analytic":
                 x = float(self.diff_x_entry.get())
-                function_str = self.diff_function_entry.get()
-                x_sym = sp.Symbol("x")
-                f_sym = sp.sympify(function_str.replace("^", "**"))
-                if derivative_order == "first":
-                    df_sym = sp.diff(f_sym, x_sym)
-                    exact_derivative = float(df_sym.subs(x_sym, x))
-                else:
-                    df_sym = sp.diff(f_sym, x_sym, 2)
-                    exact_derivative = float(df_sym.subs(x_sym, x))
-
-                x_range = np.linspace(x - 2, x + 2, 1000)
-                y_range = np.array([self.f_diff(xi) for xi in x_range])
-
-                data = [
-                    (x - 2 * h, self.f_diff(x - 2 * h)),
-                    (x - h, self.f_diff(x - h)),
-                    (x, self.f_diff(x)),
-                    (x + h, self.f_diff(x + h)),
-                    (x + 2 * h, self.f_diff(x + 2 * h)),
-                ]
+                core = self.job_core(diff_function=self.diff_function_entry.get())
+                data = None
             else:
                 points_str = (
                     self.diff_points_text.get("1.0", tk.END).strip().split("\n")
@@ -1708,296 +2646,137 @@ class NumericalMethodsApp:
                 data.sort(key=lambda point: point[0])
 
                 x = float(self.diff_tabular_x_entry.get())
+                core = self.job_core()
 
                 if x < data[0][0] or x > data[-1][0]:
                     raise ValueError(
                         "Точка x должна быть в пределах диапазона табличных данных"
                     )
 
-                x_data = np.array([point[0] for point in data])
-                y_data = np.array([point[1] for point in data])
-
-                poly = np.polyfit(x_data, y_data, len(data) - 1)
-                poly_derivative = np.polyder(
-                    poly, 1 if derivative_order == "first" else 2
-                )
-                exact_derivative = np.polyval(poly_derivative, x)
-
-                x_range = np.linspace(min(x_data), max(x_data), 1000)
-                y_range = np.polyval(poly, x_range)
-
-                function_str = "Табличная функция"
-
-            self.differentiation_result_text.delete(1.0, tk.END)
-            self.differentiation_result_text.insert(
-                tk.END, "🔢 ЧИСЛЕННОЕ ДИФФЕРЕНЦИРОВАНИЕ\n"
+            self.run_job(
+                core,
+                "Выполняется дифференцирование...",
+                lambda: core.compute_differentiation(
+                    x, h, derivative_order, input_method, data
+                ),
+                lambda outcome: self.render_differentiation(
+                    x, h, eps, derivative_order, input_method, outcome
+                ),
+                "Произошла ошибка при дифференцировании",
+                "Ошибка дифференцирования",
             )
-            self.differentiation_result_text.insert(tk.END, "=" * 60 + "\n\n")
 
-            self.differentiation_result_text.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
-            self.differentiation_result_text.insert(
-                tk.END, f"• Функция: {function_str}\n"
-            )
-            self.differentiation_result_text.insert(tk.END, f"• Точка x: {x}\n")
-            self.differentiation_result_text.insert(
-                tk.END,
-                f"• Порядок производной: {'Первый' if derivative_order == 'first' else 'Второй'}\n",
-            )
-            self.differentiation_result_text.insert(tk.END, f"• Начальный шаг h: {h}\n")
-            self.differentiation_result_text.insert(
-                tk.END, f"• Требуемая точность: {eps}\n"
-            )
-            self.differentiation_result_text.insert(tk.END, "-" * 60 + "\n\n")
-
-            self.status_var.set("Выполняется дифференцирование...")
-            self.root.update()
-
-            self.differentiation_result_text.insert(
-                tk.END, "Таблица значений функции:\n"
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при дифференцировании: {str(e)}"
             )
-            self.differentiation_result_text.insert(tk.END, "-" * 30 + "\n")
-            self.differentiation_result_text.insert(tk.END, "    x    |    f(x)    \n")
-            self.differentiation_result_text.insert(tk.END, "-" * 30 + "\n")
-
-            for x_val, y_val in data:
-                self.differentiation_result_text.insert(
-                    tk.END, f" {x_val:8.4f} | {y_val:10.6f}\n"
-                )
-
-            self.differentiation_result_text.insert(tk.END, "\n")
-
-            results = []
-
-            if derivative_order == "first":
-                formulas = [
-                    (
-                        "Левая разностная",
-                        lambda x, h: (self.f_diff(x) - self.f_diff(x - h)) / h,
-                    ),
-                    (
-                        "Правая разностная",
-                        lambda x, h: (self.f_diff(x + h) - self.f_diff(x)) / h,
-                    ),
-                    (
-                        "Центральная разностная",
-                        lambda x, h: (self.f_diff(x + h) - self.f_diff(x - h))
-                        / (2 * h),
-                    ),
-                    (
-                        "Трехточечная",
-                        lambda x, h: (
-                            -3 * self.f_diff(x)
-                            + 4 * self.f_diff(x + h)
-                            - self.f_diff(x + 2 * h)
-                        )
-                        / (2 * h),
-                    ),
-                ]
-
-                if input_method == "tabular":
-
-                    def tabular_f(x_val):
-                        for i, (xi, yi) in enumerate(data):
-                            if abs(xi - x_val) < 1e-10:
-                                return yi
-                        return np.interp(
-                            x_val, [p[0] for p in data], [p[1] for p in data]
-                        )
-
-                    formulas = [
-                        (
-                            "Левая разностная",
-                            lambda x, h: (tabular_f(x) - tabular_f(x - h)) / h,
-                        ),
-                        (
-                            "Правая разностная",
-                            lambda x, h: (tabular_f(x + h) - tabular_f(x)) / h,
-                        ),
-                        (
-                            "Центральная разностная",
-                            lambda x, h: (tabular_f(x + h) - tabular_f(x - h))
-                            / (2 * h),
-                        ),
-                        (
-                            "Трехточечная",
-                            lambda x, h: (
-                                -3 * tabular_f(x)
-                                + 4 * tabular_f(x + h)
-                                - tabular_f(x + 2 * h)
-                            )
-                            / (2 * h),
-                        ),
-                    ]
-            else:
-                formulas = [
-                    (
-                        "Центральная разностная",
-                        lambda x, h: (
-                            self.f_diff(x + h) - 2 * self.f_diff(x) + self.f_diff(x - h)
-                        )
-                        / (h**2),
-                    ),
-                    (
-                        "Пятиточечная",
-                        lambda x, h: (
-                            -self.f_diff(x + 2 * h)
-                            + 16 * self.f_diff(x + h)
-                            - 30 * self.f_diff(x)
-                            + 16 * self.f_diff(x - h)
-                            - self.f_diff(x - 2 * h)
-                        )
-                        / (12 * h**2),
-                    ),
-                ]
+            self.status_var.set("Ошибка дифференцирования")
 
-                if input_method == "tabular":
+    def render_differentiation(
+        self, x, h, eps, derivative_order, input_method, outcome
+    ):
+        """Write the differentiation report and plots for finished results"""
+        function_str = outcome["function_str"]
+        data = outcome["data"]
+        exact_derivative = outcome["exact_derivative"]
+        h_values = outcome["h_values"]
+        errors = outcome["errors"]
+        derivative_values = outcome["derivative_values"]
+        best_h = outcome["best_h"]
+        best_derivative = outcome["best_derivative"]
+        best_error = outcome["best_error"]
+
+        report = ReportBuilder(self.differentiation_result_text, self.report_texts)
+        report.insert(tk.END, "🔢 ЧИСЛЕННОЕ ДИФФЕРЕНЦИРОВАНИЕ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
+
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Функция: {function_str}\n")
+        report.insert(tk.END, f"• Точка x: {x}\n")
+        report.insert(
+            tk.END,
+            f"• Порядок производной: {'Первый' if derivative_order == 'first' else 'Второй'}\n",
+        )
+        report.insert(tk.END, f"• Начальный шаг h: {h}\n")
+        report.insert(tk.END, f"• Требуемая точность: {eps}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
+
+        report.insert(tk.END, "Таблица значений функции:\n")
+        report.insert(tk.END, "-" * 30 + "\n")
+        report.insert(tk.END, "    x    |    f(x)    \n")
+        report.insert(tk.END, "-" * 30 + "\n")
+
+        for x_val, y_val in data:
+            report.insert(tk.END, f" {x_val:8.4f} | {y_val:10.6f}\n")
+
+        report.insert(tk.END, "\n")
+
+        report.insert(tk.END, "Вычисление производной с разными шагами:\n")
+        report.insert(tk.END, "-" * 80 + "\n")
+        report.insert(
+            tk.END,
+            "Метод                  | Шаг h      | Значение производной | Погрешность\n",
+        )
+        report.insert(tk.END, "-" * 80 + "\n")
+
+        for i, current_h in enumerate(h_values):
+            for name in derivative_values:
+                derivative = derivative_values[name][i]
+                if np.isnan(derivative):
+                    report.insert(
+                        tk.END,
+                        f"{name:22} | {current_h:10.8f} | {'Ошибка вычисления':20} | {'N/A':10}\n",
+                    )
+                else:
+                    report.insert(
+                        tk.END,
+                        f"{name:22} | {current_h:10.8f} | {derivative:20.10f} | {errors[name][i]:10.8e}\n",
+                    )
 
-                    def tabular_f(x_val):
-                        for i, (xi, yi) in enumerate(data):
-                            if abs(xi - x_val) < 1e-10:
-                                return yi
-                        return np.interp(
-                            x_val, [p[0] for p in data], [p[1] for p in data]
-                        )
+            report.insert(tk.END, "-" * 80 + "\n")
 
-                    formulas = [
-                        (
-                            "Центральная разностная",
-                            lambda x, h: (
-                                tabular_f(x + h) - 2 * tabular_f(x) + tabular_f(x - h)
-                            )
-                            / (h**2),
-                        ),
-                        (
-                            "Пятиточечная",
-                            lambda x, h: (
-                                -tabular_f(x + 2 * h)
-                                + 16 * tabular_f(x + h)
-                                - 30 * tabular_f(x)
-                                + 16 * tabular_f(x - h)
-                                - tabular_f(x - 2 * h)
-                            )
-                            / (12 * h**2),
-                        ),
-                    ]
+        report.insert(tk.END, "\nОпределение оптимального шага по принципу Рунге:\n")
 
-            self.differentiation_result_text.insert(
-                tk.END, "Вычисление производной с разными шагами:\n"
-            )
-            self.differentiation_result_text.insert(tk.END, "-" * 80 + "\n")
-            self.differentiation_result_text.insert(
+        for name in best_derivative:
+            report.insert(
                 tk.END,
-                "Метод                  | Шаг h      | Значение производной | Погрешность\n",
+                f"{name}: оптимальный шаг h = {best_h[name]:.8f}, производная = {best_derivative[name]:.10f}, погрешность = {best_error[name]:.8e}\n",
             )
-            self.differentiation_result_text.insert(tk.END, "-" * 80 + "\n")
-
-            h_values = []
-            errors = {formula[0]: [] for formula in formulas}
-            derivative_values = {formula[0]: [] for formula in formulas}
-
-            current_h = h
-            for i in range(10):
-                h_values.append(current_h)
 
-                for name, formula in formulas:
-                    try:
-                        derivative = formula(x, current_h)
-                        error = abs(derivative - exact_derivative)
+        report.insert(tk.END, "\n🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n")
+        report.insert(tk.END, "-" * 60 + "\n")
 
-                        self.differentiation_result_text.insert(
-                            tk.END,
-                            f"{name:22} | {current_h:10.8f} | {derivative:20.10f} | {error:10.8e}\n",
-                        )
-
-                        errors[name].append(error)
-                        derivative_values[name].append(derivative)
-                    except Exception as e:
-                        self.differentiation_result_text.insert(
-                            tk.END,
-                            f"{name:22} | {current_h:10.8f} | {'Ошибка вычисления':20} | {'N/A':10}\n",
-                        )
-                        errors[name].append(np.nan)
-                        derivative_values[name].append(np.nan)
-
-                self.differentiation_result_text.insert(tk.END, "-" * 80 + "\n")
-                current_h /= 2
-
-            self.differentiation_result_text.insert(
-                tk.END, "\nОпределение оптимального шага по принципу Рунге:\n"
+        if input_method == "analytic":
+            report.insert(
+                tk.END, f"• Точное значение производной: {exact_derivative:.10f}\n"
             )
-
-            best_h = {}
-            best_derivative = {}
-            best_error = {}
-
-            for name, formula in formulas:
-                min_error = float("inf")
-                optimal_h = h
-                optimal_derivative = None
-
-                for i in range(len(h_values) - 1):
-                    if np.isnan(errors[name][i]) or np.isnan(errors[name][i + 1]):
-                        continue
-
-                    p = 1 if "Левая" in name or "Правая" in name else 2
-                    runge_error = abs(
-                        derivative_values[name][i + 1] - derivative_values[name][i]
-                    ) / (2**p - 1)
-
-                    if runge_error < min_error:
-                        min_error = runge_error
-                        optimal_h = h_values[i + 1]
-                        optimal_derivative = derivative_values[name][i + 1]
-
-                best_h[name] = optimal_h
-                best_derivative[name] = optimal_derivative
-                best_error[name] = min_error
-
-                self.differentiation_result_text.insert(
-                    tk.END,
-                    f"{name}: оптимальный шаг h = {optimal_h:.8f}, производная = {optimal_derivative:.10f}, погрешность = {min_error:.8e}\n",
-                )
-
-            self.differentiation_result_text.insert(
-                tk.END, "\n🎯 ИТОГОВЫЙ РЕЗУЛЬТАТ:\n"
+        else:
+            report.insert(
+                tk.END,
+                f"• Интерполированное значение производной: {exact_derivative:.10f}\n",
             )
-            self.differentiation_result_text.insert(tk.END, "-" * 60 + "\n")
-
-            if input_method == "analytic":
-                self.differentiation_result_text.insert(
-                    tk.END, f"• Точное значение производной: {exact_derivative:.10f}\n"
-                )
-            else:
-                self.differentiation_result_text.insert(
-                    tk.END,
-                    f"• Интерполированное значение производной: {exact_derivative:.10f}\n",
-                )
 
-            for name in best_derivative:
-                self.differentiation_result_text.insert(
-                    tk.END,
-                    f"• {name}: {best_derivative[name]:.10f} (h = {best_h[name]:.8f}, погрешность = {best_error[name]:.8e})\n",
-                )
-
-            self.plot_differentiation_results(
-                x,
-                x_range,
-                y_range,
-                derivative_order,
-                h_values,
-                errors,
-                derivative_values,
-                exact_derivative,
-                best_h,
+        for name in best_derivative:
+            report.insert(
+                tk.END,
+                f"• {name}: {best_derivative[name]:.10f} (h = {best_h[name]:.8f}, погрешность = {best_error[name]:.8e})\n",
             )
 
-            self.status_var.set("Дифференцирование завершено")
+        report.flush()
 
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка", f"Произошла ошибка при дифференцировании: {str(e)}"
-            )
-            self.status_var.set("Ошибка дифференцирования")
+        self.plot_differentiation_results(
+            x,
+            outcome["x_range"],
+            outcome["y_range"],
+            derivative_order,
+            h_values,
+            errors,
+            derivative_values,
+            exact_derivative,
+            best_h,
+        )
+
+        self.status_var.set("Дифференцирование завершено")
 
     def plot_differentiation_results(
         self,
@@ -2110,6 +2889,9 @@ class NumericalMethodsApp:
 
     def solve_equation(self):
         """Solve nonlinear equation using selected method(s)"""
+        if self.job_running():
+            return
+
         try:
             a = float(self.eq_a_entry.get())
             b = float(self.eq_b_entry.get())
@@ -2124,8 +2906,10 @@ class NumericalMethodsApp:
             if eps <= 0:
                 raise ValueError("Точность должна быть положительным числом")
 
-            fa = self.f_eq(a)
-            fb = self.f_eq(b)
+            core = self.job_core(equation=self.equation_entry.get())
+
+            fa = core.f_eq(a)
+            fb = core.f_eq(b)
 
             if fa * fb > 0 and selected_method in [
                 "all",
@@ -2138,384 +2922,123 @@ class NumericalMethodsApp:
                     "Функция имеет одинаковый знак на концах отрезка. Методы половинного деления, хорд и гибридный могут не сработать.",
                 )
 
-            self.equation_result_text.delete(1.0, tk.END)
-            self.equation_result_text.insert(
-                tk.END, "🔢 РЕШЕНИЕ НЕЛИНЕЙНОГО УРАВНЕНИЯ\n"
-            )
-            self.equation_result_text.insert(tk.END, "=" * 60 + "\n\n")
+            methods = core.equation_methods(selected_method)
 
-            self.equation_result_text.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
-            self.equation_result_text.insert(
-                tk.END, f"• Уравнение: {self.equation_entry.get()} = 0\n"
-            )
-            self.equation_result_text.insert(tk.END, f"• Интервал: [{a}, {b}]\n")
-            self.equation_result_text.insert(
-                tk.END, f"• Начальное приближение x₀: {x0}\n"
+            self.run_job(
+                core,
+                "Решение уравнения...",
+                lambda: core.compute_equation(methods, a, b, eps, x0),
+                lambda results: self.render_equation(a, b, eps, x0, results),
+                "Произошла ошибка при решении уравнения",
+                "Ошибка решения уравнения",
             )
-            self.equation_result_text.insert(tk.END, f"• Требуемая точность: {eps}\n")
-            self.equation_result_text.insert(tk.END, "-" * 60 + "\n\n")
-
-            self.status_var.set("Решение уравнения...")
-            self.root.update()
-
-            methods = []
-            if selected_method == "all" or selected_method == "bisection":
-                methods.append(("Метод половинного деления", self.bisection_method))
-            if selected_method == "all" or selected_method == "chord":
-                methods.append(("Метод хорд", self.chord_method))
-            if selected_method == "all" or selected_method == "newton":
-                methods.append(("Метод Ньютона", self.newton_method))
-            if selected_method == "all" or selected_method == "secant":
-                methods.append(("Метод секущих", self.secant_method))
-            if selected_method == "all" or selected_method == "hybrid":
-                methods.append(
-                    ("Гибридный метод Ньютона-половинного деления", self.hybrid_method)
-                )
 
-            results = []
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Произошла ошибка при решении уравнения: {str(e)}"
+            )
+            self.status_var.set("Ошибка решения уравнения")
 
-            for method_name, method in methods:
-                self.equation_result_text.insert(tk.END, f"📊 {method_name.upper()}\n")
-                self.equation_result_text.insert(tk.END, "-" * 60 + "\n\n")
+    def render_equation(self, a, b, eps, x0, results):
+        """Write the equation report and plots for finished results"""
+        report = ReportBuilder(self.equation_result_text, self.report_texts)
+        report.insert(tk.END, "🔢 РЕШЕНИЕ НЕЛИНЕЙНОГО УРАВНЕНИЯ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
 
-                start_time = time.time()
+        report.insert(tk.END, "📝 ВХОДНЫЕ ДАННЫЕ:\n")
+        report.insert(tk.END, f"• Уравнение: {self.expressions['equation']} = 0\n")
+        report.insert(tk.END, f"• Интервал: [{a}, {b}]\n")
+        report.insert(tk.END, f"• Начальное приближение x₀: {x0}\n")
+        report.insert(tk.END, f"• Требуемая точность: {eps}\n")
+        report.insert(tk.END, "-" * 60 + "\n\n")
 
-                if method_name == "Метод Ньютона" or method_name == "Метод секущих":
-                    root, iterations, convergence_data = method(a, b, eps, x0)
-                else:
-                    root, iterations, convergence_data = method(a, b, eps)
+        for method_name, root, iterations, execution_time, convergence_data in results:
+            report.insert(tk.END, f"📊 {method_name.upper()}\n")
+            report.insert(tk.END, "-" * 60 + "\n\n")
 
-                execution_time = time.time() - start_time
+            report.insert(tk.END, "Итерации:\n")
+            report.insert(tk.END, "-" * 80 + "\n")
 
-                self.equation_result_text.insert(tk.END, "Итерации:\n")
-                self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
+            if method_name == "Метод половинного деления":
+                report.insert(
+                    tk.END,
+                    "  k  |     a     |     b     |     c     |    f(c)    |   |b-a|   \n",
+                )
+                report.insert(tk.END, "-" * 80 + "\n")
 
-                if method_name == "Метод половинного деления":
-                    self.equation_result_text.insert(
+                for i, (a_i, b_i, c_i, fc_i, interval) in enumerate(convergence_data):
+                    report.insert(
                         tk.END,
-                        "  k  |     a     |     b     |     c     |    f(c)    |   |b-a|   \n",
+                        f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {c_i:9.6f} | {fc_i:10.6e} | {interval:9.6e}\n",
                     )
-                    self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
 
-                    for i, (a_i, b_i, c_i, fc_i, interval) in enumerate(
-                        convergence_data
-                    ):
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {c_i:9.6f} | {fc_i:10.6e} | {interval:9.6e}\n",
-                        )
+            elif method_name == "Метод хорд":
+                report.insert(
+                    tk.END,
+                    "  k  |     a     |     b     |     c     |    f(c)    |   |c-c_prev|   \n",
+                )
+                report.insert(tk.END, "-" * 80 + "\n")
 
-                elif method_name == "Метод хорд":
-                    self.equation_result_text.insert(
+                for i, (a_i, b_i, c_i, fc_i, delta) in enumerate(convergence_data):
+                    report.insert(
                         tk.END,
-                        "  k  |     a     |     b     |     c     |    f(c)    |   |c-c_prev|   \n",
+                        f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {c_i:9.6f} | {fc_i:10.6e} | {delta if i > 0 else 'N/A':15}\n",
                     )
-                    self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
 
-                    for i, (a_i, b_i, c_i, fc_i, delta) in enumerate(convergence_data):
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {c_i:9.6f} | {fc_i:10.6e} | {delta if i > 0 else 'N/A':15}\n",
-                        )
+            elif method_name == "Метод Ньютона":
+                report.insert(
+                    tk.END,
+                    "  k  |     x_k    |    f(x_k)   |   f'(x_k)   |   |x_k - x_{k-1}|   \n",
+                )
+                report.insert(tk.END, "-" * 80 + "\n")
 
-                elif method_name == "Метод Ньютона":
-                    self.equation_result_text.insert(
+                for i, (x_i, fx_i, dfx_i, delta) in enumerate(convergence_data):
+                    report.insert(
                         tk.END,
-                        "  k  |     x_k    |    f(x_k)   |   f'(x_k)   |   |x_k - x_{k-1}|   \n",
+                        f" {i:3d} | {x_i:10.6f} | {fx_i:11.6e} | {dfx_i:11.6e} | {delta if i > 0 else 'N/A':17}\n",
                     )
-                    self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
 
-                    for i, (x_i, fx_i, dfx_i, delta) in enumerate(convergence_data):
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f" {i:3d} | {x_i:10.6f} | {fx_i:11.6e} | {dfx_i:11.6e} | {delta if i > 0 else 'N/A':17}\n",
-                        )
+            elif method_name == "Метод секущих":
+                report.insert(
+                    tk.END,
+                    "  k  |    x_{k-1}   |     x_k     |    f(x_k)    |   |x_k - x_{k-1}|   \n",
+                )
+                report.insert(tk.END, "-" * 80 + "\n")
 
-                elif method_name == "Метод секущих":
-                    self.equation_result_text.insert(
+                for i, (x_prev, x_i, fx_i, delta) in enumerate(convergence_data):
+                    report.insert(
                         tk.END,
-                        "  k  |    x_{k-1}   |     x_k     |    f(x_k)    |   |x_k - x_{k-1}|   \n",
+                        f" {i:3d} | {x_prev:12.6f} | {x_i:12.6f} | {fx_i:12.6e} | {delta if i > 0 else 'N/A':17}\n",
                     )
-                    self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
 
-                    for i, (x_prev, x_i, fx_i, delta) in enumerate(convergence_data):
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f" {i:3d} | {x_prev:12.6f} | {x_i:12.6f} | {fx_i:12.6e} | {delta if i > 0 else 'N/A':17}\n",
-                        )
+            elif method_name == "Гибридный метод Ньютона-половинного деления":
+                report.insert(
+                    tk.END,
+                    "  k  |     a     |     b     |     x     |    f(x)    |   метод   |   |x_k - x_{k-1}|   \n",
+                )
+                report.insert(tk.END, "-" * 100 + "\n")
 
-                elif method_name == "Гибридный метод Ньютона-половинного деления":
-                    self.equation_result_text.insert(
+                for i, (a_i, b_i, x_i, fx_i, method_used, delta) in enumerate(
+                    convergence_data
+                ):
+                    report.insert(
                         tk.END,
-                        "  k  |     a     |     b     |     x     |    f(x)    |   метод   |   |x_k - x_{k-1}|   \n",
+                        f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {x_i:9.6f} | {fx_i:10.6e} | {method_used:9} | {delta if i > 0 else 'N/A':17}\n",
                     )
-                    self.equation_result_text.insert(tk.END, "-" * 100 + "\n")
-
-                    for i, (a_i, b_i, x_i, fx_i, method_used, delta) in enumerate(
-                        convergence_data
-                    ):
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f" {i:3d} | {a_i:9.6f} | {b_i:9.6f} | {x_i:9.6f} | {fx_i:10.6e} | {method_used:9} | {delta if i > 0 else 'N/A':17}\n",
-                        )
-
-                # Summary
-                self.equation_result_text.insert(tk.END, "\n🎯 РЕЗУЛЬТАТ:\n")
-                self.equation_result_text.insert(
-                    tk.END, f"• Корень уравнения: {root:.10f}\n"
-                )
-                self.equation_result_text.insert(
-                    tk.END, f"• Значение функции: {self.f_eq(root):.10e}\n"
-                )
-                self.equation_result_text.insert(
-                    tk.END, f"• Число итераций: {iterations}\n"
-                )
-                self.equation_result_text.insert(
-                    tk.END, f"• Время выполнения: {execution_time:.6f} сек\n"
-                )
-                self.equation_result_text.insert(tk.END, "=" * 60 + "\n\n")
-
-                results.append(
-                    (method_name, root, iterations, execution_time, convergence_data)
-                )
-
-            self.plot_equation_results(a, b, results)
-
-            self.status_var.set("Решение уравнения завершено")
-
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка", f"Произошла ошибка при решении уравнения: {str(e)}"
-            )
-            self.status_var.set("Ошибка решения уравнения")
-
-    def bisection_method(self, a, b, eps):
-        """Bisection method for solving nonlinear equations"""
-        fa = self.f_eq(a)
-        fb = self.f_eq(b)
-
-        if fa * fb > 0:
-            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
-
-        iterations = 0
-        convergence_data = []
-
-        while (b - a) > eps:
-            c = (a + b) / 2
-            fc = self.f_eq(c)
-
-            convergence_data.append((a, b, c, fc, b - a))
-
-            if abs(fc) < eps:
-                break
-
-            if fa * fc < 0:
-                b = c
-                fb = fc
-            else:
-                a = c
-                fa = fc
-
-            iterations += 1
-
-            if iterations > 1000:
-                break
-
-        root = (a + b) / 2
-        return root, iterations, convergence_data
-
-    def chord_method(self, a, b, eps):
-        """Chord method for solving nonlinear equations"""
-        fa = self.f_eq(a)
-        fb = self.f_eq(b)
-
-        if fa * fb > 0:
-            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
-
-        iterations = 0
-        c_prev = a
-        c = a - fa * (b - a) / (fb - fa)
-
-        convergence_data = [(a, b, c, self.f_eq(c), None)]
-
-        while abs(c - c_prev) > eps:
-            fc = self.f_eq(c)
-
-            if abs(fc) < eps:
-                break
-
-            if fa * fc < 0:
-                b = c
-                fb = fc
-            else:
-                a = c
-                fa = fc
-
-            c_prev = c
-            c = a - fa * (b - a) / (fb - fa)
-
-            convergence_data.append((a, b, c, self.f_eq(c), abs(c - c_prev)))
 
-            iterations += 1
+            # Summary
+            report.insert(tk.END, "\n🎯 РЕЗУЛЬТАТ:\n")
+            report.insert(tk.END, f"• Корень уравнения: {root:.10f}\n")
+            report.insert(tk.END, f"• Значение функции: {self.f_eq(root):.10e}\n")
+            report.insert(tk.END, f"• Число итераций: {iterations}\n")
+            report.insert(tk.END, f"• Время выполнения: {execution_time:.6f} сек\n")
+            report.insert(tk.END, "=" * 60 + "\n\n")
 
-            if iterations > 1000:
-                break
+        report.flush()
 
-        return c, iterations, convergence_data
+        self.plot_equation_results(a, b, results)
 
-    def newton_method(self, a, b, eps, x0):
-        """Newton's method for solving nonlinear equations"""
-        if x0 < a or x0 > b:
-            x0 = (a + b) / 2
-
-        iterations = 0
-        x = x0
-
-        convergence_data = []
-
-        while True:
-            fx = self.f_eq(x)
-            dfx = self.df_eq(x)
-
-            if abs(dfx) < 1e-10:
-                raise ValueError("Производная близка к нулю, метод Ньютона не сходится")
-
-            x_new = x - fx / dfx
-
-            if iterations > 0:
-                delta = abs(x_new - x)
-                convergence_data.append((x, fx, dfx, delta))
-            else:
-                convergence_data.append((x, fx, dfx, None))
-
-            if abs(x_new - x) < eps or abs(fx) < eps:
-                x = x_new
-                break
-
-            x = x_new
-            iterations += 1
-
-            if iterations > 1000:
-                break
-
-            if x < a or x > b:
-                raise ValueError(f"Решение вышло за пределы отрезка [{a}, {b}]")
-
-        return x, iterations, convergence_data
-
-    def secant_method(self, a, b, eps, x0):
-        """Secant method for solving nonlinear equations"""
-        if x0 < a or x0 > b:
-            x0 = (a + b) / 2
-
-        iterations = 0
-        x_prev = x0
-        x = x0 + 0.1 * abs(x0)
-
-        if x < a or x > b:
-            x = x0 - 0.1 * abs(x0)
-
-        convergence_data = [(x_prev, x, self.f_eq(x), None)]
-
-        while True:
-            fx_prev = self.f_eq(x_prev)
-            fx = self.f_eq(x)
-
-            if abs(fx - fx_prev) < 1e-10:
-                raise ValueError(
-                    "Разность значений функции близка к нулю, метод секущих не сходится"
-                )
-
-            x_new = x - fx * (x - x_prev) / (fx - fx_prev)
-
-            delta = abs(x_new - x)
-            convergence_data.append((x, x_new, self.f_eq(x_new), delta))
-
-            if delta < eps or abs(fx) < eps:
-                x = x_new
-                break
-
-            x_prev = x
-            x = x_new
-            iterations += 1
-
-            if iterations > 1000:
-                break
-
-            if x < a or x > b:
-                raise ValueError(f"Решение вышло за пределы отрезка [{a}, {b}]")
-
-        return x, iterations, convergence_data
-
-    def hybrid_method(self, a, b, eps):
-        """Hybrid Newton-bisection method for solving nonlinear equations"""
-        fa = self.f_eq(a)
-        fb = self.f_eq(b)
-
-        if fa * fb > 0:
-            raise ValueError("Функция должна иметь разные знаки на концах отрезка")
-
-        iterations = 0
-        x = (a + b) / 2
-
-        convergence_data = [(a, b, x, self.f_eq(x), "Бисекция", None)]
-
-        while (b - a) > eps:
-            fx = self.f_eq(x)
-
-            if abs(fx) < eps:
-                break
-
-            dfx = self.df_eq(x)
-
-            if abs(dfx) > 1e-10:
-                x_newton = x - fx / dfx
-
-                if a <= x_newton <= b and abs(x_newton - x) < 0.5 * (b - a):
-                    x_prev = x
-                    x = x_newton
-                    method_used = "Ньютон"
-                else:
-                    c = (a + b) / 2
-                    fc = self.f_eq(c)
-
-                    if fa * fc < 0:
-                        b = c
-                        fb = fc
-                    else:
-                        a = c
-                        fa = fc
-
-                    x_prev = x
-                    x = (a + b) / 2
-                    method_used = "Бисекция"
-            else:
-                c = (a + b) / 2
-                fc = self.f_eq(c)
-
-                if fa * fc < 0:
-                    b = c
-                    fb = fc
-                else:
-                    a = c
-                    fa = fc
-
-                x_prev = x
-                x = (a + b) / 2
-                method_used = "Бисекция"
-
-            if iterations > 0:
-                delta = abs(x - x_prev)
-                convergence_data.append((a, b, x, self.f_eq(x), method_used, delta))
-            else:
-                convergence_data.append((a, b, x, self.f_eq(x), method_used, None))
-
-            iterations += 1
-
-            if iterations > 1000:
-                break
-
-        return x, iterations, convergence_data
+        self.status_var.set("Решение уравнения завершено")
 
     def plot_equation_results(self, a, b, results):
         """Plot equation solving results"""
@@ -2612,6 +3135,9 @@ class NumericalMethodsApp:
 
     def benchmark_equation_methods(self):
         """Benchmark equation solving methods with different precision levels"""
+        if self.job_running():
+            return
+
         try:
             a = float(self.eq_a_entry.get())
             b = float(self.eq_b_entry.get())
@@ -2626,137 +3152,102 @@ class NumericalMethodsApp:
                 "x**2/5 + x/4 - ln(x)/4 - 1",
             ]
 
-            self.equation_result_text.delete(1.0, tk.END)
-            self.equation_result_text.insert(
-                tk.END, "🔢 СРАВНИТЕЛЬНЫЙ АНАЛИЗ МЕТОДОВ\n"
+            core = self.job_core(equation=test_equations[0])
+            self.run_job(
+                core,
+                "Выполняется сравнительный анализ...",
+                lambda: core.compute_benchmark(
+                    test_equations, a, b, x0, precision_levels
+                ),
+                lambda all_results: self.render_benchmark(
+                    all_results, a, b, precision_levels
+                ),
+                "Произошла ошибка при выполнении сравнительного анализа",
+                "Ошибка сравнительного анализа",
             )
-            self.equation_result_text.insert(tk.END, "=" * 60 + "\n\n")
-
-            self.status_var.set("Выполняется сравнительный анализ...")
-            self.root.update()
 
-            all_results = []
-
-            for eq_idx, equation in enumerate(test_equations):
-                self.equation_result_text.insert(
-                    tk.END, f"📊 УРАВНЕНИЕ {eq_idx+1}: {equation} = 0\n"
-                )
-                self.equation_result_text.insert(tk.END, "-" * 60 + "\n\n")
-
-                current_equation = self.equation_entry.get()
-
-                self.equation_entry.delete(0, tk.END)
-                self.equation_entry.insert(0, equation)
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка",
+                f"Произошла ошибка при выполнении сравнительного анализа: {str(e)}",
+            )
+            self.status_var.set("Ошибка сравнительного анализа")
 
-                try:
-                    fa = self.f_eq(a)
-                    fb = self.f_eq(b)
+    def render_benchmark(self, all_results, a, b, precision_levels):
+        """Write the benchmark tables and plots for finished results"""
+        report = ReportBuilder(self.equation_result_text, self.report_texts)
+        report.insert(tk.END, "🔢 СРАВНИТЕЛЬНЫЙ АНАЛИЗ МЕТОДОВ\n")
+        report.insert(tk.END, "=" * 60 + "\n\n")
 
-                    if fa * fb > 0:
-                        self.equation_result_text.insert(
-                            tk.END,
-                            f"⚠️ Функция имеет одинаковый знак на концах отрезка [{a}, {b}].\n"
-                            f"Методы половинного деления, хорд и гибридный могут не сработать.\n\n",
-                        )
-                except Exception as e:
-                    self.equation_result_text.insert(
-                        tk.END, f"⚠️ Ошибка при вычислении функции: {str(e)}\n\n"
-                    )
-                    continue
+        for eq_idx, equation_results in enumerate(all_results):
+            report.insert(
+                tk.END, f"📊 УРАВНЕНИЕ {eq_idx+1}: {equation_results['equation']} = 0\n"
+            )
+            report.insert(tk.END, "-" * 60 + "\n\n")
 
-                self.equation_result_text.insert(
-                    tk.END, "Зависимость числа итераций от точности:\n"
-                )
-                self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
-                self.equation_result_text.insert(
+            if "error" in equation_results:
+                report.insert(
                     tk.END,
-                    "Метод                                | ε = 1e-3  | ε = 1e-6  | ε = 1e-9  | ε = 1e-12 \n",
+                    f"⚠️ Ошибка при вычислении функции: {equation_results['error']}\n\n",
                 )
-                self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
-
-                equation_results = {"equation": equation, "methods": {}}
-
-                methods = [
-                    ("Метод половинного деления", self.bisection_method),
-                    ("Метод хорд", self.chord_method),
-                    ("Метод Ньютона", self.newton_method),
-                    ("Метод секущих", self.secant_method),
-                    ("Гибридный метод", self.hybrid_method),
-                ]
-
-                for method_name, method in methods:
-                    iterations_by_precision = []
-                    times_by_precision = []
-
-                    for eps in precision_levels:
-                        try:
-                            start_time = time.time()
-
-                            if method_name in ["Метод Ньютона", "Метод секущих"]:
-                                root, iterations, _ = method(a, b, eps, x0)
-                            else:
-                                root, iterations, _ = method(a, b, eps)
-
-                            execution_time = time.time() - start_time
+                continue
 
-                            iterations_by_precision.append(iterations)
-                            times_by_precision.append(execution_time)
-
-                        except Exception as e:
-                            iterations_by_precision.append("N/A")
-                            times_by_precision.append("N/A")
-
-                    self.equation_result_text.insert(
-                        tk.END,
-                        f"{method_name:38} | {iterations_by_precision[0] if iterations_by_precision[0] != 'N/A' else 'N/A':9} | "
-                        f"{iterations_by_precision[1] if iterations_by_precision[1] != 'N/A' else 'N/A':9} | "
-                        f"{iterations_by_precision[2] if iterations_by_precision[2] != 'N/A' else 'N/A':9} | "
-                        f"{iterations_by_precision[3] if iterations_by_precision[3] != 'N/A' else 'N/A':9}\n",
-                    )
+            if equation_results["same_sign"]:
+                report.insert(
+                    tk.END,
+                    f"⚠️ Функция имеет одинаковый знак на концах отрезка [{a}, {b}].\n"
+                    f"Методы половинного деления, хорд и гибридный могут не сработать.\n\n",
+                )
 
-                    equation_results["methods"][method_name] = {
-                        "iterations": iterations_by_precision,
-                        "times": times_by_precision,
-                    }
+            report.insert(tk.END, "Зависимость числа итераций от точности:\n")
+            report.insert(tk.END, "-" * 80 + "\n")
+            report.insert(
+                tk.END,
+                "Метод                                | ε = 1e-3  | ε = 1e-6  | ε = 1e-9  | ε = 1e-12 \n",
+            )
+            report.insert(tk.END, "-" * 80 + "\n")
 
-                self.equation_result_text.insert(
-                    tk.END, "\nЗависимость времени выполнения от точности (сек):\n"
-                )
-                self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
-                self.equation_result_text.insert(
+            for method_name, method_results in equation_results["methods"].items():
+                iterations_by_precision = method_results["iterations"]
+                report.insert(
                     tk.END,
-                    "Метод                                | ε = 1e-3  | ε = 1e-6  | ε = 1e-9  | ε = 1e-12 \n",
+                    f"{method_name:38} | {iterations_by_precision[0] if iterations_by_precision[0] != 'N/A' else 'N/A':9} | "
+                    f"{iterations_by_precision[1] if iterations_by_precision[1] != 'N/A' else 'N/A':9} | "
+                    f"{iterations_by_precision[2] if iterations_by_precision[2] != 'N/A' else 'N/A':9} | "
+                    f"{iterations_by_precision[3] if iterations_by_precision[3] != 'N/A' else 'N/A':9}\n",
                 )
-                self.equation_result_text.insert(tk.END, "-" * 80 + "\n")
 
-                for method_name, method in methods:
-                    times = equation_results["methods"][method_name]["times"]
-
-                    self.equation_result_text.insert(
-                        tk.END,
-                        f"{method_name:38} | {times[0] if times[0] != 'N/A' else 'N/A':9.6f} | "
-                        f"{times[1] if times[1] != 'N/A' else 'N/A':9.6f} | "
-                        f"{times[2] if times[2] != 'N/A' else 'N/A':9.6f} | "
-                        f"{times[3] if times[3] != 'N/A' else 'N/A':9.6f}\n",
-                    )
+            report.insert(
+                tk.END, "\nЗависимость времени выполнения от точности (сек):\n"
+            )
+            report.insert(tk.END, "-" * 80 + "\n")
+            report.insert(
+                tk.END,
+                "Метод                                | ε = 1e-3  | ε = 1e-6  | ε = 1e-9  | ε = 1e-12 \n",
+            )
+            report.insert(tk.END, "-" * 80 + "\n")
 
-                self.equation_result_text.insert(tk.END, "=" * 60 + "\n\n")
+            for method_name, method_results in equation_results["methods"].items():
+                times = method_results["times"]
 
-                all_results.append(equation_results)
+                report.insert(
+                    tk.END,
+                    f"{method_name:38} | {times[0] if times[0] != 'N/A' else 'N/A':9.6f} | "
+                    f"{times[1] if times[1] != 'N/A' else 'N/A':9.6f} | "
+                    f"{times[2] if times[2] != 'N/A' else 'N/A':9.6f} | "
+                    f"{times[3] if times[3] != 'N/A' else 'N/A':9.6f}\n",
+                )
 
-                self.equation_entry.delete(0, tk.END)
-                self.equation_entry.insert(0, current_equation)
+            report.insert(tk.END, "=" * 60 + "\n\n")
 
-            self.plot_benchmark_results(all_results, precision_levels)
+        report.flush()
 
-            self.status_var.set("Сравнительный анализ завершен")
+        self.plot_benchmark_results(
+            [result for result in all_results if "error" not in result],
+            precision_levels,
+        )
 
-        except Exception as e:
-            messagebox.showerror(
-                "Ошибка",
-                f"Произошла ошибка при выполнении сравнительного анализа: {str(e)}",
-            )
-            self.status_var.set("Ошибка сравнительного анализа")
+        self.status_var.set("Сравнительный анализ завершен")
 
     def plot_benchmark_results(self, all_results, precision_levels):
         """Plot benchmark results"""
@@ -2809,6 +3300,7 @@ class NumericalMethodsApp:
             with PdfPages(file_path) as pdf:
                 for fig_attr in [
                     "fig_integration",
+                    "fig_multiple",
                     "fig_interpolation",
                     "fig_differentiation",
                     "fig_equation",
@@ -2822,13 +3314,15 @@ class NumericalMethodsApp:
                 results_text = ""
                 for text_attr in [
                     "result_text",
+                    "multiple_result_text",
                     "interpolation_result_text",
                     "differentiation_result_text",
                     "equation_result_text",
                 ]:
                     if hasattr(self, text_attr):
-                        results_text += "\n\n" + getattr(self, text_attr).get(
-                            1.0, tk.END
+                        widget = getattr(self, text_attr)
+                        results_text += "\n\n" + self.report_texts.get(
+                            widget, widget.get(1.0, tk.END)
                         )
 
                 chars_per_page = 3000
@@ -0,0 +1,328 @@
+"""Local JSON-RPC 2.0 service over HTTP for the numerical_core solvers
+
+python numerical_service.py --port 8765 --workers 4 --timeout 30
+
+curl -s localhost:8765 -d '{"jsonrpc": "2.0", "id": 1, "method": "integrate",
+    "params": {"expression": "sin(x)", "a": 0, "b": 3.14159, "method": "simpson"}}'
+"""
+
+import argparse
+import inspect
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numerical_core
+
+METHODS = {
+    "integrate": numerical_core.integrate,
+    "integrate_multiple": numerical_core.integrate_multiple,
+    "integrate_table": numerical_core.integrate_table,
+    "integrate_intervals": numerical_core.integrate_intervals,
+    "solve": numerical_core.solve,
+    "interpolate": numerical_core.interpolate,
+    "approximate": numerical_core.approximate,
+    "differentiate": numerical_core.differentiate,
+    "bisection_method": partial(numerical_core.solve, method="bisection"),
+    "chord_method": partial(numerical_core.solve, method="chord"),
+    "newton_method": partial(numerical_core.solve, method="newton"),
+    "secant_method": partial(numerical_core.solve, method="secant"),
+    "hybrid_method": partial(numerical_core.solve, method="hybrid"),
+    "lagrange_polynomial": partial(numerical_core.interpolate, method="lagrange"),
+    "newton_polynomial": partial(numerical_core.interpolate, method="newton"),
+    "cubic_spline": partial(numerical_core.interpolate, method="spline"),
+}
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+# Server-defined codes
+COMPUTATION_ERROR = -32000
+TIMEOUT_ERROR = -32001
+BUSY_ERROR = -32002
+
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+    def __reduce__(self):
+        # Raised in worker processes, so it must survive pickling
+        return RPCError, (self.code, str(self))
+
+
+def bind_params(method, params):
+    """Check params against the method's signature; only this maps to INVALID_PARAMS"""
+    signature = inspect.signature(METHODS[method])
+    try:
+        if isinstance(params, list):
+            signature.bind(*params)
+        else:
+            signature.bind(**params)
+    except TypeError as e:
+        raise RPCError(INVALID_PARAMS, f"Неверные параметры: {e}")
+
+
+def call_method(method, params):
+    """Runs in a worker process"""
+    try:
+        if isinstance(params, list):
+            return METHODS[method](*params)
+        return METHODS[method](**params)
+    except Exception as e:
+        raise RPCError(COMPUTATION_ERROR, str(e))
+
+
+def worker_loop(connection):
+    """Worker process: answers (method, params) messages until the service closes"""
+    if hasattr(os, "setpgrp"):
+        # Its own process group, so that a kill on timeout also reaches the
+        # processes a request starts, e.g. the pool of integrate_multiple
+        os.setpgrp()
+    while True:
+        try:
+            method, params = connection.recv()
+        except EOFError:
+            return
+        try:
+            connection.send((True, call_method(method, params)))
+        except RPCError as e:
+            connection.send((False, e))
+
+
+class Worker:
+    """A worker process and the service end of its pipe"""
+
+    def __init__(self, context):
+        self.connection, child = context.Pipe()
+        # Not a daemon: integrate_multiple starts a process pool of its own.
+        # If the service dies, the closed pipe ends the loop
+        self.process = context.Process(target=worker_loop, args=(child,))
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        if self.process.is_alive():
+            if hasattr(os, "killpg"):
+                try:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ComputeService:
+    """Dispatches JSON-RPC requests to a fixed set of worker processes
+
+    A request that runs past its deadline has its worker killed and replaced,
+    so a timeout frees the worker and the pending slot at once."""
+
+    def __init__(self, workers, timeout, max_pending):
+        # spawn: workers are replaced from request threads, and forking a
+        # multithreaded process may deadlock the child
+        self.context = multiprocessing.get_context("spawn")
+        self.workers = set()
+        self.idle = queue.Queue()
+        self.closed = False
+        for _ in range(workers):
+            self.start_worker()
+        # One thread per worker waits for its answer; further requests queue here
+        self.threads = ThreadPoolExecutor(max_workers=workers)
+        self.timeout = timeout
+        # Requests queued or running at once; above this the service answers busy
+        self.slots = threading.BoundedSemaphore(max_pending)
+
+    def start_worker(self):
+        worker = Worker(self.context)
+        self.workers.add(worker)
+        self.idle.put(worker)
+
+    def replace_worker(self, worker):
+        worker.kill()
+        self.workers.discard(worker)
+        if not self.closed:
+            self.start_worker()
+
+    def run(self, method, params, deadline):
+        """Runs in a service thread: one request on an idle worker until the deadline"""
+        timeout_error = RPCError(TIMEOUT_ERROR, f"Превышено время {self.timeout} с")
+        try:
+            worker = self.idle.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise timeout_error
+        if deadline - time.monotonic() <= 0:
+            # Nothing was sent, so the worker is still healthy
+            self.idle.put(worker)
+            raise timeout_error
+
+        try:
+            worker.connection.send((method, params))
+            answered = worker.connection.poll(max(0.0, deadline - time.monotonic()))
+            if answered:
+                ok, result = worker.connection.recv()
+        except (EOFError, OSError):
+            self.replace_worker(worker)
+            raise RPCError(COMPUTATION_ERROR, "Рабочий процесс завершился аварийно")
+
+        if not answered:
+            # The computation cannot be interrupted inside the worker, so the
+            # worker goes and a fresh one takes its place
+            self.replace_worker(worker)
+            raise timeout_error
+        self.idle.put(worker)
+        if not ok:
+            raise result
+        return result
+
+    def close(self):
+        self.closed = True
+        self.threads.shutdown(wait=False, cancel_futures=True)
+        for worker in list(self.workers):
+            worker.kill()
+
+    def submit(self, request, deadline):
+        """Validate one request and start it; returns (id, future or error)"""
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0":
+            return None, RPCError(INVALID_REQUEST, "Некорректный запрос JSON-RPC")
+
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params", {})
+        if method not in METHODS:
+            return request_id, RPCError(METHOD_NOT_FOUND, f"Нет метода: {method}")
+        if not isinstance(params, (list, dict)):
+            return request_id, RPCError(INVALID_PARAMS, "params: массив или объект")
+        try:
+            bind_params(method, params)
+        except RPCError as e:
+            return request_id, e
+        if not self.slots.acquire(blocking=False):
+            return request_id, RPCError(BUSY_ERROR, "Сервис перегружен, повторите")
+
+        future = self.threads.submit(self.run, method, params, deadline)
+        future.add_done_callback(lambda _: self.slots.release())
+        return request_id, future
+
+    def handle(self, payload):
+        """Response for a single request or a batch; None if nothing to answer"""
+        batch = isinstance(payload, list)
+        requests = payload if batch else [payload]
+        if batch and not requests:
+            return error_response(None, RPCError(INVALID_REQUEST, "Пустой пакет"))
+
+        # The whole batch is submitted first so its requests run side by side,
+        # and every request of it shares one deadline
+        deadline = time.monotonic() + self.timeout
+        started = [(request, *self.submit(request, deadline)) for request in requests]
+
+        responses = []
+        for request, request_id, job in started:
+            if isinstance(job, RPCError):
+                response = error_response(request_id, job)
+            else:
+                try:
+                    # The service thread enforces the deadline and answers by then
+                    result = job.result()
+                    response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+                except RPCError as e:
+                    response = error_response(request_id, e)
+                except Exception as e:
+                    response = error_response(
+                        request_id, RPCError(COMPUTATION_ERROR, str(e))
+                    )
+            # Notifications (requests without an id) get no response
+            if not isinstance(request, dict) or "id" in request:
+                responses.append(response)
+
+        if not responses:
+            return None
+        return responses if batch else responses[0]
+
+
+def error_response(request_id, error):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": error.code, "message": str(error)},
+    }
+
+
+class RPCRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        self.send_json({"methods": sorted(METHODS)})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_json(
+                error_response(None, RPCError(PARSE_ERROR, "Ошибка разбора JSON"))
+            )
+            return
+
+        response = self.service.handle(payload)
+        if response is None:
+            self.send_response(204)
+            self.end_headers()
+        else:
+            self.send_json(response)
+
+    def send_json(self, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Локальный JSON-RPC сервис численных методов"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="рабочих процессов"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="предел времени запроса, с"
+    )
+    parser.add_argument(
+        "--max-pending", type=int, default=256, help="запросов в обработке"
+    )
+    args = parser.parse_args(argv)
+
+    RPCRequestHandler.service = ComputeService(
+        args.workers, args.timeout, args.max_pending
+    )
+    server = ThreadingHTTPServer((args.host, args.port), RPCRequestHandler)
+    print(f"JSON-RPC сервис: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        RPCRequestHandler.service.close()
+
+
+if __name__ == "__main__":
+    main()